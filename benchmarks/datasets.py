@@ -0,0 +1,52 @@
+import numpy as np
+from typing import Callable, Dict
+
+UNIBRASIL_LINHA = "82821020,-49.2160678044742,-25.4233146347775"
+LIMITES_CURITIBA = ((-25.60, -25.35), (-49.39, -49.19))
+CENTRO_CURITIBA = (-25.4284, -49.2733)
+
+def _recortar(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    (lat_min, lat_max), (lon_min, lon_max) = LIMITES_CURITIBA
+    return np.column_stack((np.clip(lats, lat_min, lat_max), np.clip(lons, lon_min, lon_max)))
+
+def gerar_uniforme(num_pontos: int, rng: np.random.Generator) -> np.ndarray:
+    (lat_min, lat_max), (lon_min, lon_max) = LIMITES_CURITIBA
+    return np.column_stack((rng.uniform(lat_min, lat_max, num_pontos),
+                            rng.uniform(lon_min, lon_max, num_pontos)))
+
+def gerar_agrupado(num_pontos: int, rng: np.random.Generator, num_grupos: int = 12) -> np.ndarray:
+    centros = gerar_uniforme(num_grupos, rng)
+    grupos = rng.integers(0, num_grupos, num_pontos)
+    desvios = rng.uniform(0.004, 0.015, num_grupos)
+    deslocamentos = rng.normal(size=(num_pontos, 2)) * desvios[grupos, None]
+    pontos = centros[grupos] + deslocamentos
+    return _recortar(pontos[:, 0], pontos[:, 1])
+
+def gerar_curitiba(num_pontos: int, rng: np.random.Generator) -> np.ndarray:
+    raios = rng.exponential(0.045, num_pontos)
+    angulos = rng.uniform(0, 2 * np.pi, num_pontos)
+    lats = CENTRO_CURITIBA[0] + raios * 1.3 * np.cos(angulos)
+    lons = CENTRO_CURITIBA[1] + raios * np.sin(angulos)
+    return _recortar(lats, lons)
+
+DISTRIBUICOES: Dict[str, Callable[[int, np.random.Generator], np.ndarray]] = {
+    'uniform': gerar_uniforme,
+    'clustered': gerar_agrupado,
+    'curitiba': gerar_curitiba,
+}
+
+def gerar_coordenadas(distribuicao: str, num_pontos: int, semente: int = 0) -> np.ndarray:
+    if distribuicao not in DISTRIBUICOES:
+        raise ValueError(f"Distribuição desconhecida: {distribuicao}")
+    return DISTRIBUICOES[distribuicao](num_pontos, np.random.default_rng(semente))
+
+def escrever_csv(caminho: str, coords: np.ndarray):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("cep,longitude,latitude\n")
+        arquivo.write(UNIBRASIL_LINHA + "\n")
+        for indice, (lat, lon) in enumerate(coords.tolist()):
+            arquivo.write(f"{10000000 + indice},{lon!r},{lat!r}\n")
+
+def gerar_conjunto(caminho: str, distribuicao: str, num_pontos: int, semente: int = 0) -> str:
+    escrever_csv(caminho, gerar_coordenadas(distribuicao, num_pontos, semente))
+    return caminho
@@ -0,0 +1,225 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+from src.utils.data_manager import GerenciadorDados
+from src.utils.calculations import haversine_distance, remove_crossings_2opt, two_opt_swap
+from src.core.validator import ValidadorSolucao
+from src.core.cost_calculator import CalculadorCusto
+from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.algorithms.decomposition import SolucionadorDecomposicao
+from .datasets import DISTRIBUICOES, gerar_conjunto
+
+TAMANHOS_PADRAO = (100, 1000, 10000, 50000)
+BASELINE_PADRAO = os.path.join(os.path.dirname(__file__), "baseline.json")
+TOLERANCIA_PADRAO = 0.25
+
+class Contexto:
+    def __init__(self, csv_file: str):
+        self.gerenciador_dados = GerenciadorDados(csv_file, usar_cache=False)
+        self.calculador_custo = CalculadorCusto(self.gerenciador_dados)
+        self.unibrasil_id = self.gerenciador_dados.obter_id_unibrasil()
+        self.ids_ceps = self.gerenciador_dados.obter_ids_excluindo_unibrasil()
+        self._algoritmo: Optional[AlgoritmoGenetico] = None
+        self._rota_base: Optional[List[int]] = None
+    
+    @property
+    def algoritmo(self) -> AlgoritmoGenetico:
+        if self._algoritmo is None:
+            self._algoritmo = AlgoritmoGenetico(self.gerenciador_dados, ValidadorSolucao(self.gerenciador_dados),
+                                                self.calculador_custo, workers=1, ilhas=1)
+        return self._algoritmo
+    
+    @property
+    def rota_base(self) -> List[int]:
+        if self._rota_base is None:
+            self._rota_base = SolucionadorDecomposicao(self.gerenciador_dados, workers=1).construir_rota()
+        return self._rota_base
+
+class Caso(NamedTuple):
+    nome: str
+    tamanho_max: int
+    repeticoes: int
+    preparar: Callable[[Contexto], Callable[[], object]]
+
+def _preparar_haversine(contexto: Contexto) -> Callable[[], object]:
+    coords = contexto.gerenciador_dados.coords_array
+    indices = np.random.default_rng(0).integers(0, len(coords), size=(1000, 2))
+    pares = [(tuple(coords[a].tolist()), tuple(coords[b].tolist())) for a, b in indices]
+    return lambda: [haversine_distance(origem, destino) for origem, destino in pares]
+
+def _preparar_custo_rota(contexto: Contexto) -> Callable[[], object]:
+    rota_ids = contexto.rota_base
+    velocidades = [60] * (len(rota_ids) - 1)
+    tempos_pouso = [False] * (len(rota_ids) - 1)
+    return lambda: contexto.calculador_custo.calcular_custo_rota_ids(rota_ids, velocidades, tempos_pouso)
+
+def _preparar_cruzamentos(contexto: Contexto) -> Callable[[], object]:
+    rng = random.Random(0)
+    rota_ids = list(contexto.rota_base)
+    for _ in range(20):
+        i, j = sorted(rng.sample(range(1, len(rota_ids) - 1), 2))
+        rota_ids = two_opt_swap(rota_ids, i, j)
+    obter_coords = contexto.gerenciador_dados.obter_coords_por_id
+    return lambda: remove_crossings_2opt(rota_ids, obter_coords, force_complete=True)
+
+def _preparar_crossover(contexto: Contexto) -> Callable[[], object]:
+    random.seed(0)
+    pai1 = contexto.algoritmo.criar_individuo()
+    pai2 = contexto.algoritmo.criar_individuo()
+    return lambda: contexto.algoritmo.crossover(pai1, pai2)
+
+def _preparar_corrigir_rota(contexto: Contexto) -> Callable[[], object]:
+    random.seed(0)
+    rota1 = contexto.algoritmo.criar_individuo()[0]
+    rota2 = contexto.algoritmo.criar_individuo()[0]
+    corte = len(rota1) // 2
+    filho = rota1[:corte] + rota2[corte:]
+    return lambda: contexto.algoritmo._corrigir_rota(filho)
+
+def _preparar_mutar(contexto: Contexto) -> Callable[[], object]:
+    random.seed(0)
+    individuo = contexto.algoritmo.criar_individuo()
+    return lambda: contexto.algoritmo.mutar(individuo)
+
+def _preparar_vizinho_mais_proximo(contexto: Contexto) -> Callable[[], object]:
+    return lambda: contexto.algoritmo._construir_vizinho_mais_proximo(contexto.unibrasil_id, contexto.ids_ceps)
+
+def _preparar_executar(contexto: Contexto) -> Callable[[], object]:
+    algoritmo = contexto.algoritmo
+    algoritmo.population_size = 20
+    algoritmo.generations = 5
+    algoritmo.elite_size = 2
+    
+    def executar():
+        random.seed(0)
+        return algoritmo.executar()
+    return executar
+
+def _preparar_decomposicao(contexto: Contexto) -> Callable[[], object]:
+    solucionador = SolucionadorDecomposicao(contexto.gerenciador_dados, workers=1)
+    return solucionador.executar
+
+CASOS: Dict[str, Caso] = {caso.nome: caso for caso in (
+    Caso('haversine_distance', 50000, 5, _preparar_haversine),
+    Caso('calcular_custo_rota_ids', 2000, 5, _preparar_custo_rota),
+    Caso('remove_crossings_2opt', 50000, 3, _preparar_cruzamentos),
+    Caso('crossover', 2000, 5, _preparar_crossover),
+    Caso('corrigir_rota', 2000, 5, _preparar_corrigir_rota),
+    Caso('mutar', 2000, 5, _preparar_mutar),
+    Caso('vizinho_mais_proximo', 50000, 3, _preparar_vizinho_mais_proximo),
+    Caso('executar', 500, 1, _preparar_executar),
+    Caso('executar_decomposicao', 50000, 1, _preparar_decomposicao),
+)}
+
+def medir(funcao: Callable[[], object], repeticoes: int) -> Dict:
+    tempos = []
+    for _ in range(max(1, repeticoes)):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return {'median_s': statistics.median(tempos), 'min_s': min(tempos), 'runs': len(tempos)}
+
+def executar_suite(tamanhos: Sequence[int], distribuicoes: Sequence[str], casos: Sequence[str],
+                   semente: int = 0, log=print) -> List[Dict]:
+    resultados = []
+    with tempfile.TemporaryDirectory() as diretorio:
+        for distribuicao in distribuicoes:
+            for tamanho in tamanhos:
+                csv_file = gerar_conjunto(os.path.join(diretorio, f"{distribuicao}_{tamanho}.csv"),
+                                          distribuicao, tamanho, semente)
+                contexto = Contexto(csv_file)
+                for nome in casos:
+                    caso = CASOS[nome]
+                    if tamanho > caso.tamanho_max:
+                        continue
+                    medicao = medir(caso.preparar(contexto), caso.repeticoes)
+                    resultados.append({'case': nome, 'distribution': distribuicao, 'size': tamanho, **medicao})
+                    log(f"{nome:<24} {distribuicao:<10} {tamanho:>6}  {medicao['median_s'] * 1000:10.2f} ms")
+    return resultados
+
+def _chave(resultado: Dict) -> tuple:
+    return resultado['case'], resultado['distribution'], resultado['size']
+
+def comparar_com_baseline(resultados: List[Dict], baseline: Dict, tolerancia: float) -> List[Dict]:
+    referencias = {_chave(resultado): resultado for resultado in baseline.get('results', [])}
+    regressoes = []
+    for resultado in resultados:
+        referencia = referencias.get(_chave(resultado))
+        if referencia is None:
+            continue
+        limite = referencia['median_s'] * (1 + tolerancia)
+        if resultado['median_s'] > limite:
+            regressoes.append({'case': resultado['case'], 'distribution': resultado['distribution'],
+                               'size': resultado['size'], 'baseline_s': referencia['median_s'],
+                               'median_s': resultado['median_s'],
+                               'ratio': resultado['median_s'] / referencia['median_s']})
+    return regressoes
+
+def metadados() -> Dict:
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+    }
+
+def salvar_json(caminho: str, conteudo: Dict):
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(conteudo, arquivo, indent=2)
+        arquivo.write("\n")
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos do gerador de rotas")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(TAMANHOS_PADRAO))
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUICOES), default=sorted(DISTRIBUICOES))
+    parser.add_argument("--cases", nargs="+", choices=list(CASOS), default=list(CASOS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=BASELINE_PADRAO)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCIA_PADRAO)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+    
+    resultados = executar_suite(args.sizes, args.distributions, args.cases, args.seed)
+    relatorio = {'metadata': metadados(), 'results': resultados}
+    
+    saida = args.output or f"output/benchmark_{datetime.now().strftime('%d%m%H%M%S')}.json"
+    salvar_json(saida, relatorio)
+    print(f"Resultados salvos em {saida}")
+    
+    if args.update_baseline:
+        salvar_json(args.baseline, relatorio)
+        print(f"Baseline atualizada em {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"Baseline {args.baseline} não encontrada; nenhuma comparação realizada "
+              f"(gere-a nesta máquina com --update-baseline)")
+        return 0
+    
+    with open(args.baseline, encoding="utf-8") as arquivo:
+        regressoes = comparar_com_baseline(resultados, json.load(arquivo), args.tolerance)
+    for regressao in regressoes:
+        print(f"REGRESSÃO {regressao['case']} {regressao['distribution']} {regressao['size']}: "
+              f"{regressao['baseline_s'] * 1000:.2f} ms -> {regressao['median_s'] * 1000:.2f} ms "
+              f"({regressao['ratio']:.2f}x)")
+    if regressoes:
+        return 1
+    print(f"Nenhuma regressão acima de {args.tolerance:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
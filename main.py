@@ -14,6 +14,9 @@ def main():
         rota, velocidades, tempos_pouso, fitness = gerenciador.executar()
         gerenciador.gerar_relatorios(rota, velocidades, tempos_pouso, fitness)
         print(f"Rota gerada! Fitness: {fitness:.0f}")
+        print(f"Motivo da parada: {gerenciador.algoritmo_genetico.motivo_parada}")
+        if gerenciador.algoritmo_genetico.gap_otimalidade is not None:
+            print(f"Gap de otimalidade: {gerenciador.algoritmo_genetico.gap_otimalidade:.2%}")
         return 0
     except Exception as e:
         print(f"ERRO: {e}")
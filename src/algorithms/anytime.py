@@ -0,0 +1,27 @@
+import asyncio
+from typing import AsyncIterator, Callable, Iterator
+
+async def iterar_em_thread(iterador: Iterator, cancelar: Callable[[], None]) -> AsyncIterator:
+    loop = asyncio.get_running_loop()
+    fila: asyncio.Queue = asyncio.Queue()
+    fim = object()
+    
+    def produzir():
+        try:
+            for item in iterador:
+                loop.call_soon_threadsafe(fila.put_nowait, item)
+        finally:
+            loop.call_soon_threadsafe(fila.put_nowait, fim)
+    
+    tarefa = loop.run_in_executor(None, produzir)
+    try:
+        while True:
+            item = await fila.get()
+            if item is fim:
+                break
+            yield item
+        await tarefa
+    finally:
+        if not tarefa.done():
+            cancelar()
+            await asyncio.wait({tarefa})
@@ -0,0 +1,29 @@
+import os
+import pickle
+import tempfile
+from typing import Any, Dict
+
+VERSAO_CHECKPOINT = 1
+
+def salvar_checkpoint(caminho: str, estado: Dict[str, Any]):
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    os.makedirs(diretorio, exist_ok=True)
+    descritor, caminho_temporario = tempfile.mkstemp(dir=diretorio, prefix='.checkpoint_', suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            pickle.dump({'versao': VERSAO_CHECKPOINT, **estado}, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(caminho_temporario, caminho)
+    except BaseException:
+        if os.path.exists(caminho_temporario):
+            os.remove(caminho_temporario)
+        raise
+
+def carregar_checkpoint(caminho: str) -> Dict[str, Any]:
+    """Carrega um checkpoint pickle; use apenas arquivos confiáveis, pois pickle.load pode executar código arbitrário."""
+    with open(caminho, 'rb') as arquivo:
+        estado = pickle.load(arquivo)
+    if not isinstance(estado, dict) or estado.get('versao') != VERSAO_CHECKPOINT:
+        raise ValueError(f"Checkpoint incompatível: {caminho}")
+    return estado
@@ -0,0 +1,211 @@
+import random
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+OPERADORES_CROSSOVER: Dict[str, Callable] = {}
+
+def registrar_crossover(nome: str):
+    def registrar(operador: Callable) -> Callable:
+        OPERADORES_CROSSOVER[nome] = operador
+        return operador
+    return registrar
+
+def obter_operador_crossover(nome: str) -> Callable:
+    if nome not in OPERADORES_CROSSOVER:
+        raise ValueError(f"Operador de crossover desconhecido: {nome}")
+    return OPERADORES_CROSSOVER[nome]
+
+def _pontos_corte(tamanho: int) -> Tuple[int, int]:
+    inicio, fim = sorted(random.sample(range(tamanho + 1), 2))
+    return inicio, fim
+
+@registrar_crossover('ox')
+def crossover_ox(algoritmo, rota1: List[int], rota2: List[int]) -> List[int]:
+    meio1, meio2 = rota1[1:-1], rota2[1:-1]
+    tamanho = len(meio1)
+    if tamanho < 2:
+        return list(rota1)
+    
+    inicio, fim = _pontos_corte(tamanho)
+    segmento = meio1[inicio:fim]
+    no_segmento = set(segmento)
+    restantes = [id_cep for id_cep in meio2[fim:] + meio2[:fim] if id_cep not in no_segmento]
+    
+    posicoes_livres = tamanho - fim
+    filho = restantes[posicoes_livres:] + segmento + restantes[:posicoes_livres]
+    return [rota1[0]] + filho + [rota1[-1]]
+
+@registrar_crossover('pmx')
+def crossover_pmx(algoritmo, rota1: List[int], rota2: List[int]) -> List[int]:
+    meio1, meio2 = rota1[1:-1], rota2[1:-1]
+    tamanho = len(meio1)
+    if tamanho < 2:
+        return list(rota1)
+    
+    inicio, fim = _pontos_corte(tamanho)
+    filho = list(meio2)
+    filho[inicio:fim] = meio1[inicio:fim]
+    mapeamento = {meio1[i]: meio2[i] for i in range(inicio, fim)}
+    
+    for i in list(range(inicio)) + list(range(fim, tamanho)):
+        id_cep = meio2[i]
+        while id_cep in mapeamento:
+            id_cep = mapeamento[id_cep]
+        filho[i] = id_cep
+    return [rota1[0]] + filho + [rota1[-1]]
+
+@registrar_crossover('eax')
+def crossover_eax(algoritmo, rota1: List[int], rota2: List[int]) -> List[int]:
+    tour_a, tour_b = rota1[:-1], rota2[:-1]
+    if len(tour_a) < 5:
+        return list(rota1)
+    
+    adjacentes_a = _adjacencias(tour_a)
+    adjacentes_b = _adjacencias(tour_b)
+    ciclos_ab = _ciclos_ab(tour_a, adjacentes_a, adjacentes_b)
+    if not ciclos_ab:
+        return list(rota1)
+    
+    ciclo = random.choice(ciclos_ab)
+    for indice, (u, v) in enumerate(zip(ciclo, ciclo[1:] + ciclo[:1])):
+        if indice % 2 == 0:
+            adjacentes_a[u].remove(v)
+            adjacentes_a[v].remove(u)
+        else:
+            adjacentes_a[u].append(v)
+            adjacentes_a[v].append(u)
+    
+    subtours = _extrair_subtours(tour_a, adjacentes_a)
+    tour = _unir_subtours(algoritmo, subtours)
+    
+    deposito = rota1[0]
+    inicio = tour.index(deposito)
+    tour = tour[inicio:] + tour[:inicio]
+    invertido = [deposito] + tour[1:][::-1]
+    arestas_a = set(zip(tour_a, tour_a[1:] + tour_a[:1]))
+    if sum(aresta in arestas_a for aresta in zip(invertido, invertido[1:])) > \
+            sum(aresta in arestas_a for aresta in zip(tour, tour[1:])):
+        tour = invertido
+    return tour + [deposito]
+
+def _adjacencias(tour: List[int]) -> Dict[int, List[int]]:
+    adjacentes = {id_cep: [] for id_cep in tour}
+    for u, v in zip(tour, tour[1:] + tour[:1]):
+        adjacentes[u].append(v)
+        adjacentes[v].append(u)
+    return adjacentes
+
+def _ciclos_ab(tour_a: List[int], adjacentes_a: Dict[int, List[int]], 
+               adjacentes_b: Dict[int, List[int]]) -> List[List[int]]:
+    restantes = ({u: [v for v in adjacentes_a[u] if v not in adjacentes_b[u]] for u in tour_a},
+                 {u: [v for v in adjacentes_b[u] if v not in adjacentes_a[u]] for u in tour_a})
+    ciclos = []
+    
+    for inicio in tour_a:
+        while restantes[0][inicio]:
+            caminho = [inicio]
+            posicoes = {(inicio, 0): 0}
+            tipo = 0
+            atual = inicio
+            while True:
+                opcoes = restantes[tipo][atual]
+                if not opcoes:
+                    break
+                proximo = opcoes.pop(random.randrange(len(opcoes)))
+                restantes[tipo][proximo].remove(atual)
+                tipo = 1 - tipo
+                atual = proximo
+                
+                chave = (atual, tipo)
+                if chave in posicoes:
+                    indice = posicoes[chave]
+                    ciclo = caminho[indice:]
+                    if tipo == 1:
+                        ciclo = ciclo[1:] + ciclo[:1]
+                    ciclos.append(ciclo)
+                    for no_removido in caminho[indice + 1:]:
+                        for tipo_removido in (0, 1):
+                            if posicoes.get((no_removido, tipo_removido), -1) > indice:
+                                del posicoes[(no_removido, tipo_removido)]
+                    caminho = caminho[:indice + 1]
+                    if indice == 0 and tipo == 0:
+                        break
+                else:
+                    posicoes[chave] = len(caminho)
+                    caminho.append(atual)
+    return ciclos
+
+def _extrair_subtours(tour_a: List[int], adjacentes: Dict[int, List[int]]) -> List[List[int]]:
+    visitados = set()
+    subtours = []
+    for inicio in tour_a:
+        if inicio in visitados:
+            continue
+        subtour = [inicio]
+        visitados.add(inicio)
+        anterior, atual = inicio, adjacentes[inicio][0]
+        while atual != inicio:
+            subtour.append(atual)
+            visitados.add(atual)
+            u, v = adjacentes[atual]
+            anterior, atual = atual, (v if u == anterior else u)
+        subtours.append(subtour)
+    return subtours
+
+def _unir_subtours(algoritmo, subtours: List[List[int]]) -> List[int]:
+    matriz = algoritmo.gerenciador_dados.matriz_distancias
+    vizinhos = algoritmo.busca_local.vizinhos
+    
+    while len(subtours) > 1:
+        subtours.sort(key=len)
+        menor = subtours[0]
+        subtour_de = {id_cep: indice for indice, subtour in enumerate(subtours) for id_cep in subtour}
+        posicao = {id_cep: i for subtour in subtours for i, id_cep in enumerate(subtour)}
+        
+        melhor = None
+        for i, u in enumerate(menor):
+            su = menor[(i + 1) % len(menor)]
+            candidatos = [w for w in vizinhos[u] if subtour_de.get(w, 0) != 0]
+            if not candidatos:
+                outros = np.array([id_cep for subtour in subtours[1:] for id_cep in subtour])
+                candidatos = [int(outros[np.argmin(matriz[u, outros])])]
+            for w in candidatos:
+                outro = subtours[subtour_de[w]]
+                x = outro[(posicao[w] + 1) % len(outro)]
+                base = matriz[u, su] + matriz[w, x]
+                for custo, invertido in ((matriz[u, w] + matriz[su, x] - base, True),
+                                         (matriz[u, x] + matriz[su, w] - base, False)):
+                    if melhor is None or custo < melhor[0]:
+                        melhor = (custo, i, subtour_de[w], posicao[w], invertido)
+        
+        _, i, indice_outro, posicao_w, invertido = melhor
+        outro = subtours[indice_outro]
+        menor_rotacionado = menor[i + 1:] + menor[:i + 1]
+        outro_rotacionado = outro[posicao_w + 1:] + outro[:posicao_w + 1]
+        if invertido:
+            outro_rotacionado = outro_rotacionado[::-1]
+        unido = menor_rotacionado + outro_rotacionado
+        subtours = [subtour for indice, subtour in enumerate(subtours) if indice not in (0, indice_outro)]
+        subtours.append(unido)
+    
+    return subtours[0]
+
+def herdar_genes(rota_filho: List[int], pai_principal: Tuple, pai_secundario: Tuple) -> Tuple[List[int], List[bool]]:
+    filho = np.asarray(rota_filho)
+    origem, destino = filho[:-1], filho[1:]
+    tamanho = int(max(filho.max(), max(pai_principal[0]), max(pai_secundario[0]))) + 1
+    
+    arestas, velocidades, pousos = [], [], []
+    for rota_pai, velocidades_pai, pousos_pai in (pai_principal, pai_secundario):
+        rota_pai = np.asarray(rota_pai)
+        sucessor = np.full(tamanho, -1)
+        posicao = np.zeros(tamanho, dtype=int)
+        sucessor[rota_pai[:-1]] = rota_pai[1:]
+        posicao[rota_pai[:-1]] = np.arange(len(rota_pai) - 1)
+        arestas.append(sucessor[origem] == destino)
+        velocidades.append(np.asarray(velocidades_pai)[posicao[origem]])
+        pousos.append(np.asarray(pousos_pai, dtype=bool)[posicao[origem]])
+    
+    usar_secundario = arestas[1] & ~arestas[0]
+    return (np.where(usar_secundario, velocidades[1], velocidades[0]).tolist(),
+            np.where(usar_secundario, pousos[1], pousos[0]).tolist())
@@ -0,0 +1,131 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from ..utils.data_manager import GerenciadorDados
+from ..utils.calculations import (haversine_distance_matrix, flight_angle_matrix, nearest_neighbors_matrix,
+                                  calculate_effective_speed_vector_array)
+from ..core.cost_calculator import CalculadorCusto
+from ..core.speed_optimizer import OtimizadorVelocidades
+from ..config import DAILY_PLAN_CONFIG, DRONE_CONFIG, OPERATION_CONFIG
+from .decomposition import SolucionadorDecomposicao
+from .local_search import BuscaLocal
+
+_gerenciador_worker: Optional[GerenciadorDados] = None
+_otimizador_worker: Optional[OtimizadorVelocidades] = None
+
+def _inicializar_worker(csv_file: str):
+    global _gerenciador_worker, _otimizador_worker
+    _gerenciador_worker = GerenciadorDados(csv_file)
+    _otimizador_worker = OtimizadorVelocidades(_gerenciador_worker)
+
+def matriz_tempos_dia(gerenciador_dados: GerenciadorDados, caminho_ids: List[int], dia: int) -> np.ndarray:
+    coords = gerenciador_dados.coords_array[caminho_ids]
+    distancias = haversine_distance_matrix(coords[:, 0], coords[:, 1])
+    angulos = np.radians(flight_angle_matrix(coords[:, 0], coords[:, 1]))
+    senos, cossenos = np.sin(angulos), np.cos(angulos)
+    
+    indice_dia = min(dia, gerenciador_dados.vento_x.shape[0] - 1)
+    horas = slice(OPERATION_CONFIG['start_hour'], OPERATION_CONFIG['end_hour'])
+    ventos = list(zip(gerenciador_dados.vento_x[indice_dia, horas], gerenciador_dados.vento_y[indice_dia, horas]))
+    tempos = np.zeros_like(distancias)
+    for vento_x, vento_y in ventos:
+        tempos += distancias / calculate_effective_speed_vector_array(
+            DRONE_CONFIG['max_speed'], senos, cossenos, vento_x, vento_y)
+    tempos *= 3600 / len(ventos)
+    return (tempos + tempos.T) / 2
+
+def otimizar_dia(gerenciador_dados: GerenciadorDados, otimizador_velocidades: OtimizadorVelocidades,
+                 caminho_ids: List[int], dia: int, k_vizinhos: int) -> Tuple[List[int], float]:
+    candidatos = [list(caminho_ids)]
+    if len(caminho_ids) >= 4:
+        coords = gerenciador_dados.coords_array[caminho_ids]
+        distancias = haversine_distance_matrix(coords[:, 0], coords[:, 1])
+        for custos in (distancias, matriz_tempos_dia(gerenciador_dados, caminho_ids, dia)):
+            busca_local = BuscaLocal(custos, nearest_neighbors_matrix(custos, k_vizinhos), coords)
+            ordem = busca_local.otimizar(list(range(len(caminho_ids))))
+            candidato = np.asarray(caminho_ids)[ordem].tolist()
+            if candidato not in candidatos:
+                candidatos.append(candidato)
+    
+    avaliados = [(otimizador_velocidades.otimizar(candidato, dia_inicial=dia)[2], candidato)
+                 for candidato in candidatos]
+    fitness, caminho_ids = min(avaliados, key=lambda avaliado: avaliado[0])
+    return caminho_ids, fitness
+
+def _otimizar_dia_worker(caminho_ids: List[int], dia: int, k_vizinhos: int) -> Tuple[List[int], float]:
+    return otimizar_dia(_gerenciador_worker, _otimizador_worker, caminho_ids, dia, k_vizinhos)
+
+class PlanejadorDiario:
+    def __init__(self, gerenciador_dados: GerenciadorDados, calculador_custo: CalculadorCusto,
+                 workers: Optional[int] = None, config: Dict = None):
+        self.gerenciador_dados = gerenciador_dados
+        self.calculador_custo = calculador_custo
+        self.config = config if config is not None else DAILY_PLAN_CONFIG
+        
+        self.rodadas = max(1, self.config['rounds'])
+        self.k_vizinhos = self.config['neighbor_k']
+        self.workers = workers if workers is not None else self.config['workers']
+        self.max_days = OPERATION_CONFIG['max_days']
+        self.otimizador_velocidades = OtimizadorVelocidades(gerenciador_dados)
+        self.solucionador_inicial = SolucionadorDecomposicao(gerenciador_dados, workers=self.workers)
+        self.unibrasil_id = gerenciador_dados.obter_id_unibrasil()
+        self.plano_diario: List[Dict] = []
+    
+    def dividir_em_dias(self, rota_ids: List[int], velocidades: List[int],
+                        tempos_pouso: List[bool]) -> List[Tuple[int, List[int]]]:
+        _, checkpoints = self.calculador_custo.simular_com_checkpoints(rota_ids, velocidades, tempos_pouso)
+        dias_chegada = [estado.dia for estado in checkpoints[1:]]
+        dias_chegada += [self.max_days] * (len(rota_ids) - 1 - len(dias_chegada))
+        
+        pacotes: List[Tuple[int, List[int]]] = []
+        for posicao in range(1, len(rota_ids) - 1):
+            dia = dias_chegada[posicao - 1]
+            if not pacotes or pacotes[-1][0] != dia:
+                pacotes.append((dia, []))
+            pacotes[-1][1].append(rota_ids[posicao])
+        return pacotes
+    
+    def _caminhos_diarios(self, pacotes: List[Tuple[int, List[int]]]) -> List[List[int]]:
+        caminhos = []
+        entrada = self.unibrasil_id
+        for posicao, (_, ids_dia) in enumerate(pacotes):
+            caminho = [entrada] + ids_dia
+            if posicao == len(pacotes) - 1:
+                caminho.append(self.unibrasil_id)
+            caminhos.append(caminho)
+            entrada = ids_dia[-1]
+        return caminhos
+    
+    def _otimizar_dias(self, pacotes: List[Tuple[int, List[int]]]) -> List[Tuple[List[int], float]]:
+        caminhos = self._caminhos_diarios(pacotes)
+        dias = [dia for dia, _ in pacotes]
+        
+        if self.workers > 1 and len(pacotes) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_inicializar_worker,
+                                     initargs=(self.gerenciador_dados.csv_file,)) as executor:
+                return list(executor.map(_otimizar_dia_worker, caminhos, dias, [self.k_vizinhos] * len(dias)))
+        return [otimizar_dia(self.gerenciador_dados, self.otimizador_velocidades, caminho, dia, self.k_vizinhos)
+                for caminho, dia in zip(caminhos, dias)]
+    
+    def executar(self, rota_inicial: Optional[List[int]] = None) -> Tuple[List[int], List[int], List[bool], float]:
+        melhor_rota = rota_inicial if rota_inicial is not None else self.solucionador_inicial.construir_rota()
+        melhor_velocidades, melhor_pousos, melhor_fitness = self.otimizador_velocidades.otimizar(melhor_rota)
+        
+        for _ in range(self.rodadas):
+            pacotes = self.dividir_em_dias(melhor_rota, melhor_velocidades, melhor_pousos)
+            if not pacotes:
+                break
+            resultados = self._otimizar_dias(pacotes)
+            
+            rota_ids = [self.unibrasil_id]
+            for caminho, _ in resultados:
+                rota_ids.extend(caminho[1:])
+            velocidades, tempos_pouso, fitness = self.otimizador_velocidades.otimizar(rota_ids)
+            
+            self.plano_diario = [{'day': dia, 'ceps': len(ids_dia), 'estimated_fitness': fitness_dia}
+                                 for (dia, ids_dia), (_, fitness_dia) in zip(pacotes, resultados)]
+            if fitness >= melhor_fitness:
+                break
+            melhor_rota, melhor_velocidades, melhor_pousos, melhor_fitness = rota_ids, velocidades, tempos_pouso, fitness
+        
+        return melhor_rota, melhor_velocidades, melhor_pousos, melhor_fitness
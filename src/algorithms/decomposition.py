@@ -0,0 +1,155 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from ..utils.data_manager import GerenciadorDados
+from ..utils.calculations import haversine_distance_matrix, haversine_distance_array, nearest_neighbors_matrix
+from ..core.speed_optimizer import OtimizadorVelocidades
+from ..config import DECOMPOSITION_CONFIG
+from .local_search import BuscaLocal
+
+def particionar_bisseccao(coords: np.ndarray, tamanho_max: int) -> List[np.ndarray]:
+    if len(coords) == 0:
+        return []
+    escala = np.cos(np.radians(coords[:, 0].mean()))
+    pontos = np.column_stack((coords[:, 0], coords[:, 1] * escala))
+    
+    grupos = []
+    pendentes = [np.arange(len(coords))]
+    while pendentes:
+        indices = pendentes.pop()
+        if len(indices) <= tamanho_max:
+            grupos.append(indices)
+            continue
+        
+        extensao = pontos[indices].max(axis=0) - pontos[indices].min(axis=0)
+        eixo = int(np.argmax(extensao))
+        meio = len(indices) // 2
+        ordem = np.argpartition(pontos[indices, eixo], meio)
+        pendentes.append(indices[ordem[meio:]])
+        pendentes.append(indices[ordem[:meio]])
+    return grupos
+
+def _construir_caminho(distancias: np.ndarray, inicio: int, fim: Optional[int] = None) -> List[int]:
+    restantes = np.ones(len(distancias), dtype=bool)
+    restantes[inicio] = False
+    if fim is not None:
+        restantes[fim] = False
+    
+    caminho = [inicio]
+    atual = inicio
+    for _ in range(int(restantes.sum())):
+        atual = int(np.argmin(np.where(restantes, distancias[atual], np.inf)))
+        restantes[atual] = False
+        caminho.append(atual)
+    if fim is not None:
+        caminho.append(fim)
+    return caminho
+
+def _otimizar_caminho(coords: np.ndarray, caminho: List[int], k_vizinhos: int) -> List[int]:
+    distancias = haversine_distance_matrix(coords[:, 0], coords[:, 1])
+    busca_local = BuscaLocal(distancias, nearest_neighbors_matrix(distancias, k_vizinhos), coords)
+    return busca_local.otimizar(caminho)
+
+def resolver_caminho_aberto(coords: np.ndarray, entrada: int, saida: int, k_vizinhos: int) -> np.ndarray:
+    if len(coords) == 1:
+        return np.zeros(1, dtype=np.intp)
+    
+    distancias = haversine_distance_matrix(coords[:, 0], coords[:, 1])
+    caminho = _construir_caminho(distancias, entrada, saida)
+    busca_local = BuscaLocal(distancias, nearest_neighbors_matrix(distancias, k_vizinhos), coords)
+    return np.asarray(busca_local.otimizar(caminho), dtype=np.intp)
+
+class SolucionadorDecomposicao:
+    def __init__(self, gerenciador_dados: GerenciadorDados, workers: Optional[int] = None,
+                 config: Dict = None):
+        self.gerenciador_dados = gerenciador_dados
+        self.config = config if config is not None else DECOMPOSITION_CONFIG
+        
+        self.tamanho_grupo = max(1, self.config['cluster_size'])
+        self.janela_fronteira = self.config['boundary_window']
+        self.k_vizinhos = self.config['neighbor_k']
+        self.workers = workers if workers is not None else self.config['workers']
+        self.otimizador_velocidades = OtimizadorVelocidades(gerenciador_dados)
+        
+        self.unibrasil_id = gerenciador_dados.obter_id_unibrasil()
+        self.ids_ceps = gerenciador_dados.obter_array_ids_excluindo_unibrasil()
+    
+    def particionar(self) -> List[np.ndarray]:
+        coords = self.gerenciador_dados.coords_array[self.ids_ceps]
+        return [self.ids_ceps[indices] for indices in particionar_bisseccao(coords, self.tamanho_grupo)]
+    
+    def _ordenar_grupos(self, centroides: np.ndarray) -> List[int]:
+        pontos = np.vstack([self.gerenciador_dados.coords_array[self.unibrasil_id], centroides])
+        if len(pontos) < 3:
+            return list(range(len(centroides)))
+        
+        distancias = haversine_distance_matrix(pontos[:, 0], pontos[:, 1])
+        ciclo = _otimizar_caminho(pontos, _construir_caminho(distancias, 0) + [0], self.k_vizinhos)
+        return [indice - 1 for indice in ciclo[1:-1]]
+    
+    def _definir_extremidades(self, grupos: List[np.ndarray],
+                              centroides: np.ndarray) -> List[Tuple[int, int]]:
+        coords = self.gerenciador_dados.coords_array
+        anterior = coords[self.unibrasil_id]
+        extremidades = []
+        for posicao, grupo in enumerate(grupos):
+            pontos = coords[grupo]
+            entrada = int(np.argmin(haversine_distance_array(anterior[0], anterior[1], pontos[:, 0], pontos[:, 1])))
+            
+            alvo = centroides[posicao + 1] if posicao + 1 < len(grupos) else coords[self.unibrasil_id]
+            distancias_saida = haversine_distance_array(alvo[0], alvo[1], pontos[:, 0], pontos[:, 1])
+            if len(grupo) > 1:
+                distancias_saida[entrada] = np.inf
+            saida = int(np.argmin(distancias_saida))
+            
+            extremidades.append((entrada, saida))
+            anterior = pontos[saida]
+        return extremidades
+    
+    def _resolver_grupos(self, grupos: List[np.ndarray],
+                         extremidades: List[Tuple[int, int]]) -> List[np.ndarray]:
+        coords = self.gerenciador_dados.coords_array
+        argumentos = ([coords[grupo] for grupo in grupos], [entrada for entrada, _ in extremidades],
+                      [saida for _, saida in extremidades], [self.k_vizinhos] * len(grupos))
+        
+        if self.workers > 1 and len(grupos) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                tamanho_lote = max(1, len(grupos) // (4 * self.workers))
+                caminhos = list(executor.map(resolver_caminho_aberto, *argumentos, chunksize=tamanho_lote))
+        else:
+            caminhos = list(map(resolver_caminho_aberto, *argumentos))
+        return [grupo[caminho] for grupo, caminho in zip(grupos, caminhos)]
+    
+    def _reparar_fronteiras(self, rota: np.ndarray, juncoes: List[int]) -> np.ndarray:
+        for juncao in juncoes:
+            inicio = max(0, juncao - self.janela_fronteira)
+            fim = min(len(rota) - 1, juncao + self.janela_fronteira)
+            trecho = rota[inicio:fim + 1]
+            if len(trecho) < 4:
+                continue
+            
+            ordem = _otimizar_caminho(self.gerenciador_dados.coords_array[trecho],
+                                      list(range(len(trecho))), self.k_vizinhos)
+            rota[inicio:fim + 1] = trecho[ordem]
+        return rota
+    
+    def construir_rota(self) -> List[int]:
+        grupos = self.particionar()
+        if not grupos:
+            return [self.unibrasil_id, self.unibrasil_id]
+        
+        coords = self.gerenciador_dados.coords_array
+        centroides = np.array([coords[grupo].mean(axis=0) for grupo in grupos])
+        ordem = self._ordenar_grupos(centroides)
+        grupos = [grupos[indice] for indice in ordem]
+        centroides = centroides[ordem]
+        
+        caminhos = self._resolver_grupos(grupos, self._definir_extremidades(grupos, centroides))
+        juncoes = np.cumsum([1] + [len(caminho) for caminho in caminhos[:-1]])[1:].tolist()
+        rota = np.concatenate([[self.unibrasil_id], *caminhos, [self.unibrasil_id]]).astype(np.intp)
+        return self._reparar_fronteiras(rota, juncoes).tolist()
+    
+    def executar(self) -> Tuple[List[int], List[int], List[bool], float]:
+        rota_ids = self.construir_rota()
+        velocidades, tempos_pouso, fitness = self.otimizador_velocidades.otimizar(rota_ids)
+        return rota_ids, velocidades, tempos_pouso, fitness
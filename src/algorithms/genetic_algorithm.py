@@ -1,15 +1,36 @@
 import random
-from typing import List, Tuple
+import threading
+import time
+import numpy as np
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Tuple, Optional
 from tqdm import tqdm
 from ..utils.data_manager import GerenciadorDados
 from ..core.validator import ValidadorSolucao
-from ..core.cost_calculator import CalculadorCusto
-from ..config import GENETIC_CONFIG
-from ..utils.calculations import remove_crossings_2opt, has_crossings
+from ..core.cost_calculator import CalculadorCusto, EstadoSimulacao
+from ..core.fitness_cache import CacheFitness
+from ..core.speed_optimizer import OtimizadorVelocidades
+from ..config import GENETIC_CONFIG, ISLAND_CONFIG
+from ..utils.calculations import remove_crossings_2opt, has_crossings, calculate_autonomy
+from .parallel_evaluator import AvaliadorParalelo
+from .local_search import BuscaLocal
+from .crossover import obter_operador_crossover, herdar_genes
+from .population import Populacao, VELOCIDADES
+from .stopping import CriterioParada, MOTIVO_GERACOES, MOTIVO_CANCELADO
+from .checkpoint import salvar_checkpoint, carregar_checkpoint
+from .instrumentation import (Instrumentacao, estatisticas_geracao, FASE_INICIALIZACAO, FASE_AVALIACAO,
+                              FASE_SELECAO, FASE_CROSSOVER, FASE_REPARO, FASE_MUTACAO, FASE_MUTACAO_VIZINHO,
+                              FASE_BUSCA_LOCAL_PERIODICA, FASE_POLIMENTO, FASE_CHECKPOINT, FASE_LIMITE_INFERIOR)
+from .telemetry import criar_escritores, fechar_escritores, pico_rss_bytes
+from .anytime import iterar_em_thread
+from .lower_bound import LimiteInferior
+
+LIMITE_INDICE_ESPACIAL = 1000
 
 class AlgoritmoGenetico:
     def __init__(self, gerenciador_dados: GerenciadorDados, validador: ValidadorSolucao, 
-                 calculador_custo: CalculadorCusto):
+                 calculador_custo: CalculadorCusto, workers: Optional[int] = None,
+                 ilhas: Optional[int] = None,
+                 callback_geracao: Optional[Callable[[Dict], None]] = None):
         self.gerenciador_dados = gerenciador_dados
         self.validador = validador
         self.calculador_custo = calculador_custo
@@ -21,9 +42,45 @@ class AlgoritmoGenetico:
         self.crossover_rate = self.config['crossover_rate']
         self.elite_size = self.config['elite_size']
         self.tournament_size = self.config['tournament_size']
+        self.workers = workers if workers is not None else self.config.get('workers', 1)
+        self.avaliador_paralelo = None
+        self.ilhas = ilhas if ilhas is not None else ISLAND_CONFIG['islands']
+        nome_crossover = self.config.get('crossover_operator', 'ox')
+        self.operador_crossover = None if nome_crossover == 'one_point' else obter_operador_crossover(nome_crossover)
+        self.fase_operador_crossover = f"{FASE_CROSSOVER}.{nome_crossover}"
+        self.cache_fitness = CacheFitness(self.config.get('fitness_cache_size', 2048))
+        self.apenas_permutacoes = self.config.get('permutations_only', False)
+        self.otimizador_velocidades = OtimizadorVelocidades(gerenciador_dados, self.config.get('battery_bins', 32))
+        self.cache_velocidades = CacheFitness(self.config.get('fitness_cache_size', 2048))
+        self.motivo_parada = None
+        self.checkpoint_path = self.config.get('checkpoint_path')
+        self.checkpoint_interval = self.config.get('checkpoint_interval', 10)
+        self.telemetry_jsonl = self.config.get('telemetry_jsonl')
+        self.metrics_textfile = self.config.get('metrics_textfile')
+        self.telemetry_flush_interval = self.config.get('telemetry_flush_interval', 1.0)
+        self.instrumentacao = Instrumentacao(self.config.get('instrumentation', False))
+        self.callback_geracao = callback_geracao
+        self.escritores_telemetria = []
+        self.movimentos_2opt = 0
+        self.cancelamento = threading.Event()
+        self.melhor_solucao: Optional[Tuple[List[int], List[int], List[bool], float]] = None
+        self.limite_inferior = LimiteInferior(gerenciador_dados)
+        self.gap_otimalidade: Optional[float] = None
         
         self.unibrasil_id = gerenciador_dados.obter_id_unibrasil()
         self.ids_ceps = gerenciador_dados.obter_ids_excluindo_unibrasil()
+        self.max_id = max(self.ids_ceps + [self.unibrasil_id])
+        self.rng = self._novo_rng()
+        self._busca_local: Optional[BuscaLocal] = None
+        self._checkpoints_elite: Optional[Tuple[bytes, List[EstadoSimulacao]]] = None
+    
+    @property
+    def busca_local(self) -> BuscaLocal:
+        if self._busca_local is None:
+            self._busca_local = BuscaLocal(self.gerenciador_dados.matriz_distancias,
+                                           self.gerenciador_dados.obter_vizinhos_proximos(self.config.get('neighbor_k', 8)),
+                                           self.gerenciador_dados.coords_array)
+        return self._busca_local
     
     def criar_individuo(self) -> Tuple[List[int], List[int], List[bool]]:
         ids_aleatorios = self.ids_ceps.copy()
@@ -38,19 +95,7 @@ class AlgoritmoGenetico:
         return rota_ids, velocidades, tempos_pouso
     
     def criar_individuo_vizinho_mais_proximo(self) -> Tuple[List[int], List[int], List[bool]]:
-        rota_ids = [self.unibrasil_id]
-        ids_nao_visitados = self.ids_ceps.copy()
-        id_atual = self.unibrasil_id
-        
-        while ids_nao_visitados:
-            id_mais_proximo = self._encontrar_vizinho_mais_proximo(id_atual, ids_nao_visitados)
-            if id_mais_proximo is None:
-                break
-            
-            rota_ids.append(id_mais_proximo)
-            ids_nao_visitados.remove(id_mais_proximo)
-            id_atual = id_mais_proximo
-        
+        rota_ids = [self.unibrasil_id] + self._construir_vizinho_mais_proximo(self.unibrasil_id, self.ids_ceps)
         rota_ids.append(self.unibrasil_id)
         rota_ids = self._aplicar_2opt(rota_ids, max_iterations=3)
         velocidades = self._gerar_velocidades(rota_ids)
@@ -58,43 +103,65 @@ class AlgoritmoGenetico:
         
         return rota_ids, velocidades, tempos_pouso
     
+    def _construir_vizinho_mais_proximo(self, id_inicial: int, ids: List[int]) -> List[int]:
+        sequencia = []
+        id_atual = id_inicial
+        if len(ids) < LIMITE_INDICE_ESPACIAL:
+            ids_nao_visitados = list(ids)
+            while ids_nao_visitados:
+                id_atual = self._encontrar_vizinho_mais_proximo(id_atual, ids_nao_visitados)
+                ids_nao_visitados.remove(id_atual)
+                sequencia.append(id_atual)
+            return sequencia
+        
+        indice = self.gerenciador_dados.criar_indice_espacial(ids)
+        while len(indice):
+            id_atual = indice.mais_proximo(id_atual)
+            indice.remover(id_atual)
+            sequencia.append(id_atual)
+        return sequencia
+    
     def _encontrar_vizinho_mais_proximo(self, id_atual: int, ids_nao_visitados: List[int]) -> int:
-        menor_distancia = float('inf')
-        id_mais_proximo = None
+        if not ids_nao_visitados:
+            return None
         
-        for id_cep in ids_nao_visitados:
-            distancia = self._calcular_distancia_entre_ids(id_atual, id_cep)
-            if distancia < menor_distancia:
-                menor_distancia = distancia
-                id_mais_proximo = id_cep
-        
-        return id_mais_proximo
+        distancias = self.gerenciador_dados.matriz_distancias[id_atual, ids_nao_visitados]
+        return ids_nao_visitados[int(np.argmin(distancias))]
     
     def _calcular_distancia_entre_ids(self, id1: int, id2: int) -> float:
-        from ..utils.calculations import haversine_distance
-        coords1 = self.gerenciador_dados.obter_coords_por_id(id1)
-        coords2 = self.gerenciador_dados.obter_coords_por_id(id2)
-        return haversine_distance(coords1, coords2)
+        return self.gerenciador_dados.obter_distancia_por_ids(id1, id2)
+    
+    def _distancias_trechos(self, rota_ids: List[int]) -> List[float]:
+        rota = np.asarray(rota_ids)
+        return self.gerenciador_dados.matriz_distancias[rota[:-1], rota[1:]].tolist()
     
     def _aplicar_2opt(self, rota_ids: List[int], max_iterations: int = 10, force_complete: bool = False) -> List[int]:
         if len(rota_ids) < 4:
             return rota_ids
-        def get_coords(route_id: int):
-            return self.gerenciador_dados.obter_coords_por_id(route_id)
-        return remove_crossings_2opt(rota_ids, get_coords, max_iterations, force_complete)
+        if not force_complete:
+            rota_ids = self.busca_local.otimizar(rota_ids, max_movimentos=max_iterations)
+            self.movimentos_2opt += self.busca_local.movimentos
+            return rota_ids
+        
+        rota_ids = self.busca_local.otimizar(rota_ids)
+        self.movimentos_2opt += self.busca_local.movimentos
+        if self._tem_cruzamentos(rota_ids):
+            rota_ids = remove_crossings_2opt(rota_ids, self.gerenciador_dados.obter_coords_por_id,
+                                             max_iterations, force_complete)
+        return rota_ids
+    
+    def _aplicar_2opt_linha(self, rota_ids: np.ndarray, max_iterations: int = 10):
+        self.busca_local.otimizar_linha(rota_ids, max_movimentos=max_iterations)
+        self.movimentos_2opt += self.busca_local.movimentos
     
     def _tem_cruzamentos(self, rota_ids: List[int]) -> bool:
         if len(rota_ids) < 4:
             return False
-        def get_coords(route_id: int):
-            return self.gerenciador_dados.obter_coords_por_id(route_id)
-        coords_list = [get_coords(route_id) for route_id in rota_ids]
-        return has_crossings(coords_list)
+        return has_crossings(self.gerenciador_dados.coords_array[rota_ids])
     
     def _gerar_velocidades(self, rota_ids: List[int]) -> List[int]:
         velocidades = []
-        for i in range(len(rota_ids) - 1):
-            distancia = self._calcular_distancia_entre_ids(rota_ids[i], rota_ids[i + 1])
+        for distancia in self._distancias_trechos(rota_ids):
             if distancia < 1.0:
                 velocidade = 36
             elif distancia < 5.0:
@@ -107,11 +174,9 @@ class AlgoritmoGenetico:
         return velocidades
     
     def _gerar_tempos_pouso_inteligentes(self, rota_ids: List[int], velocidades: List[int]) -> List[bool]:
-        from ..utils.calculations import calculate_autonomy
         tempos_pouso = []
         bateria_atual = 5000 * 0.93
-        for i in range(len(rota_ids) - 1):
-            distancia = self._calcular_distancia_entre_ids(rota_ids[i], rota_ids[i + 1])
+        for i, distancia in enumerate(self._distancias_trechos(rota_ids)):
             tempo_voo = (distancia / velocidades[i]) * 3600
             autonomia = calculate_autonomy(velocidades[i], 5000, 0.93)
             consumo_bateria = tempo_voo * (5000 / autonomia)
@@ -125,6 +190,21 @@ class AlgoritmoGenetico:
         return tempos_pouso
     
     def crossover(self, pai1: Tuple, pai2: Tuple) -> Tuple[Tuple, Tuple]:
+        if self.operador_crossover is None:
+            with self.instrumentacao.medir(self.fase_operador_crossover):
+                return self._crossover_um_ponto(pai1, pai2)
+        
+        filhos = []
+        for pai_principal, pai_secundario in ((pai1, pai2), (pai2, pai1)):
+            with self.instrumentacao.medir(self.fase_operador_crossover):
+                rota_filho = self.operador_crossover(self, pai_principal[0], pai_secundario[0])
+            if random.random() < 0.02:
+                rota_filho = self._aplicar_2opt(rota_filho, max_iterations=2)
+            velocidades, tempos_pouso = herdar_genes(rota_filho, pai_principal, pai_secundario)
+            filhos.append((rota_filho, velocidades, tempos_pouso))
+        return filhos[0], filhos[1]
+    
+    def _crossover_um_ponto(self, pai1: Tuple, pai2: Tuple) -> Tuple[Tuple, Tuple]:
         rota1_ids, velocidades1, pousos1 = pai1
         rota2_ids, velocidades2, pousos2 = pai2
         
@@ -158,56 +238,66 @@ class AlgoritmoGenetico:
         return (filho1_rota, filho1_velocidades, filho1_pousos), (filho2_rota, filho2_velocidades, filho2_pousos)
     
     def _corrigir_rota(self, rota_ids: List[int]) -> List[int]:
-        if not rota_ids or len(rota_ids) < 3:
-            return self.criar_individuo()[0]
-        
-        ceps_meio = rota_ids[1:-1]
-        ceps_unicos = []
-        ceps_vistos = set()
-        for cep_id in ceps_meio:
-            if cep_id != self.unibrasil_id and cep_id not in ceps_vistos:
-                ceps_unicos.append(cep_id)
-                ceps_vistos.add(cep_id)
-        
-        ceps_faltantes = [cep for cep in self.ids_ceps if cep not in ceps_vistos]
-        random.shuffle(ceps_faltantes)
-        ceps_unicos.extend(ceps_faltantes)
-        ceps_unicos = list(dict.fromkeys(ceps_unicos))
-        
-        if len(ceps_unicos) < len(self.ids_ceps):
-            ceps_restantes = [cep for cep in self.ids_ceps if cep not in ceps_unicos]
-            ceps_unicos.extend(ceps_restantes)
-        
-        if len(ceps_unicos) > len(self.ids_ceps):
-            ceps_unicos = ceps_unicos[:len(self.ids_ceps)]
-        
-        return [self.unibrasil_id] + ceps_unicos + [self.unibrasil_id]
+        with self.instrumentacao.medir(FASE_REPARO):
+            if not rota_ids or len(rota_ids) < 3:
+                return self.criar_individuo()[0]
+            
+            ceps_meio = rota_ids[1:-1]
+            ceps_unicos = []
+            ceps_vistos = set()
+            for cep_id in ceps_meio:
+                if cep_id != self.unibrasil_id and cep_id not in ceps_vistos:
+                    ceps_unicos.append(cep_id)
+                    ceps_vistos.add(cep_id)
+            
+            ceps_faltantes = [cep for cep in self.ids_ceps if cep not in ceps_vistos]
+            random.shuffle(ceps_faltantes)
+            ceps_unicos.extend(ceps_faltantes)
+            ceps_unicos = list(dict.fromkeys(ceps_unicos))
+            
+            if len(ceps_unicos) < len(self.ids_ceps):
+                ceps_presentes = set(ceps_unicos)
+                ceps_restantes = [cep for cep in self.ids_ceps if cep not in ceps_presentes]
+                ceps_unicos.extend(ceps_restantes)
+            
+            if len(ceps_unicos) > len(self.ids_ceps):
+                ceps_unicos = ceps_unicos[:len(self.ids_ceps)]
+            
+            return [self.unibrasil_id] + ceps_unicos + [self.unibrasil_id]
     
     def mutar(self, individuo: Tuple) -> Tuple:
-        rota_ids, velocidades, tempos_pouso = individuo
-        
+        populacao = Populacao.de_individuos([individuo], self.max_id)
+        self._mutar_linha(populacao, 0)
+        return populacao[0]
+    
+    def _mutar_linha(self, populacao: Populacao, indice: int):
         if random.random() < 0.3:
-            return self._mutacao_vizinho_mais_proximo(individuo)
+            with self.instrumentacao.medir(FASE_MUTACAO_VIZINHO):
+                populacao.definir(indice, self._mutacao_vizinho_mais_proximo(populacao[indice]))
+            return
         
+        rota_ids = populacao.rotas[indice]
         if random.random() < self.mutation_rate:
-            indices = random.sample(range(1, len(rota_ids) - 1), 2)
-            rota_ids[indices[0]], rota_ids[indices[1]] = rota_ids[indices[1]], rota_ids[indices[0]]
+            a, b = random.sample(range(1, len(rota_ids) - 1), 2)
+            rota_ids[a], rota_ids[b] = rota_ids[b], rota_ids[a]
         
-        for i in range(len(velocidades)):
-            if random.random() < self.mutation_rate:
-                velocidades[i] = random.choice(range(36, 97, 4))
+        if self.apenas_permutacoes:
+            if random.random() < 0.01:
+                self._aplicar_2opt_linha(rota_ids, max_iterations=2)
+            return
         
-        for i in range(len(tempos_pouso)):
-            if random.random() < self.mutation_rate:
-                tempos_pouso[i] = not tempos_pouso[i]
+        mascara = self.rng.random(populacao.num_trechos) < self.mutation_rate
+        populacao.indices_velocidade[indice, mascara] = self.rng.integers(0, len(VELOCIDADES), mascara.sum())
         
-        if random.random() < 0.01:
-            rota_ids = self._aplicar_2opt(rota_ids, max_iterations=2)
-            if len(velocidades) != len(rota_ids) - 1:
-                velocidades = self._gerar_velocidades(rota_ids)
-                tempos_pouso = self._gerar_tempos_pouso_inteligentes(rota_ids, velocidades)
+        mascara = self.rng.random(populacao.num_trechos) < self.mutation_rate
+        populacao.pousos[indice] ^= np.packbits(mascara)
         
-        return rota_ids, velocidades, tempos_pouso
+        if random.random() < 0.01:
+            self._aplicar_2opt_linha(rota_ids, max_iterations=2)
+    
+    @staticmethod
+    def _novo_rng() -> np.random.Generator:
+        return np.random.default_rng(random.getrandbits(64))
     
     def _mutacao_vizinho_mais_proximo(self, individuo: Tuple) -> Tuple:
         rota_ids, velocidades, tempos_pouso = individuo
@@ -223,17 +313,8 @@ class AlgoritmoGenetico:
         if len(ids_para_reordenar) < 2:
             return individuo
         
-        nova_secao = [self.unibrasil_id] if inicio == 1 else [rota_ids[inicio-1]]
-        ids_nao_visitados = ids_para_reordenar.copy()
-        id_atual = nova_secao[-1]
-        
-        while ids_nao_visitados:
-            id_mais_proximo = self._encontrar_vizinho_mais_proximo(id_atual, ids_nao_visitados)
-            if id_mais_proximo is None:
-                break
-            nova_secao.append(id_mais_proximo)
-            ids_nao_visitados.remove(id_mais_proximo)
-            id_atual = id_mais_proximo
+        id_anterior = self.unibrasil_id if inicio == 1 else rota_ids[inicio-1]
+        nova_secao = [id_anterior] + self._construir_vizinho_mais_proximo(id_anterior, ids_para_reordenar)
         
         nova_rota = rota_ids[:inicio] + nova_secao[1:] + rota_ids[fim:]
         
@@ -245,71 +326,390 @@ class AlgoritmoGenetico:
         
         return nova_rota, novas_velocidades, novos_tempos_pouso
     
-    def selecao_torneio(self, populacao: List, fitness_scores: List[float]) -> Tuple:
-        tournament_indices = random.sample(range(len(populacao)), self.tournament_size)
+    def selecao_torneio(self, populacao, fitness_scores: List[float]) -> Tuple:
+        return populacao[self._indice_torneio(len(populacao), fitness_scores)]
+    
+    def _indice_torneio(self, tamanho: int, fitness_scores: List[float]) -> int:
+        tournament_indices = random.sample(range(tamanho), self.tournament_size)
         tournament_fitness = [fitness_scores[i] for i in tournament_indices]
-        winner_idx = tournament_indices[tournament_fitness.index(min(tournament_fitness))]
-        return populacao[winner_idx]
+        return tournament_indices[tournament_fitness.index(min(tournament_fitness))]
     
-    def executar(self) -> Tuple[List[int], List[int], List[bool], float]:
-        populacao = []
-        num_vizinho = int(self.population_size * 0.2)
-        for _ in range(num_vizinho):
-            populacao.append(self.criar_individuo_vizinho_mais_proximo())
-        for _ in range(self.population_size - num_vizinho):
-            populacao.append(self.criar_individuo())
-        
-        melhor_individuo = None
-        melhor_fitness = float('inf')
-        
-        for geracao in tqdm(range(self.generations), desc="Gerando rota", unit="geração"):
-            fitness_scores = []
-            for individuo in populacao:
-                eh_valida, _ = self.validador.validar_solucao_ids(*individuo)
-                if eh_valida:
-                    custo, _ = self.calculador_custo.calcular_custo_rota_ids(*individuo)
-                    fitness_scores.append(custo)
-                else:
-                    fitness_scores.append(float('inf'))
-            
-            min_fitness = min(fitness_scores)
-            if min_fitness < melhor_fitness:
-                melhor_fitness = min_fitness
-                melhor_individuo = populacao[fitness_scores.index(min_fitness)]
-            
-            nova_populacao = []
-            
-            elite_indices = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i])[:self.elite_size]
-            for idx in elite_indices:
-                nova_populacao.append(populacao[idx])
-            
-            while len(nova_populacao) < self.population_size:
-                pai1 = self.selecao_torneio(populacao, fitness_scores)
-                pai2 = self.selecao_torneio(populacao, fitness_scores)
-                
-                if random.random() < self.crossover_rate:
-                    filho1, filho2 = self.crossover(pai1, pai2)
-                else:
-                    filho1, filho2 = pai1, pai2
+    def avaliar_populacao(self, populacao) -> List[float]:
+        if not isinstance(populacao, Populacao):
+            tamanhos = {(len(rota_ids), len(velocidades), len(tempos_pouso)) 
+                        for rota_ids, velocidades, tempos_pouso in populacao}
+            if len(tamanhos) != 1 or not all(Populacao.velocidades_na_grade(velocidades)
+                                             for _, velocidades, _ in populacao):
+                return [self._avaliar_individuo(individuo) for individuo in populacao]
+            try:
+                populacao = Populacao.de_individuos(populacao, self.max_id)
+            except ValueError:
+                return [self._avaliar_individuo(individuo) for individuo in populacao]
+        
+        if self.apenas_permutacoes:
+            return self._avaliar_permutacoes(populacao)
+        return self._avaliar_genes(populacao).tolist()
+    
+    def _avaliar_genes(self, populacao: Populacao) -> np.ndarray:
+        rotas_ids = populacao.rotas.astype(np.intp)
+        velocidades = populacao.velocidades()
+        tempos_pouso = populacao.tempos_pouso()
+        
+        fitness = np.empty(len(populacao), dtype=np.float64)
+        pendentes: Dict[bytes, List[int]] = {}
+        for i in range(len(populacao)):
+            chave = self.cache_fitness.calcular_chave(rotas_ids[i], velocidades[i], tempos_pouso[i])
+            if chave in pendentes:
+                pendentes[chave].append(i)
+                continue
+            valor = self.cache_fitness.obter(chave)
+            if valor is None:
+                pendentes[chave] = [i]
+            else:
+                fitness[i] = valor
+        
+        if pendentes:
+            indices = np.array([indices[0] for indices in pendentes.values()])
+            calculados = self._avaliar_lote(rotas_ids[indices], velocidades[indices], tempos_pouso[indices])
+            for (chave, indices_chave), valor in zip(pendentes.items(), calculados.tolist()):
+                fitness[indices_chave] = valor
+                self.cache_fitness.armazenar(chave, valor)
+        
+        return fitness
+    
+    def _avaliar_permutacoes(self, populacao: Populacao) -> List[float]:
+        fitness = self._avaliar_genes(populacao)
+        finitos = np.flatnonzero(np.isfinite(fitness))
+        sem_genes = np.empty(0, dtype=np.int32)
+        
+        elites: Dict[bytes, List[int]] = {}
+        for i in finitos[np.argsort(fitness[finitos], kind='stable')].tolist():
+            chave = self.cache_velocidades.calcular_chave(populacao.rotas[i], sem_genes, sem_genes)
+            if chave not in elites and len(elites) >= self.elite_size:
+                continue
+            elites.setdefault(chave, []).append(i)
+        
+        resultados = self._velocidades_otimas(list(elites), populacao.rotas[[indices[0] for indices in elites.values()]])
+        for indices, (custo, indices_velocidade, pousos) in zip(elites.values(), resultados):
+            for i in indices:
+                if custo < fitness[i]:
+                    populacao.indices_velocidade[i] = indices_velocidade
+                    populacao.pousos[i] = pousos
+                    fitness[i] = custo
+        
+        return fitness.tolist()
+    
+    def _velocidades_otimas(self, chaves: List[bytes], rotas_ids: np.ndarray) -> List[Tuple[float, np.ndarray, np.ndarray]]:
+        resultados = [self.cache_velocidades.obter(chave) for chave in chaves]
+        pendentes = [i for i, resultado in enumerate(resultados) if resultado is None]
+        if pendentes:
+            otimizados = self._otimizar_velocidades_lote(rotas_ids[pendentes])
+            for i, (velocidades, tempos_pouso, custo) in zip(pendentes, otimizados):
+                resultados[i] = (custo, Populacao.codificar_velocidades(velocidades), np.packbits(tempos_pouso))
+                self.cache_velocidades.armazenar(chaves[i], resultados[i])
+        return resultados
+    
+    def _otimizar_velocidades_lote(self, rotas_ids: np.ndarray) -> List[Tuple[List[int], List[bool], float]]:
+        if self.avaliador_paralelo is not None:
+            return self.avaliador_paralelo.otimizar_velocidades(rotas_ids)
+        return [self.otimizador_velocidades.otimizar(rota_ids) for rota_ids in rotas_ids.astype(np.intp)]
+    
+    def _avaliar_lote(self, rotas_ids: np.ndarray, velocidades: np.ndarray, 
+                      tempos_pouso: np.ndarray) -> np.ndarray:
+        if self.avaliador_paralelo is not None:
+            return self.avaliador_paralelo.avaliar(rotas_ids, velocidades, tempos_pouso)
+        
+        validos = self.validador.validar_populacao_ids(rotas_ids, velocidades, tempos_pouso)
+        fitness = self.calculador_custo.calcular_custo_populacao(rotas_ids, velocidades, tempos_pouso)
+        fitness[~validos] = float('inf')
+        return fitness
+    
+    def _avaliar_individuo(self, individuo: Tuple) -> float:
+        chave = self.cache_fitness.calcular_chave(*individuo)
+        custo = self.cache_fitness.obter(chave)
+        if custo is not None:
+            return custo
+        
+        eh_valida, _ = self.validador.validar_solucao_ids(*individuo)
+        if eh_valida:
+            custo = self.calculador_custo.calcular_fitness_ids(*individuo)
+        else:
+            custo = float('inf')
+        self.cache_fitness.armazenar(chave, custo)
+        return custo
+    
+    def executar(self, resume_from: Optional[str] = None) -> Tuple[List[int], List[int], List[bool], float]:
+        solucao = None
+        for solucao in self.executar_iterativo(resume_from):
+            pass
+        return solucao
+    
+    def executar_iterativo(self, resume_from: Optional[str] = None) -> Iterator[Tuple[List[int], List[int], List[bool], float]]:
+        if self.ilhas > 1 and resume_from is not None:
+            raise ValueError("Retomada de checkpoint não suportada no modelo de ilhas")
+        if self.ilhas > 1 and (self.callback_geracao is not None or self.telemetry_jsonl or
+                               self.metrics_textfile or self.instrumentacao.ativa):
+            raise ValueError("Callback de geração, telemetria e instrumentação não suportados no modelo de ilhas")
+        self.cancelamento.clear()
+        self.melhor_solucao = None
+        self.gap_otimalidade = None
+        return self._publicar_solucoes(resume_from)
+    
+    def executar_async(self, resume_from: Optional[str] = None) -> AsyncIterator[Tuple[List[int], List[int], List[bool], float]]:
+        return iterar_em_thread(self.executar_iterativo(resume_from), self.cancelar)
+    
+    def cancelar(self):
+        self.cancelamento.set()
+    
+    def _publicar_solucoes(self, resume_from: Optional[str]) -> Iterator[Tuple[List[int], List[int], List[bool], float]]:
+        for solucao in self._iterar_solucoes(resume_from):
+            self.melhor_solucao = solucao
+            self.gap_otimalidade = self.limite_inferior.gap(solucao[3])
+            yield solucao
+    
+    def _iterar_solucoes(self, resume_from: Optional[str]) -> Iterator[Tuple[List[int], List[int], List[bool], float]]:
+        if self.ilhas > 1:
+            from .island_model import ModeloIlhas
+            yield from ModeloIlhas(self, {**ISLAND_CONFIG, 'islands': self.ilhas}).executar_iterativo()
+            return
+        
+        if self.workers <= 1:
+            yield from self._executar_algoritmo(resume_from)
+            return
+        
+        with AvaliadorParalelo(self.gerenciador_dados.csv_file, self.workers,
+                               self.otimizador_velocidades.faixas_bateria) as avaliador:
+            self.avaliador_paralelo = avaliador
+            try:
+                yield from self._executar_algoritmo(resume_from)
+            finally:
+                self.avaliador_paralelo = None
+    
+    def _executar_algoritmo(self, resume_from: Optional[str] = None) -> Iterator[Tuple[List[int], List[int], List[bool], float]]:
+        try:
+            self.escritores_telemetria = criar_escritores(self.telemetry_jsonl, self.metrics_textfile,
+                                                          self.telemetry_flush_interval)
+            yield from self._evoluir(resume_from)
+        finally:
+            fechar_escritores(self.escritores_telemetria)
+            self.escritores_telemetria = []
+    
+    def _evoluir(self, resume_from: Optional[str] = None) -> Iterator[Tuple[List[int], List[int], List[bool], float]]:
+        self.instrumentacao.reiniciar()
+        criterio_parada = self.criar_criterio_parada()
+        self.inicio_execucao = time.perf_counter()
+        self.avaliacoes = 0
+        self.movimentos_2opt = 0
+        
+        if resume_from is not None:
+            estado = self._restaurar_checkpoint(resume_from, criterio_parada)
+            populacao = estado['populacao']
+            fitness_scores = estado['fitness_scores']
+            geracao_inicial = estado['geracao']
+            melhor_individuo = estado['melhor_individuo']
+            melhor_fitness = estado['melhor_fitness']
+            self.geracao_melhoria = estado.get('geracao_melhoria', geracao_inicial)
+        else:
+            with self.instrumentacao.medir(FASE_INICIALIZACAO):
+                populacao = self._inicializar_populacao()
+            fitness_scores = None
+            geracao_inicial = 0
+            melhor_individuo = None
+            melhor_fitness = float('inf')
+            self.geracao_melhoria = 0
+        
+        geracoes = range(geracao_inicial, self.generations)
+        if fitness_scores is not None and geracao_inicial + 1 >= self.generations:
+            self.motivo_parada = estado['motivo_parada'] or MOTIVO_GERACOES
+            geracoes = range(0)
+        for geracao in tqdm(geracoes, desc="Gerando rota", unit="geração",
+                            initial=geracao_inicial, total=self.generations):
+            if fitness_scores is None:
+                with self.instrumentacao.medir(FASE_AVALIACAO):
+                    fitness_scores = self.avaliar_populacao(populacao)
+                self.avaliacoes += len(fitness_scores)
                 
-                filho1 = self.mutar(filho1)
-                filho2 = self.mutar(filho2)
+                min_fitness = min(fitness_scores)
+                if min_fitness < melhor_fitness:
+                    melhor_fitness = min_fitness
+                    melhor_individuo = populacao[fitness_scores.index(min_fitness)]
+                    self.geracao_melhoria = geracao
+                    rota_ids, velocidades, tempos_pouso = melhor_individuo
+                    yield list(rota_ids), list(velocidades), list(tempos_pouso), melhor_fitness
+                if self.callback_geracao is not None:
+                    self._notificar_geracao(geracao, populacao, fitness_scores, melhor_fitness)
+                if self.escritores_telemetria:
+                    self._registrar_telemetria(geracao, fitness_scores, melhor_fitness)
                 
-                nova_populacao.extend([filho1, filho2])
-            
-            if geracao % 30 == 0 and len(nova_populacao) > 0:
-                rota_ids, velocidades, tempos_pouso = nova_populacao[0]
-                rota_melhorada = self._aplicar_2opt(rota_ids, max_iterations=5)
-                if len(velocidades) != len(rota_melhorada) - 1:
-                    velocidades = self._gerar_velocidades(rota_melhorada)
-                    tempos_pouso = self._gerar_tempos_pouso_inteligentes(rota_melhorada, velocidades)
-                nova_populacao[0] = (rota_melhorada, velocidades, tempos_pouso)
+                self.motivo_parada = criterio_parada.verificar(geracao + 1, melhor_fitness)
+                if self.motivo_parada is None and self.cancelamento.is_set():
+                    self.motivo_parada = MOTIVO_CANCELADO
+                if self.checkpoint_path is not None and (
+                        self.motivo_parada is not None or (geracao + 1) % self.checkpoint_interval == 0):
+                    with self.instrumentacao.medir(FASE_CHECKPOINT):
+                        self.salvar_estado(self.checkpoint_path, populacao, fitness_scores, geracao,
+                                           melhor_individuo, melhor_fitness, criterio_parada)
+                if self.motivo_parada is not None:
+                    break
             
-            populacao = nova_populacao[:self.population_size]
+            populacao = self._proxima_geracao(populacao, fitness_scores, geracao)
+            fitness_scores = None
         
         if melhor_individuo is None:
             melhor_individuo = populacao[0]
         
+        with self.instrumentacao.medir(FASE_POLIMENTO):
+            solucao = self._polir_solucao(melhor_individuo, melhor_fitness)
+        yield solucao
+    
+    def _notificar_geracao(self, geracao: int, populacao: Populacao, fitness_scores: List[float],
+                           melhor_fitness: float):
+        estatisticas = estatisticas_geracao(geracao, fitness_scores, populacao.rotas)
+        estatisticas['melhor_global'] = melhor_fitness
+        estatisticas['tempos'] = self.instrumentacao.tempos_desde_ultima_geracao()
+        self.callback_geracao(estatisticas)
+    
+    def _registrar_telemetria(self, geracao: int, fitness_scores: List[float], melhor_fitness: float):
+        decorrido = time.perf_counter() - self.inicio_execucao
+        cache = self.cache_velocidades if self.apenas_permutacoes else self.cache_fitness
+        finitos = [fitness for fitness in fitness_scores if fitness != float('inf')]
+        registro = {
+            'timestamp': time.time(),
+            'generation': geracao,
+            'best_fitness': melhor_fitness,
+            'mean_fitness': sum(finitos) / len(finitos) if finitos else float('inf'),
+            'optimality_gap': self.limite_inferior.gap(melhor_fitness),
+            'generations_since_improvement': geracao - self.geracao_melhoria,
+            'cache_hit_rate': cache.estatisticas()['hit_rate'],
+            'evaluations_per_second': self.avaliacoes / decorrido if decorrido > 0 else 0.0,
+            'two_opt_moves': self.movimentos_2opt,
+            'peak_rss_bytes': pico_rss_bytes(),
+            'elapsed_seconds': decorrido,
+        }
+        for escritor in self.escritores_telemetria:
+            escritor.registrar(registro)
+    
+    def salvar_estado(self, caminho: str, populacao: Populacao, fitness_scores: List[float], geracao: int,
+                      melhor_individuo: Tuple, melhor_fitness: float, criterio_parada: CriterioParada):
+        salvar_checkpoint(caminho, {
+            'num_pontos': len(self.ids_ceps) + 2,
+            'max_id': self.max_id,
+            'populacao': populacao,
+            'fitness_scores': list(fitness_scores),
+            'geracao': geracao,
+            'melhor_individuo': melhor_individuo,
+            'melhor_fitness': melhor_fitness,
+            'geracao_melhoria': self.geracao_melhoria,
+            'motivo_parada': self.motivo_parada,
+            'criterio_parada': criterio_parada.exportar_estado(),
+            'estado_random': random.getstate(),
+            'estado_numpy': self.rng.bit_generator.state,
+        })
+    
+    def _restaurar_checkpoint(self, caminho: str, criterio_parada: CriterioParada) -> Dict:
+        estado = carregar_checkpoint(caminho)
+        if estado['num_pontos'] != len(self.ids_ceps) + 2 or estado['max_id'] != self.max_id:
+            raise ValueError(f"Checkpoint {caminho} pertence a outro conjunto de dados")
+        
+        random.setstate(estado['estado_random'])
+        self.rng = np.random.default_rng()
+        self.rng.bit_generator.state = estado['estado_numpy']
+        criterio_parada.restaurar_estado(estado['criterio_parada'])
+        return estado
+    
+    def criar_criterio_parada(self) -> CriterioParada:
+        self.motivo_parada = None
+        criterio_parada = CriterioParada(self.config, self.generations)
+        if criterio_parada.gap_alvo is not None or self.limite_inferior.config['enabled']:
+            with self.instrumentacao.medir(FASE_LIMITE_INFERIOR):
+                criterio_parada.limite_inferior = self.limite_inferior.calcular()
+        return criterio_parada
+    
+    def _inicializar_populacao(self) -> Populacao:
+        individuos = []
+        num_vizinho = int(self.population_size * 0.2)
+        for _ in range(num_vizinho):
+            individuos.append(self.criar_individuo_vizinho_mais_proximo())
+        for _ in range(self.population_size - num_vizinho):
+            individuos.append(self.criar_individuo())
+        return Populacao.de_individuos(individuos, self.max_id)
+    
+    def _proxima_geracao(self, populacao: Populacao, fitness_scores: List[float], geracao: int) -> Populacao:
+        self.rng = self._novo_rng()
+        nova_populacao = populacao.vazia(self.population_size)
+        
+        elite_indices = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i])[:self.elite_size]
+        for destino, idx in enumerate(elite_indices):
+            nova_populacao.copiar_linha(destino, populacao, idx)
+        
+        destino = len(elite_indices)
+        medir = self.instrumentacao.medir
+        while destino < self.population_size:
+            with medir(FASE_SELECAO):
+                idx1 = self._indice_torneio(len(populacao), fitness_scores)
+                idx2 = self._indice_torneio(len(populacao), fitness_scores)
+            
+            if random.random() < self.crossover_rate:
+                with medir(FASE_CROSSOVER):
+                    filhos = self.crossover(populacao[idx1], populacao[idx2])
+                for filho in filhos[:self.population_size - destino]:
+                    nova_populacao.definir(destino, filho)
+                    with medir(FASE_MUTACAO):
+                        self._mutar_linha(nova_populacao, destino)
+                    destino += 1
+            else:
+                for idx in (idx1, idx2)[:self.population_size - destino]:
+                    nova_populacao.copiar_linha(destino, populacao, idx)
+                    with medir(FASE_MUTACAO):
+                        self._mutar_linha(nova_populacao, destino)
+                    destino += 1
+        
+        if geracao % 30 == 0 and len(nova_populacao) > 0:
+            with medir(FASE_BUSCA_LOCAL_PERIODICA):
+                self._busca_local_elite(nova_populacao,
+                                        fitness_scores[elite_indices[0]] if elite_indices else float('inf'))
+        
+        return nova_populacao
+    
+    def _busca_local_elite(self, populacao: Populacao, fitness_atual: float):
+        rota_ids, velocidades, tempos_pouso = populacao[0]
+        nova_rota = self._aplicar_2opt(rota_ids, max_iterations=5)
+        if nova_rota == rota_ids:
+            return
+        
+        if self.apenas_permutacoes:
+            sem_genes = np.empty(0, dtype=np.int32)
+            chave = self.cache_velocidades.calcular_chave(nova_rota, sem_genes, sem_genes)
+            (fitness_novo, indices_velocidade, pousos), = self._velocidades_otimas([chave], np.array([nova_rota]))
+            if fitness_novo <= fitness_atual:
+                populacao.rotas[0] = nova_rota
+                populacao.indices_velocidade[0] = indices_velocidade
+                populacao.pousos[0] = pousos
+            return
+        
+        primeiro_trecho = self.calculador_custo.primeiro_trecho_alterado(
+            (rota_ids, velocidades, tempos_pouso), (nova_rota, velocidades, tempos_pouso))
+        checkpoints = self._checkpoints_individuo(rota_ids, velocidades, tempos_pouso, primeiro_trecho)
+        fitness_novo, checkpoints_novos = self.calculador_custo.calcular_custo_incremental(
+            nova_rota, velocidades, tempos_pouso, checkpoints, primeiro_trecho)
+        if fitness_novo <= fitness_atual:
+            populacao.rotas[0] = nova_rota
+            self._checkpoints_elite = (self.cache_fitness.calcular_chave(nova_rota, velocidades, tempos_pouso),
+                                       checkpoints_novos)
+    
+    def _checkpoints_individuo(self, rota_ids: List[int], velocidades: List[int], tempos_pouso: List[bool],
+                               ate_trecho: int) -> List[EstadoSimulacao]:
+        if self._checkpoints_elite is not None and \
+                self._checkpoints_elite[0] == self.cache_fitness.calcular_chave(rota_ids, velocidades, tempos_pouso):
+            return self._checkpoints_elite[1]
+        if ate_trecho <= 0:
+            return []
+        _, checkpoints = self.calculador_custo.simular_com_checkpoints(
+            rota_ids[:ate_trecho + 1], velocidades[:ate_trecho], tempos_pouso[:ate_trecho])
+        return checkpoints
+    
+    def _polir_solucao(self, melhor_individuo: Tuple, 
+                       melhor_fitness: float) -> Tuple[List[int], List[int], List[bool], float]:
         rota_final, velocidades_final, tempos_pouso_final = melhor_individuo
         rota_final = self._corrigir_rota(rota_final)
         
@@ -319,4 +719,9 @@ class AlgoritmoGenetico:
             velocidades_final = self._gerar_velocidades(rota_final)
             tempos_pouso_final = self._gerar_tempos_pouso_inteligentes(rota_final, velocidades_final)
         
-        return rota_final, velocidades_final, tempos_pouso_final, melhor_fitness
\ No newline at end of file
+        melhor_fitness = self._avaliar_individuo((rota_final, velocidades_final, tempos_pouso_final))
+        velocidades_otimas, pousos_otimos, fitness_otimo = self.otimizador_velocidades.otimizar(rota_final)
+        if fitness_otimo < melhor_fitness:
+            velocidades_final, tempos_pouso_final, melhor_fitness = velocidades_otimas, pousos_otimos, fitness_otimo
+        
+        return rota_final, velocidades_final, tempos_pouso_final, melhor_fitness
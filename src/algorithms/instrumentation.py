@@ -0,0 +1,78 @@
+import time
+import numpy as np
+from typing import Dict, List, Optional
+
+FASE_INICIALIZACAO = 'inicializacao'
+FASE_AVALIACAO = 'avaliacao'
+FASE_SELECAO = 'selecao'
+FASE_CROSSOVER = 'crossover'
+FASE_REPARO = 'reparo'
+FASE_MUTACAO = 'mutacao'
+FASE_MUTACAO_VIZINHO = 'mutacao.vizinho_mais_proximo'
+FASE_BUSCA_LOCAL_PERIODICA = 'busca_local_periodica'
+FASE_POLIMENTO = 'polimento'
+FASE_CHECKPOINT = 'checkpoint'
+FASE_LIMITE_INFERIOR = 'limite_inferior'
+
+class _CronometroNulo:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_CRONOMETRO_NULO = _CronometroNulo()
+
+class _Cronometro:
+    def __init__(self, instrumentacao: 'Instrumentacao', fase: str):
+        self.instrumentacao = instrumentacao
+        self.fase = fase
+    
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.instrumentacao.registrar(self.fase, time.perf_counter() - self.inicio)
+        return False
+
+class Instrumentacao:
+    def __init__(self, ativa: bool = False):
+        self.ativa = ativa
+        self.reiniciar()
+    
+    def reiniciar(self):
+        self.tempos: Dict[str, float] = {}
+        self.chamadas: Dict[str, int] = {}
+        self._tempos_geracao: Dict[str, float] = {}
+    
+    def medir(self, fase: str):
+        if not self.ativa:
+            return _CRONOMETRO_NULO
+        return _Cronometro(self, fase)
+    
+    def registrar(self, fase: str, segundos: float):
+        self.tempos[fase] = self.tempos.get(fase, 0.0) + segundos
+        self.chamadas[fase] = self.chamadas.get(fase, 0) + 1
+    
+    def tempos_desde_ultima_geracao(self) -> Dict[str, float]:
+        delta = {fase: tempo - self._tempos_geracao.get(fase, 0.0) for fase, tempo in self.tempos.items()}
+        self._tempos_geracao = dict(self.tempos)
+        return {fase: tempo for fase, tempo in delta.items() if tempo > 0}
+    
+    def resumo(self) -> Dict[str, Dict[str, float]]:
+        return {fase: {'segundos': self.tempos[fase], 'chamadas': self.chamadas[fase]}
+                for fase in sorted(self.tempos, key=self.tempos.get, reverse=True)}
+
+def estatisticas_geracao(geracao: int, fitness_scores: List[float], rotas: Optional[np.ndarray]) -> Dict:
+    fitness = np.asarray(fitness_scores, dtype=np.float64)
+    finitos = fitness[np.isfinite(fitness)]
+    diversidade = len(np.unique(rotas, axis=0)) / len(rotas) if rotas is not None and len(rotas) else 0.0
+    return {
+        'geracao': geracao,
+        'melhor': float(finitos.min()) if len(finitos) else float('inf'),
+        'media': float(finitos.mean()) if len(finitos) else float('inf'),
+        'pior': float(finitos.max()) if len(finitos) else float('inf'),
+        'invalidos': int(len(fitness) - len(finitos)),
+        'diversidade': diversidade,
+    }
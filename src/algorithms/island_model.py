@@ -0,0 +1,162 @@
+import random
+import multiprocessing
+import numpy as np
+from typing import Dict, Iterator, List, Tuple
+from tqdm import tqdm
+from ..utils.data_manager import GerenciadorDados
+from ..core.validator import ValidadorSolucao
+from ..core.cost_calculator import CalculadorCusto
+from ..config import ISLAND_CONFIG
+from .genetic_algorithm import AlgoritmoGenetico
+from .stopping import MOTIVO_CANCELADO
+
+TOPOLOGIAS = ('ring', 'random')
+
+def _processo_ilha(conexao, csv_file: str, parametros: Dict, semente: int):
+    random.seed(semente)
+    gerenciador_dados = GerenciadorDados(csv_file)
+    validador = ValidadorSolucao(gerenciador_dados)
+    calculador_custo = CalculadorCusto(gerenciador_dados)
+    algoritmo = AlgoritmoGenetico(gerenciador_dados, validador, calculador_custo, workers=1)
+    for nome, valor in parametros.items():
+        setattr(algoritmo, nome, valor)
+    
+    populacao = algoritmo._inicializar_populacao()
+    melhor_individuo = None
+    melhor_fitness = float('inf')
+    
+    while True:
+        mensagem = conexao.recv()
+        if mensagem[0] == 'encerrar':
+            break
+        
+        _, geracao_inicial, num_geracoes, imigrantes = mensagem
+        for deslocamento, imigrante in enumerate(imigrantes[:len(populacao)], start=1):
+            populacao.definir(len(populacao) - deslocamento, imigrante)
+        
+        emigrantes = []
+        for geracao in range(geracao_inicial, geracao_inicial + num_geracoes):
+            fitness_scores = algoritmo.avaliar_populacao(populacao)
+            
+            min_fitness = min(fitness_scores)
+            if min_fitness < melhor_fitness:
+                melhor_fitness = min_fitness
+                melhor_individuo = populacao[fitness_scores.index(min_fitness)]
+            
+            melhores = np.argsort(fitness_scores, kind='stable')[:parametros['migrants']]
+            emigrantes = [populacao[i] for i in melhores.tolist()]
+            populacao = algoritmo._proxima_geracao(populacao, fitness_scores, geracao)
+        
+        conexao.send((emigrantes, melhor_individuo, melhor_fitness))
+    
+    conexao.close()
+
+class ModeloIlhas:
+    def __init__(self, algoritmo: AlgoritmoGenetico, config: Dict = None):
+        self.algoritmo = algoritmo
+        self.config = config if config is not None else ISLAND_CONFIG
+        
+        self.num_ilhas = self.config['islands']
+        self.migration_interval = max(1, self.config['migration_interval'])
+        self.migrants = self.config['migrants']
+        self.topology = self.config['topology']
+        if self.topology not in TOPOLOGIAS:
+            raise ValueError(f"Topologia de migração desconhecida: {self.topology}")
+        
+        self.tamanho_populacao_ilha = max(algoritmo.population_size // self.num_ilhas,
+                                          algoritmo.tournament_size, self.migrants + 1)
+    
+    def _parametros_ilha(self) -> Dict:
+        return {
+            'population_size': self.tamanho_populacao_ilha,
+            'mutation_rate': self.algoritmo.mutation_rate,
+            'crossover_rate': self.algoritmo.crossover_rate,
+            'elite_size': min(self.algoritmo.elite_size, self.tamanho_populacao_ilha),
+            'tournament_size': self.algoritmo.tournament_size,
+            'apenas_permutacoes': self.algoritmo.apenas_permutacoes,
+            'migrants': self.migrants,
+        }
+    
+    def _destinos_migracao(self) -> List[int]:
+        if self.topology == 'ring':
+            return [(ilha + 1) % self.num_ilhas for ilha in range(self.num_ilhas)]
+        
+        destinos = []
+        for ilha in range(self.num_ilhas):
+            outras = [outra for outra in range(self.num_ilhas) if outra != ilha]
+            destinos.append(random.choice(outras))
+        return destinos
+    
+    def executar(self) -> Tuple[List[int], List[int], List[bool], float]:
+        solucao = None
+        for solucao in self.executar_iterativo():
+            pass
+        return solucao
+    
+    def executar_iterativo(self) -> Iterator[Tuple[List[int], List[int], List[bool], float]]:
+        contexto = multiprocessing.get_context()
+        parametros = self._parametros_ilha()
+        sementes = [random.randrange(2 ** 32) for _ in range(self.num_ilhas)]
+        
+        conexoes = []
+        processos = []
+        for semente in sementes:
+            conexao_principal, conexao_ilha = contexto.Pipe()
+            processo = contexto.Process(target=_processo_ilha, daemon=True,
+                                        args=(conexao_ilha, self.algoritmo.gerenciador_dados.csv_file,
+                                              parametros, semente))
+            processo.start()
+            conexao_ilha.close()
+            conexoes.append(conexao_principal)
+            processos.append(processo)
+        
+        melhor_individuo = None
+        melhor_fitness = float('inf')
+        imigrantes = [[] for _ in range(self.num_ilhas)]
+        
+        criterio_parada = self.algoritmo.criar_criterio_parada()
+        
+        try:
+            with tqdm(total=self.algoritmo.generations, desc="Gerando rota (ilhas)", unit="geração") as barra:
+                geracao = 0
+                while geracao < self.algoritmo.generations:
+                    num_geracoes = min(self.migration_interval, self.algoritmo.generations - geracao)
+                    for conexao, recebidos in zip(conexoes, imigrantes):
+                        conexao.send(('evoluir', geracao, num_geracoes, recebidos))
+                    
+                    resultados = [conexao.recv() for conexao in conexoes]
+                    melhor_anterior = melhor_fitness
+                    for _, individuo, fitness in resultados:
+                        if fitness < melhor_fitness:
+                            melhor_fitness = fitness
+                            melhor_individuo = individuo
+                    if melhor_fitness < melhor_anterior:
+                        rota_ids, velocidades, tempos_pouso = melhor_individuo
+                        yield list(rota_ids), list(velocidades), list(tempos_pouso), melhor_fitness
+                    
+                    imigrantes = [[] for _ in range(self.num_ilhas)]
+                    for origem, destino in enumerate(self._destinos_migracao()):
+                        imigrantes[destino].extend(resultados[origem][0])
+                    
+                    geracao += num_geracoes
+                    barra.update(num_geracoes)
+                    
+                    self.algoritmo.motivo_parada = criterio_parada.verificar(geracao, melhor_fitness)
+                    if self.algoritmo.motivo_parada is None and self.algoritmo.cancelamento.is_set():
+                        self.algoritmo.motivo_parada = MOTIVO_CANCELADO
+                    if self.algoritmo.motivo_parada is not None:
+                        break
+        finally:
+            for conexao in conexoes:
+                try:
+                    conexao.send(('encerrar',))
+                except (BrokenPipeError, OSError):
+                    pass
+                conexao.close()
+            for processo in processos:
+                processo.join()
+        
+        if melhor_individuo is None:
+            melhor_individuo = self.algoritmo.criar_individuo()
+        
+        yield self.algoritmo._polir_solucao(melhor_individuo, melhor_fitness)
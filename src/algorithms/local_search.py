@@ -0,0 +1,176 @@
+import numpy as np
+from collections import deque
+from typing import List, Optional
+from ..utils.calculations import find_crossings
+
+EPSILON = 1e-10
+
+class BuscaLocal:
+    def __init__(self, matriz_distancias: np.ndarray, vizinhos: np.ndarray,
+                 coords: Optional[np.ndarray] = None):
+        self.matriz_distancias = matriz_distancias
+        self.vizinhos = vizinhos
+        self.coords = coords
+    
+    def otimizar(self, rota_ids: List[int], max_movimentos: Optional[int] = None, 
+                 or_opt: bool = True, tamanho_max_segmento: int = 3) -> List[int]:
+        fechada = len(rota_ids) > 1 and rota_ids[0] == rota_ids[-1]
+        tour = np.array(rota_ids[:-1] if fechada else rota_ids, dtype=np.intp)
+        if len(tour) < 4:
+            return list(rota_ids)
+        
+        rota = self._otimizar_tour(tour, fechada, max_movimentos, or_opt, tamanho_max_segmento).tolist()
+        return rota + [rota[0]] if fechada else rota
+    
+    def otimizar_linha(self, linha: np.ndarray, max_movimentos: Optional[int] = None,
+                       or_opt: bool = True, tamanho_max_segmento: int = 3):
+        fechada = len(linha) > 1 and linha[0] == linha[-1]
+        tour = linha[:-1] if fechada else linha
+        self.movimentos = 0
+        if len(tour) < 4:
+            return
+        
+        otimizado = self._otimizar_tour(tour, fechada, max_movimentos, or_opt, tamanho_max_segmento)
+        if otimizado is not tour:
+            tour[:] = otimizado
+    
+    def _otimizar_tour(self, tour: np.ndarray, fechada: bool, max_movimentos: Optional[int],
+                       or_opt: bool, tamanho_max_segmento: int) -> np.ndarray:
+        m = len(tour)
+        self.tour = tour
+        self.m = m
+        self.fechada = fechada
+        self.pos = np.full(self.matriz_distancias.shape[0], -1, dtype=np.intp)
+        self.pos[tour] = np.arange(m)
+        self.fila = deque(tour.tolist())
+        self.na_fila = np.zeros(self.matriz_distancias.shape[0], dtype=bool)
+        self.na_fila[tour] = True
+        self.movimentos = 0
+        
+        while True:
+            while self.fila and not self._limite_atingido(max_movimentos):
+                no = self.fila.popleft()
+                self.na_fila[no] = False
+                if self._tentar_2opt(no) or (or_opt and self._tentar_or_opt(no, tamanho_max_segmento)):
+                    self.movimentos += 1
+                    self._ativar(no)
+            if self.coords is None or self._limite_atingido(max_movimentos) or not self._desfazer_cruzamento():
+                break
+            self.movimentos += 1
+        return self.tour
+    
+    def _limite_atingido(self, max_movimentos: Optional[int]) -> bool:
+        return max_movimentos is not None and self.movimentos >= max_movimentos
+    
+    def _desfazer_cruzamento(self) -> bool:
+        d = self.matriz_distancias
+        tour, m = self.tour, self.m
+        pontos = np.append(tour, tour[0]) if self.fechada else tour
+        for i, j in find_crossings(self.coords[pontos]).tolist():
+            a, b, c, e = tour[i], tour[i + 1], tour[j], tour[(j + 1) % m]
+            if d[a, c] + d[b, e] - d[a, b] - d[c, e] < -EPSILON:
+                self._inverter(i + 1, j)
+                self._ativar(a, b, c, e)
+                return True
+        return False
+    
+    def _ativar(self, *nos: int):
+        for no in nos:
+            if not self.na_fila[no]:
+                self.na_fila[no] = True
+                self.fila.append(no)
+    
+    def _aresta_fixa(self, indice: int) -> bool:
+        return not self.fechada and indice == self.m - 1
+    
+    def _inverter(self, inicio: int, fim: int):
+        self.tour[inicio:fim + 1] = self.tour[inicio:fim + 1][::-1].copy()
+        self.pos[self.tour[inicio:fim + 1]] = np.arange(inicio, fim + 1)
+    
+    def _tentar_2opt(self, a: int) -> bool:
+        d = self.matriz_distancias
+        tour, pos, m = self.tour, self.pos, self.m
+        pa = pos[a]
+        
+        for sentido in (1, -1):
+            aresta_a = pa if sentido == 1 else (pa - 1) % m
+            if self._aresta_fixa(aresta_a):
+                continue
+            a_viz = tour[(pa + sentido) % m]
+            d_a = d[a, a_viz]
+            
+            for c in self.vizinhos[a]:
+                pc = pos[c]
+                if pc < 0:
+                    continue
+                ganho = d_a - d[a, c]
+                if ganho <= EPSILON:
+                    break
+                
+                aresta_c = pc if sentido == 1 else (pc - 1) % m
+                if aresta_c == aresta_a or self._aresta_fixa(aresta_c):
+                    continue
+                c_viz = tour[(pc + sentido) % m]
+                if c_viz == a:
+                    continue
+                
+                delta = d[a, c] + d[a_viz, c_viz] - d_a - d[c, c_viz]
+                if delta < -EPSILON:
+                    inicio, fim = sorted((aresta_a, aresta_c))
+                    self._inverter(inicio + 1, fim)
+                    self._ativar(a_viz, c, c_viz)
+                    return True
+        return False
+    
+    def _tentar_or_opt(self, a: int, tamanho_max_segmento: int) -> bool:
+        d = self.matriz_distancias
+        tour, pos, m = self.tour, self.pos, self.m
+        limite = m - 1 if self.fechada else m - 2
+        inicio = pos[a]
+        if inicio < 1:
+            return False
+        
+        for tamanho in range(1, tamanho_max_segmento + 1):
+            fim = inicio + tamanho - 1
+            if fim > limite:
+                break
+            s1, s2 = tour[inicio], tour[fim]
+            anterior, seguinte = tour[inicio - 1], tour[(fim + 1) % m]
+            ganho_remocao = d[anterior, s1] + d[s2, seguinte] - d[anterior, seguinte]
+            if ganho_remocao <= EPSILON:
+                continue
+            
+            for extremo in (s1, s2):
+                for c in self.vizinhos[extremo]:
+                    pc = pos[c]
+                    if pc < 0:
+                        continue
+                    if d[extremo, c] >= ganho_remocao:
+                        break
+                    if inicio <= pc <= fim:
+                        continue
+                    
+                    for aresta in ((pc - 1) % m, pc):
+                        if self._aresta_fixa(aresta) or inicio - 1 <= aresta <= fim:
+                            continue
+                        u, v = tour[aresta], tour[(aresta + 1) % m]
+                        direto = d[u, s1] + d[s2, v]
+                        invertido = d[u, s2] + d[s1, v]
+                        delta = min(direto, invertido) - d[u, v] - ganho_remocao
+                        if delta < -EPSILON:
+                            self._mover_segmento(inicio, fim, aresta, invertido < direto)
+                            self._ativar(anterior, seguinte, s1, s2, u, v)
+                            return True
+        return False
+    
+    def _mover_segmento(self, inicio: int, fim: int, aresta: int, inverter: bool):
+        tour = self.tour
+        segmento = tour[inicio:fim + 1][::-1] if inverter else tour[inicio:fim + 1]
+        if aresta > fim:
+            novo = np.concatenate((tour[:inicio], tour[fim + 1:aresta + 1], segmento, tour[aresta + 1:]))
+            primeiro, ultimo = inicio, aresta
+        else:
+            novo = np.concatenate((tour[:aresta + 1], segmento, tour[aresta + 1:inicio], tour[fim + 1:]))
+            primeiro, ultimo = aresta + 1, fim
+        self.tour = novo
+        self.pos[novo[primeiro:ultimo + 1]] = np.arange(primeiro, ultimo + 1)
@@ -0,0 +1,118 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from ..utils.data_manager import GerenciadorDados
+from ..config import DRONE_CONFIG, OPERATION_CONFIG, LOWER_BOUND_CONFIG
+
+def calcular_gap(fitness: float, limite_inferior: float) -> float:
+    if not np.isfinite(fitness) or fitness <= 0:
+        return float('inf')
+    return max(0.0, (fitness - limite_inferior) / fitness)
+
+def arvore_1(distancias: np.ndarray, penalidades: np.ndarray) -> Tuple[float, np.ndarray]:
+    n = len(distancias)
+    graus = np.zeros(n, dtype=np.int64)
+    em_arvore = np.zeros(n, dtype=bool)
+    em_arvore[:2] = True
+    melhor = distancias[1] + penalidades[1] + penalidades
+    melhor[:2] = np.inf
+    pais = np.ones(n, dtype=np.intp)
+    custo = 0.0
+    for _ in range(n - 2):
+        no = int(np.argmin(melhor))
+        custo += melhor[no]
+        graus[no] += 1
+        graus[pais[no]] += 1
+        em_arvore[no] = True
+        melhor[no] = np.inf
+        custos = distancias[no] + penalidades[no] + penalidades
+        atualizar = ~em_arvore & (custos < melhor)
+        melhor[atualizar] = custos[atualizar]
+        pais[atualizar] = no
+    
+    custos_raiz = distancias[0, 1:] + penalidades[0] + penalidades[1:]
+    extremos = np.argpartition(custos_raiz, 1)[:2]
+    custo += custos_raiz[extremos].sum()
+    graus[extremos + 1] += 1
+    graus[0] = 2
+    return custo, graus
+
+def comprimento_vizinho_mais_proximo(distancias: np.ndarray) -> float:
+    n = len(distancias)
+    visitados = np.zeros(n, dtype=bool)
+    visitados[0] = True
+    atual = 0
+    comprimento = 0.0
+    for _ in range(n - 1):
+        custos = np.where(visitados, np.inf, distancias[atual])
+        proximo = int(np.argmin(custos))
+        comprimento += custos[proximo]
+        visitados[proximo] = True
+        atual = proximo
+    return comprimento + distancias[atual, 0]
+
+def limite_held_karp(distancias: np.ndarray, iteracoes: int = 100, paciencia: int = 10,
+                     limite_superior: Optional[float] = None) -> float:
+    n = len(distancias)
+    if n < 3:
+        return 2 * float(distancias[0, 1]) if n == 2 else 0.0
+    if limite_superior is None:
+        limite_superior = comprimento_vizinho_mais_proximo(distancias)
+    
+    penalidades = np.zeros(n, dtype=np.float64)
+    melhor_limite = -np.inf
+    fator = 2.0
+    sem_melhoria = 0
+    for _ in range(iteracoes):
+        custo, graus = arvore_1(distancias, penalidades)
+        limite = custo - 2 * penalidades.sum()
+        if limite > melhor_limite:
+            melhor_limite = limite
+            sem_melhoria = 0
+        else:
+            sem_melhoria += 1
+            if sem_melhoria >= paciencia:
+                fator /= 2
+                sem_melhoria = 0
+        
+        subgradiente = graus - 2
+        norma = float(subgradiente @ subgradiente)
+        if norma == 0 or limite_superior <= limite:
+            break
+        penalidades += fator * (limite_superior - limite) / norma * subgradiente
+    return float(melhor_limite)
+
+class LimiteInferior:
+    def __init__(self, gerenciador_dados: GerenciadorDados, config: Optional[Dict] = None):
+        self.gerenciador_dados = gerenciador_dados
+        self.config = {**LOWER_BOUND_CONFIG, **(config or {})}
+        self.drone_config = DRONE_CONFIG
+        self.operation_config = OPERATION_CONFIG
+        self.comprimento_minimo: Optional[float] = None
+        self.valor: Optional[float] = None
+    
+    def ids_tour(self) -> List[int]:
+        return [self.gerenciador_dados.obter_id_unibrasil()] + self.gerenciador_dados.obter_ids_excluindo_unibrasil()
+    
+    def velocidade_maxima_efetiva(self) -> float:
+        inicio, fim = self.operation_config['start_hour'], self.operation_config['end_hour']
+        dias = slice(1, self.operation_config['max_days'] + 1)
+        ventos = np.hypot(self.gerenciador_dados.vento_x[dias, inicio:fim],
+                          self.gerenciador_dados.vento_y[dias, inicio:fim])
+        return self.drone_config['max_speed'] + float(ventos.max(initial=0.0))
+    
+    def calcular(self, limite_superior: Optional[float] = None) -> Optional[float]:
+        if self.valor is not None:
+            return self.valor
+        ids = np.array(self.ids_tour(), dtype=np.intp)
+        if len(ids) > self.config['max_points']:
+            return None
+        
+        distancias = self.gerenciador_dados.matriz_distancias[np.ix_(ids, ids)]
+        self.comprimento_minimo = limite_held_karp(distancias, self.config['iterations'],
+                                                   self.config['patience'], limite_superior)
+        tempo_voo = self.comprimento_minimo / self.velocidade_maxima_efetiva() * 3600
+        self.valor = tempo_voo + len(ids) * self.drone_config['stop_consumption']
+        return self.valor
+    
+    def gap(self, fitness: float) -> Optional[float]:
+        return None if self.valor is None else calcular_gap(fitness, self.valor)
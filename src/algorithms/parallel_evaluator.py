@@ -0,0 +1,66 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from ..utils.data_manager import GerenciadorDados
+from ..core.validator import ValidadorSolucao
+from ..core.cost_calculator import CalculadorCusto
+from ..core.speed_optimizer import OtimizadorVelocidades
+
+_validador_worker: Optional[ValidadorSolucao] = None
+_calculador_worker: Optional[CalculadorCusto] = None
+_otimizador_worker: Optional[OtimizadorVelocidades] = None
+
+def _inicializar_worker(csv_file: str, faixas_bateria: Optional[int] = None):
+    global _validador_worker, _calculador_worker, _otimizador_worker
+    gerenciador_dados = GerenciadorDados(csv_file)
+    _validador_worker = ValidadorSolucao(gerenciador_dados)
+    _calculador_worker = CalculadorCusto(gerenciador_dados)
+    _otimizador_worker = OtimizadorVelocidades(gerenciador_dados, faixas_bateria)
+
+def _avaliar_lote(rotas_ids: np.ndarray, velocidades: np.ndarray, 
+                  tempos_pouso: np.ndarray) -> np.ndarray:
+    validos = _validador_worker.validar_populacao_ids(rotas_ids, velocidades, tempos_pouso)
+    fitness = _calculador_worker.calcular_custo_populacao(rotas_ids, velocidades, tempos_pouso)
+    fitness[~validos] = float('inf')
+    return fitness
+
+def _otimizar_rota(rota_ids: np.ndarray) -> Tuple[List[int], List[bool], float]:
+    return _otimizador_worker.otimizar(rota_ids.astype(np.intp))
+
+class AvaliadorParalelo:
+    def __init__(self, csv_file: str, workers: int, faixas_bateria: Optional[int] = None):
+        self.csv_file = csv_file
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers, 
+                                            initializer=_inicializar_worker,
+                                            initargs=(csv_file, faixas_bateria))
+    
+    def avaliar(self, rotas_ids: np.ndarray, velocidades: np.ndarray, 
+                tempos_pouso: np.ndarray) -> np.ndarray:
+        num_individuos = len(rotas_ids)
+        if num_individuos == 0:
+            return np.zeros(0, dtype=np.float64)
+        
+        tipo_rota = np.int16 if rotas_ids.max() < np.iinfo(np.int16).max else np.int32
+        rotas_ids = rotas_ids.astype(tipo_rota)
+        velocidades = velocidades.astype(np.uint8)
+        tempos_pouso = tempos_pouso.astype(bool)
+        
+        num_lotes = min(self.workers, num_individuos)
+        limites = np.linspace(0, num_individuos, num_lotes + 1).astype(int)
+        futuros = [self.executor.submit(_avaliar_lote, rotas_ids[inicio:fim], 
+                                        velocidades[inicio:fim], tempos_pouso[inicio:fim])
+                   for inicio, fim in zip(limites[:-1], limites[1:])]
+        return np.concatenate([futuro.result() for futuro in futuros])
+    
+    def otimizar_velocidades(self, rotas_ids: np.ndarray) -> List[Tuple[List[int], List[bool], float]]:
+        return list(self.executor.map(_otimizar_rota, rotas_ids))
+    
+    def fechar(self):
+        self.executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.fechar()
@@ -0,0 +1,70 @@
+import numpy as np
+from typing import List, Sequence, Tuple
+
+VELOCIDADES = np.arange(36, 97, 4)
+
+class Populacao:
+    def __init__(self, tamanho: int, num_pontos: int, max_id: int):
+        tipo_rota = np.int16 if max_id < np.iinfo(np.int16).max else np.int32
+        self.num_trechos = num_pontos - 1
+        self.max_id = max_id
+        self.rotas = np.zeros((tamanho, num_pontos), dtype=tipo_rota)
+        self.indices_velocidade = np.zeros((tamanho, self.num_trechos), dtype=np.uint8)
+        self.pousos = np.zeros((tamanho, (self.num_trechos + 7) // 8), dtype=np.uint8)
+    
+    @classmethod
+    def de_individuos(cls, individuos: Sequence[Tuple], max_id: int = None) -> 'Populacao':
+        num_pontos = len(individuos[0][0])
+        if max_id is None:
+            max_id = max(max(rota_ids) for rota_ids, _, _ in individuos)
+        populacao = cls(len(individuos), num_pontos, max_id)
+        for i, individuo in enumerate(individuos):
+            populacao.definir(i, individuo)
+        return populacao
+    
+    def vazia(self, tamanho: int) -> 'Populacao':
+        return Populacao(tamanho, self.num_trechos + 1, self.max_id)
+    
+    @staticmethod
+    def codificar_velocidades(velocidades: Sequence[float]) -> np.ndarray:
+        velocidades = np.asarray(velocidades, dtype=np.float64)
+        return np.abs(velocidades[..., None] - VELOCIDADES).argmin(axis=-1).astype(np.uint8)
+    
+    @staticmethod
+    def velocidades_na_grade(velocidades: Sequence[float]) -> bool:
+        return bool(np.isin(np.asarray(velocidades), VELOCIDADES).all())
+    
+    def __len__(self) -> int:
+        return len(self.rotas)
+    
+    def __getitem__(self, indice: int) -> Tuple[List[int], List[int], List[bool]]:
+        return (self.rotas[indice].tolist(),
+                VELOCIDADES[self.indices_velocidade[indice]].tolist(),
+                self.tempos_pouso_linha(indice).tolist())
+    
+    def definir(self, indice: int, individuo: Tuple):
+        rota_ids, velocidades, tempos_pouso = individuo
+        if len(rota_ids) != self.num_trechos + 1 or len(velocidades) != self.num_trechos or \
+                len(tempos_pouso) != self.num_trechos:
+            raise ValueError("Indivíduo com tamanho diferente da população")
+        self.rotas[indice] = rota_ids
+        self.indices_velocidade[indice] = self.codificar_velocidades(velocidades)
+        self.pousos[indice] = np.packbits(np.asarray(tempos_pouso, dtype=bool))
+    
+    def copiar_linha(self, destino: int, origem: 'Populacao', indice: int):
+        self.rotas[destino] = origem.rotas[indice]
+        self.indices_velocidade[destino] = origem.indices_velocidade[indice]
+        self.pousos[destino] = origem.pousos[indice]
+    
+    def tempos_pouso_linha(self, indice: int) -> np.ndarray:
+        return np.unpackbits(self.pousos[indice], count=self.num_trechos).astype(bool)
+    
+    def velocidades(self) -> np.ndarray:
+        return VELOCIDADES[self.indices_velocidade]
+    
+    def tempos_pouso(self) -> np.ndarray:
+        return np.unpackbits(self.pousos, axis=1, count=self.num_trechos).astype(bool)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.rotas.nbytes + self.indices_velocidade.nbytes + self.pousos.nbytes
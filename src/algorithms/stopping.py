@@ -0,0 +1,84 @@
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional
+from .lower_bound import calcular_gap
+
+MOTIVO_GERACOES = 'geracoes'
+MOTIVO_ESTAGNACAO = 'estagnacao'
+MOTIVO_MELHORIA_MINIMA = 'melhoria_minima'
+MOTIVO_FITNESS_ALVO = 'fitness_alvo'
+MOTIVO_TEMPO_LIMITE = 'tempo_limite'
+MOTIVO_CANCELADO = 'cancelado'
+MOTIVO_GAP = 'gap_otimalidade'
+
+class CriterioParada:
+    def __init__(self, config: Dict, max_geracoes: int):
+        self.max_geracoes = max_geracoes
+        self.geracoes_estagnacao = config.get('stagnation_generations')
+        self.melhoria_minima = config.get('min_relative_improvement')
+        self.janela_melhoria = config.get('improvement_window', 20)
+        self.fitness_alvo = config.get('target_fitness')
+        self.tempo_limite = config.get('time_budget')
+        self.gap_alvo = config.get('optimality_gap')
+        self.limite_inferior: Optional[float] = None
+        self.iniciar()
+    
+    def iniciar(self):
+        self.inicio = time.perf_counter()
+        self.melhor_fitness = float('inf')
+        self.geracao_ultima_melhoria = 0
+        self.geracoes_historico: List[int] = []
+        self.fitness_historico: List[float] = []
+    
+    def exportar_estado(self) -> Dict:
+        return {
+            'tempo_decorrido': self.tempo_decorrido(),
+            'melhor_fitness': self.melhor_fitness,
+            'geracao_ultima_melhoria': self.geracao_ultima_melhoria,
+            'geracoes_historico': list(self.geracoes_historico),
+            'fitness_historico': list(self.fitness_historico),
+        }
+    
+    def restaurar_estado(self, estado: Dict):
+        self.inicio = time.perf_counter() - estado['tempo_decorrido']
+        self.melhor_fitness = estado['melhor_fitness']
+        self.geracao_ultima_melhoria = estado['geracao_ultima_melhoria']
+        self.geracoes_historico = list(estado['geracoes_historico'])
+        self.fitness_historico = list(estado['fitness_historico'])
+    
+    def tempo_decorrido(self) -> float:
+        return time.perf_counter() - self.inicio
+    
+    def verificar(self, geracoes_concluidas: int, melhor_fitness: float) -> Optional[str]:
+        if melhor_fitness < self.melhor_fitness:
+            self.melhor_fitness = melhor_fitness
+            self.geracao_ultima_melhoria = geracoes_concluidas
+        self.geracoes_historico.append(geracoes_concluidas)
+        self.fitness_historico.append(melhor_fitness)
+        
+        if self.fitness_alvo is not None and melhor_fitness <= self.fitness_alvo:
+            return MOTIVO_FITNESS_ALVO
+        
+        if (self.gap_alvo is not None and self.limite_inferior is not None and
+                calcular_gap(melhor_fitness, self.limite_inferior) <= self.gap_alvo):
+            return MOTIVO_GAP
+        
+        if self.tempo_limite is not None and self.tempo_decorrido() >= self.tempo_limite:
+            return MOTIVO_TEMPO_LIMITE
+        
+        if (self.geracoes_estagnacao is not None and 
+                geracoes_concluidas - self.geracao_ultima_melhoria >= self.geracoes_estagnacao):
+            return MOTIVO_ESTAGNACAO
+        
+        if self.melhoria_minima is not None and geracoes_concluidas >= self.janela_melhoria:
+            posicao = bisect_right(self.geracoes_historico, geracoes_concluidas - self.janela_melhoria) - 1
+            fitness_anterior = self.fitness_historico[posicao] if posicao >= 0 else float('inf')
+            if fitness_anterior != float('inf') and fitness_anterior > 0:
+                melhoria = (fitness_anterior - melhor_fitness) / fitness_anterior
+                if melhoria < self.melhoria_minima:
+                    return MOTIVO_MELHORIA_MINIMA
+        
+        if geracoes_concluidas >= self.max_geracoes:
+            return MOTIVO_GERACOES
+        
+        return None
@@ -0,0 +1,147 @@
+import json
+import math
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PREFIXO_METRICAS = "drone_route"
+
+METRICAS_PROMETHEUS = (
+    ('generation', 'Geração atual do algoritmo genético'),
+    ('best_fitness', 'Melhor fitness encontrado até a geração atual'),
+    ('mean_fitness', 'Fitness médio da população na geração atual'),
+    ('optimality_gap', 'Gap relativo entre o melhor fitness e o limite inferior Held-Karp'),
+    ('generations_since_improvement', 'Gerações desde a última melhoria do melhor fitness'),
+    ('cache_hit_rate', 'Taxa de acertos do cache de fitness'),
+    ('evaluations_per_second', 'Avaliações de indivíduos por segundo desde o início'),
+    ('two_opt_moves', 'Movimentos de busca local 2-opt/Or-opt aplicados'),
+    ('peak_rss_bytes', 'Pico de memória residente do processo em bytes'),
+    ('elapsed_seconds', 'Tempo decorrido desde o início da execução'),
+)
+
+def pico_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+def _criar_diretorio(caminho: str):
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+
+class EscritorAssincrono(ABC):
+    def __init__(self, caminho: str, intervalo_flush: float = 1.0):
+        self.caminho = caminho
+        self.intervalo_flush = intervalo_flush
+        self._pendentes: List[Dict] = []
+        self._trava = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._laco, name=type(self).__name__, daemon=True)
+        self._thread.start()
+    
+    def registrar(self, registro: Dict):
+        with self._trava:
+            self._pendentes.append(registro)
+    
+    def _laco(self):
+        while not self._parar.wait(self.intervalo_flush):
+            self.flush()
+        self.flush()
+    
+    def flush(self):
+        with self._trava:
+            registros, self._pendentes = self._pendentes, []
+        if registros:
+            self._escrever(registros)
+    
+    @abstractmethod
+    def _escrever(self, registros: List[Dict]):
+        pass
+    
+    def fechar(self):
+        self._parar.set()
+        self._thread.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.fechar()
+        return False
+
+class EscritorJSONL(EscritorAssincrono):
+    def __init__(self, caminho: str, intervalo_flush: float = 1.0):
+        _criar_diretorio(caminho)
+        self._arquivo = open(caminho, "a", encoding="utf-8")
+        try:
+            super().__init__(caminho, intervalo_flush)
+        except BaseException:
+            self._arquivo.close()
+            raise
+    
+    def _escrever(self, registros: List[Dict]):
+        self._arquivo.write("".join(json.dumps(_valores_finitos(registro)) + "\n" for registro in registros))
+        self._arquivo.flush()
+    
+    def fechar(self):
+        super().fechar()
+        self._arquivo.close()
+
+def _valores_finitos(registro: Dict) -> Dict:
+    return {chave: None if isinstance(valor, float) and not math.isfinite(valor) else valor
+            for chave, valor in registro.items()}
+
+class ExportadorPrometheus(EscritorAssincrono):
+    def __init__(self, caminho: str, intervalo_flush: float = 1.0):
+        _criar_diretorio(caminho)
+        super().__init__(caminho, intervalo_flush)
+    
+    def _escrever(self, registros: List[Dict]):
+        temporario = f"{self.caminho}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            arquivo.write(formatar_prometheus(registros[-1]))
+        os.replace(temporario, self.caminho)
+
+def formatar_prometheus(registro: Dict) -> str:
+    linhas = []
+    for nome, descricao in METRICAS_PROMETHEUS:
+        valor = registro.get(nome)
+        if valor is None:
+            continue
+        metrica = f"{PREFIXO_METRICAS}_{nome}"
+        linhas.append(f"# HELP {metrica} {descricao}")
+        linhas.append(f"# TYPE {metrica} gauge")
+        linhas.append(f"{metrica} {_formatar_valor(valor)}")
+    return "\n".join(linhas) + "\n"
+
+def _formatar_valor(valor: float) -> str:
+    if math.isinf(valor):
+        return "+Inf" if valor > 0 else "-Inf"
+    if math.isnan(valor):
+        return "NaN"
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+def criar_escritores(caminho_jsonl: Optional[str], caminho_metricas: Optional[str],
+                     intervalo_flush: float = 1.0) -> List[EscritorAssincrono]:
+    escritores: List[EscritorAssincrono] = []
+    try:
+        if caminho_jsonl:
+            escritores.append(EscritorJSONL(caminho_jsonl, intervalo_flush))
+        if caminho_metricas:
+            escritores.append(ExportadorPrometheus(caminho_metricas, intervalo_flush))
+    except BaseException:
+        fechar_escritores(escritores)
+        raise
+    return escritores
+
+def fechar_escritores(escritores: List[EscritorAssincrono]):
+    for escritor in escritores:
+        escritor.fechar()
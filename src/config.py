@@ -21,6 +21,58 @@ GENETIC_CONFIG = {
     'crossover_rate': 0.8,
     'elite_size': 10,
     'tournament_size': 5,
+    'workers': 1,
+    'fitness_cache_size': 2048,
+    'neighbor_k': 8,
+    'crossover_operator': 'ox',
+    'permutations_only': False,
+    'battery_bins': 32,
+    'stagnation_generations': None,
+    'min_relative_improvement': None,
+    'improvement_window': 20,
+    'target_fitness': None,
+    'time_budget': None,
+    'checkpoint_path': None,
+    'checkpoint_interval': 10,
+    'instrumentation': False,
+    'telemetry_jsonl': None,
+    'metrics_textfile': None,
+    'telemetry_flush_interval': 1.0,
+    'optimality_gap': None,
+}
+
+ISLAND_CONFIG = {
+    'islands': 1,
+    'migration_interval': 10,
+    'migrants': 2,
+    'topology': 'ring',
+}
+
+DECOMPOSITION_CONFIG = {
+    'min_points': 2000,
+    'cluster_size': 150,
+    'boundary_window': 15,
+    'neighbor_k': 8,
+    'workers': 1,
+}
+
+LOWER_BOUND_CONFIG = {
+    'enabled': False,
+    'iterations': 100,
+    'patience': 10,
+    'max_points': 4096,
+}
+
+DATASET_CACHE_CONFIG = {
+    'enabled': False,
+    'directory': '.cache',
+}
+
+DAILY_PLAN_CONFIG = {
+    'enabled': False,
+    'rounds': 3,
+    'neighbor_k': 8,
+    'workers': 1,
 }
 
 WEATHER_DATA = {
@@ -1,12 +1,22 @@
 import math
-from typing import List, Tuple, Dict
+import numpy as np
+from typing import List, Tuple, Dict, NamedTuple, Optional, Sequence
 from ..utils.calculations import (
-    haversine_distance, calculate_flight_angle, 
-    calculate_effective_speed, calculate_autonomy
+    calculate_autonomy, calculate_autonomy_array,
+    calculate_effective_speed_vector, calculate_effective_speed_vector_array
 )
 from ..utils.data_manager import GerenciadorDados
 from ..config import DRONE_CONFIG, OPERATION_CONFIG
 
+class EstadoSimulacao(NamedTuple):
+    bateria: float
+    dia: int
+    hora: int
+    minuto: int
+    segundo: int
+    tempo_total: int
+    custo_total: float
+
 class CalculadorCusto:
     def __init__(self, gerenciador_dados: GerenciadorDados):
         self.gerenciador_dados = gerenciador_dados
@@ -14,210 +24,254 @@ class CalculadorCusto:
         self.operation_config = OPERATION_CONFIG
     
     def calcular_custo_rota(self, rota: List[str], velocidades: List[int], 
-                          tempos_pouso: List[bool]) -> Tuple[float, Dict]:
-        tempo_total = 0
-        custo_total = 0
-        bateria_atual = calculate_autonomy(velocidades[0], 
-                                         self.drone_config['base_autonomy'],
-                                         self.drone_config['autonomy_correction'])
-        dia_atual = 1
-        hora_atual = self.operation_config['start_hour']
-        minuto_atual = 0
-        segundo_atual = 0
-        
-        info_rota = []
+                          tempos_pouso: List[bool], detail: bool = True) -> Tuple[float, Dict]:
+        rota_ids = self.gerenciador_dados.converter_rota_para_ids(rota)
+        if any(id_cep < 0 for id_cep in rota_ids):
+            return float('inf'), {"error": "CEP desconhecido na rota"}
+        return self.calcular_custo_rota_ids(rota_ids, velocidades, tempos_pouso, detail)
+    
+    def calcular_custo_rota_ids(self, rota_ids: List[int], velocidades: List[int], 
+                               tempos_pouso: List[bool], detail: bool = True) -> Tuple[float, Dict]:
+        info_rota = [] if detail else None
+        estado_final = self._simular_trechos(rota_ids, velocidades, tempos_pouso, 
+                                             self._estado_inicial(velocidades), 0, info_rota=info_rota)
+        if estado_final is None:
+            return float('inf'), {"error": "Excedeu prazo de 7 dias"}
         
-        for i in range(len(rota) - 1):
-            cep_inicial = rota[i]
-            cep_final = rota[i + 1]
-            velocidade = velocidades[i]
-            pouso = tempos_pouso[i]
-            
-            coords_inicial = self.gerenciador_dados.obter_coords_cep(cep_inicial)
-            coords_final = self.gerenciador_dados.obter_coords_cep(cep_final)
-            
-            distancia = haversine_distance(coords_inicial, coords_final)
-            
-            angulo_voo = calculate_flight_angle(coords_inicial, coords_final)
-            
-            velocidade_vento, direcao_vento = self.gerenciador_dados.obter_clima_por_horario(dia_atual, hora_atual)
-            
-            velocidade_efetiva = calculate_effective_speed(velocidade, velocidade_vento, direcao_vento, angulo_voo)
-            
-            tempo_voo = math.ceil(distancia / velocidade_efetiva * 3600)
-            
-            autonomia = calculate_autonomy(velocidade, 
-                                       self.drone_config['base_autonomy'],
-                                       self.drone_config['autonomy_correction'])
-            consumo_bateria = tempo_voo * (self.drone_config['base_autonomy'] / autonomia)
-            
-            if bateria_atual < consumo_bateria + self.drone_config['stop_consumption']:
-                pouso = True
-                bateria_atual = calculate_autonomy(velocidade,
-                                                 self.drone_config['base_autonomy'],
-                                                 self.drone_config['autonomy_correction'])
-                custo_total += self.drone_config['landing_cost'] if hora_atual >= 17 else 0
-            else:
-                bateria_atual -= consumo_bateria
-            
-            if pouso:
-                bateria_atual -= self.drone_config['stop_consumption']
-                custo_total += self.drone_config['landing_cost'] if hora_atual >= 17 else 0
-            else:
-                bateria_atual -= self.drone_config['stop_consumption']
-            
-            dia_inicio = dia_atual
-            hora_inicio = hora_atual
-            minuto_inicio = minuto_atual
-            segundo_inicio = segundo_atual
-            
-            tempo_total += tempo_voo + self.drone_config['stop_consumption']
-            
-            total_segundos = tempo_voo + self.drone_config['stop_consumption']
-            segundo_fim = segundo_atual + total_segundos
-            minuto_fim = minuto_atual + segundo_fim // 60
-            hora_fim = hora_atual + minuto_fim // 60
-            dia_fim = dia_atual
-            
-            segundo_fim = segundo_fim % 60
-            minuto_fim = minuto_fim % 60
-            
-            if hora_fim >= self.operation_config['end_hour']:
-                dia_fim += 1
-                hora_fim = self.operation_config['start_hour']
-                if dia_fim > self.operation_config['max_days']:
-                    return float('inf'), {"error": "Excedeu prazo de 7 dias"}
-            
-            dia_atual = dia_fim
-            hora_atual = hora_fim
-            minuto_atual = minuto_fim
-            segundo_atual = segundo_fim
-            
-            info_rota.append({
-                'start_cep': cep_inicial,
-                'start_coords': coords_inicial,
-                'day': dia_inicio,
-                'start_hour': hora_inicio,
-                'start_minute': minuto_inicio,
-                'start_second': segundo_inicio,
-                'speed': velocidade,
-                'end_cep': cep_final,
-                'end_coords': coords_final,
-                'landing': pouso,
-                'end_day': dia_fim,
-                'end_hour': hora_fim,
-                'end_minute': minuto_fim,
-                'end_second': segundo_fim
-            })
+        fitness = estado_final.tempo_total + estado_final.custo_total * 10
+        if not detail:
+            return fitness, {}
         
-        return tempo_total + custo_total * 10, {
+        return fitness, {
             "route_info": info_rota, 
-            "total_time": tempo_total, 
-            "total_cost": custo_total
+            "total_time": estado_final.tempo_total, 
+            "total_cost": estado_final.custo_total
         }
     
-    def calcular_custo_rota_ids(self, rota_ids: List[int], velocidades: List[int], 
-                               tempos_pouso: List[bool]) -> Tuple[float, Dict]:
-        tempo_total = 0
-        custo_total = 0
-        bateria_atual = calculate_autonomy(velocidades[0], 
-                                         self.drone_config['base_autonomy'],
-                                         self.drone_config['autonomy_correction'])
-        dia_atual = 1
-        hora_atual = self.operation_config['start_hour']
-        minuto_atual = 0
-        segundo_atual = 0
+    def calcular_fitness_ids(self, rota_ids: List[int], velocidades: List[int], 
+                             tempos_pouso: List[bool]) -> float:
+        estado_final = self._simular_trechos(rota_ids, velocidades, tempos_pouso, 
+                                             self._estado_inicial(velocidades), 0)
+        if estado_final is None:
+            return float('inf')
+        return estado_final.tempo_total + estado_final.custo_total * 10
+    
+    def calcular_custo_populacao(self, rotas_ids: np.ndarray, velocidades: np.ndarray, 
+                                 tempos_pouso: np.ndarray) -> np.ndarray:
+        rotas_ids = np.asarray(rotas_ids, dtype=np.intp)
+        velocidades = np.asarray(velocidades, dtype=np.float64)
+        tempos_pouso = np.asarray(tempos_pouso, dtype=bool)
+        num_individuos, num_pontos = rotas_ids.shape
+        
+        base_autonomy = self.drone_config['base_autonomy']
+        correction = self.drone_config['autonomy_correction']
+        stop_consumption = self.drone_config['stop_consumption']
+        landing_cost = self.drone_config['landing_cost']
+        start_hour = self.operation_config['start_hour']
+        end_hour = self.operation_config['end_hour']
+        
+        if num_individuos == 0 or num_pontos < 2:
+            return np.zeros(num_individuos, dtype=np.float64)
+        
+        matriz_distancias = self.gerenciador_dados.matriz_distancias
+        matriz_senos = self.gerenciador_dados.matriz_senos
+        matriz_cossenos = self.gerenciador_dados.matriz_cossenos
+        vento_x = self.gerenciador_dados.vento_x
+        vento_y = self.gerenciador_dados.vento_y
+        ultimo_dia_clima = vento_x.shape[0] - 1
+        
+        autonomias = calculate_autonomy_array(velocidades, base_autonomy, correction)
+        
+        tempo_total = np.zeros(num_individuos, dtype=np.int64)
+        custo_total = np.zeros(num_individuos, dtype=np.float64)
+        bateria_atual = autonomias[:, 0].copy()
+        dia_atual = np.ones(num_individuos, dtype=np.int64)
+        hora_atual = np.full(num_individuos, start_hour, dtype=np.int64)
+        minuto_atual = np.zeros(num_individuos, dtype=np.int64)
+        segundo_atual = np.zeros(num_individuos, dtype=np.int64)
+        excedeu_prazo = np.zeros(num_individuos, dtype=bool)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i in range(num_pontos - 1):
+                ids_inicial = rotas_ids[:, i]
+                ids_final = rotas_ids[:, i + 1]
+                
+                distancia = matriz_distancias[ids_inicial, ids_final]
+                
+                indice_dia = np.minimum(dia_atual, ultimo_dia_clima)
+                indice_hora = np.minimum(hora_atual, 23)
+                velocidade_efetiva = calculate_effective_speed_vector_array(
+                    velocidades[:, i], matriz_senos[ids_inicial, ids_final], matriz_cossenos[ids_inicial, ids_final],
+                    vento_x[indice_dia, indice_hora], vento_y[indice_dia, indice_hora])
+                
+                tempo_voo = np.ceil(distancia / velocidade_efetiva * 3600).astype(np.int64)
+                consumo_bateria = tempo_voo * (base_autonomy / autonomias[:, i])
+                
+                pouso_forcado = bateria_atual < consumo_bateria + stop_consumption
+                pouso = tempos_pouso[:, i] | pouso_forcado
+                custo_pouso = np.where(hora_atual >= 17, landing_cost, 0.0)
+                
+                bateria_atual = np.where(pouso_forcado, autonomias[:, i], bateria_atual - consumo_bateria)
+                bateria_atual -= stop_consumption
+                custo_total += custo_pouso * pouso_forcado + custo_pouso * pouso
+                
+                total_segundos = tempo_voo + stop_consumption
+                tempo_total += total_segundos
+                
+                segundo_fim = segundo_atual + total_segundos
+                minuto_fim = minuto_atual + segundo_fim // 60
+                hora_fim = hora_atual + minuto_fim // 60
+                
+                segundo_atual = segundo_fim % 60
+                minuto_atual = minuto_fim % 60
+                
+                virou_dia = hora_fim >= end_hour
+                dia_atual = dia_atual + virou_dia
+                hora_atual = np.where(virou_dia, start_hour, hora_fim)
+                excedeu_prazo |= dia_atual > self.operation_config['max_days']
+        
+        fitness = tempo_total + custo_total * 10
+        fitness[excedeu_prazo] = float('inf')
+        return fitness
+    
+    def simular_com_checkpoints(self, rota_ids: List[int], velocidades: List[int], 
+                                tempos_pouso: List[bool]) -> Tuple[float, List[EstadoSimulacao]]:
+        return self._simular_a_partir_de(rota_ids, velocidades, tempos_pouso, 
+                                         [self._estado_inicial(velocidades)])
+    
+    def calcular_custo_incremental(self, rota_ids: List[int], velocidades: List[int], 
+                                   tempos_pouso: List[bool], checkpoints: List[EstadoSimulacao],
+                                   primeiro_trecho: int) -> Tuple[float, List[EstadoSimulacao]]:
+        if primeiro_trecho <= 0:
+            return self.simular_com_checkpoints(rota_ids, velocidades, tempos_pouso)
+        
+        if primeiro_trecho >= len(checkpoints):
+            if len(checkpoints) < len(rota_ids):
+                return float('inf'), checkpoints
+            primeiro_trecho = len(checkpoints) - 1
+        
+        return self._simular_a_partir_de(rota_ids, velocidades, tempos_pouso, 
+                                         checkpoints[:primeiro_trecho + 1])
+    
+    @staticmethod
+    def primeiro_trecho_alterado(individuo_base: Tuple[Sequence[int], Sequence[int], Sequence[bool]],
+                                 individuo_novo: Tuple[Sequence[int], Sequence[int], Sequence[bool]]) -> int:
+        rota_base, velocidades_base, pousos_base = (np.asarray(genes) for genes in individuo_base)
+        rota_nova, velocidades_novas, pousos_novos = (np.asarray(genes) for genes in individuo_novo)
+        if rota_base.shape != rota_nova.shape:
+            return 0
         
-        info_rota = []
+        num_trechos = len(rota_nova) - 1
+        primeiro = num_trechos
+        for base, novo, deslocamento in ((rota_base, rota_nova, 1), 
+                                         (velocidades_base, velocidades_novas, 0),
+                                         (pousos_base, pousos_novos, 0)):
+            diferencas = np.flatnonzero(base != novo)
+            if len(diferencas):
+                primeiro = min(primeiro, max(int(diferencas[0]) - deslocamento, 0))
+        return primeiro
+    
+    def _estado_inicial(self, velocidades: List[int]) -> EstadoSimulacao:
+        return EstadoSimulacao(
+            calculate_autonomy(velocidades[0], 
+                               self.drone_config['base_autonomy'],
+                               self.drone_config['autonomy_correction']),
+            1, self.operation_config['start_hour'], 0, 0, 0, 0)
+    
+    def _simular_a_partir_de(self, rota_ids: List[int], velocidades: List[int], 
+                             tempos_pouso: List[bool], 
+                             checkpoints: List[EstadoSimulacao]) -> Tuple[float, List[EstadoSimulacao]]:
+        estado_final = self._simular_trechos(rota_ids, velocidades, tempos_pouso, checkpoints[-1],
+                                             len(checkpoints) - 1, checkpoints=checkpoints)
+        if estado_final is None:
+            return float('inf'), checkpoints
+        return estado_final.tempo_total + estado_final.custo_total * 10, checkpoints
+    
+    def _simular_trechos(self, rota_ids: List[int], velocidades: List[int], tempos_pouso: List[bool],
+                         estado: EstadoSimulacao, primeiro_trecho: int,
+                         checkpoints: Optional[List[EstadoSimulacao]] = None,
+                         info_rota: Optional[List[Dict]] = None) -> Optional[EstadoSimulacao]:
+        base_autonomy = self.drone_config['base_autonomy']
+        correction = self.drone_config['autonomy_correction']
+        stop_consumption = self.drone_config['stop_consumption']
+        landing_cost = self.drone_config['landing_cost']
+        start_hour = self.operation_config['start_hour']
+        end_hour = self.operation_config['end_hour']
+        max_days = self.operation_config['max_days']
+        distancias, senos, cossenos = (geometria.tolist() for geometria in
+                                       self.gerenciador_dados.obter_geometria_trechos(rota_ids[primeiro_trecho:]))
+        tabela_vento = self.gerenciador_dados.tabela_vento
+        ultimo_dia_clima = len(tabela_vento) - 1
+        
+        bateria_atual, dia_atual, hora_atual, minuto_atual, segundo_atual, tempo_total, custo_total = estado
         
-        for i in range(len(rota_ids) - 1):
+        for i in range(primeiro_trecho, len(rota_ids) - 1):
             id_inicial = rota_ids[i]
             id_final = rota_ids[i + 1]
             velocidade = velocidades[i]
             pouso = tempos_pouso[i]
             
-            coords_inicial = self.gerenciador_dados.obter_coords_por_id(id_inicial)
-            coords_final = self.gerenciador_dados.obter_coords_por_id(id_final)
-            
-            distancia = haversine_distance(coords_inicial, coords_final)
-            
-            angulo_voo = calculate_flight_angle(coords_inicial, coords_final)
-            
-            velocidade_vento, direcao_vento = self.gerenciador_dados.obter_clima_por_horario(dia_atual, hora_atual)
-            
-            velocidade_efetiva = calculate_effective_speed(velocidade, velocidade_vento, direcao_vento, angulo_voo)
+            distancia = distancias[i - primeiro_trecho]
+            vento_x, vento_y = tabela_vento[min(dia_atual, ultimo_dia_clima)][min(hora_atual, 23)]
+            velocidade_efetiva = calculate_effective_speed_vector(
+                velocidade, senos[i - primeiro_trecho], cossenos[i - primeiro_trecho], vento_x, vento_y)
             
             tempo_voo = math.ceil(distancia / velocidade_efetiva * 3600)
+            autonomia = calculate_autonomy(velocidade, base_autonomy, correction)
+            consumo_bateria = tempo_voo * (base_autonomy / autonomia)
             
-            autonomia = calculate_autonomy(velocidade, 
-                                       self.drone_config['base_autonomy'],
-                                       self.drone_config['autonomy_correction'])
-            consumo_bateria = tempo_voo * (self.drone_config['base_autonomy'] / autonomia)
-            
-            if bateria_atual < consumo_bateria + self.drone_config['stop_consumption']:
+            if bateria_atual < consumo_bateria + stop_consumption:
                 pouso = True
-                bateria_atual = calculate_autonomy(velocidade,
-                                                 self.drone_config['base_autonomy'],
-                                                 self.drone_config['autonomy_correction'])
-                custo_total += self.drone_config['landing_cost'] if hora_atual >= 17 else 0
+                bateria_atual = autonomia
+                custo_total += landing_cost if hora_atual >= 17 else 0
             else:
                 bateria_atual -= consumo_bateria
             
             if pouso:
-                bateria_atual -= self.drone_config['stop_consumption']
-                custo_total += self.drone_config['landing_cost'] if hora_atual >= 17 else 0
-            else:
-                bateria_atual -= self.drone_config['stop_consumption']
+                custo_total += landing_cost if hora_atual >= 17 else 0
+            bateria_atual -= stop_consumption
             
             dia_inicio = dia_atual
             hora_inicio = hora_atual
             minuto_inicio = minuto_atual
             segundo_inicio = segundo_atual
             
-            tempo_total += tempo_voo + self.drone_config['stop_consumption']
+            total_segundos = tempo_voo + stop_consumption
+            tempo_total += total_segundos
             
-            total_segundos = tempo_voo + self.drone_config['stop_consumption']
             segundo_fim = segundo_atual + total_segundos
             minuto_fim = minuto_atual + segundo_fim // 60
-            hora_fim = hora_atual + minuto_fim // 60
-            dia_fim = dia_atual
-            
-            segundo_fim = segundo_fim % 60
-            minuto_fim = minuto_fim % 60
-            
-            if hora_fim >= self.operation_config['end_hour']:
-                dia_fim += 1
-                hora_fim = self.operation_config['start_hour']
-                if dia_fim > self.operation_config['max_days']:
-                    return float('inf'), {"error": "Excedeu prazo de 7 dias"}
-            
-            dia_atual = dia_fim
-            hora_atual = hora_fim
-            minuto_atual = minuto_fim
-            segundo_atual = segundo_fim
-            
-            cep_inicial = self.gerenciador_dados.obter_cep_por_id(id_inicial)
-            cep_final = self.gerenciador_dados.obter_cep_por_id(id_final)
-            
-            info_rota.append({
-                'start_cep': cep_inicial,
-                'start_coords': coords_inicial,
-                'day': dia_inicio,
-                'start_hour': hora_inicio,
-                'start_minute': minuto_inicio,
-                'start_second': segundo_inicio,
-                'speed': velocidade,
-                'end_cep': cep_final,
-                'end_coords': coords_final,
-                'landing': pouso,
-                'end_day': dia_fim,
-                'end_hour': hora_fim,
-                'end_minute': minuto_fim,
-                'end_second': segundo_fim
-            })
+            hora_atual = hora_atual + minuto_fim // 60
+            segundo_atual = segundo_fim % 60
+            minuto_atual = minuto_fim % 60
+            
+            if hora_atual >= end_hour:
+                dia_atual += 1
+                hora_atual = start_hour
+                if dia_atual > max_days:
+                    return None
+            
+            if checkpoints is not None:
+                checkpoints.append(EstadoSimulacao(bateria_atual, dia_atual, hora_atual, minuto_atual,
+                                                   segundo_atual, tempo_total, custo_total))
+            
+            if info_rota is not None:
+                info_rota.append({
+                    'start_cep': self.gerenciador_dados.obter_cep_por_id(id_inicial),
+                    'start_coords': self.gerenciador_dados.obter_coords_por_id(id_inicial),
+                    'day': dia_inicio,
+                    'start_hour': hora_inicio,
+                    'start_minute': minuto_inicio,
+                    'start_second': segundo_inicio,
+                    'speed': velocidade,
+                    'end_cep': self.gerenciador_dados.obter_cep_por_id(id_final),
+                    'end_coords': self.gerenciador_dados.obter_coords_por_id(id_final),
+                    'landing': pouso,
+                    'end_day': dia_atual,
+                    'end_hour': hora_atual,
+                    'end_minute': minuto_atual,
+                    'end_second': segundo_atual
+                })
         
-        return tempo_total + custo_total * 10, {
-            "route_info": info_rota, 
-            "total_time": tempo_total, 
-            "total_cost": custo_total
-        }
\ No newline at end of file
+        return EstadoSimulacao(bateria_atual, dia_atual, hora_atual, minuto_atual,
+                               segundo_atual, tempo_total, custo_total)
@@ -1,32 +1,68 @@
-from typing import List, Tuple
+from typing import AsyncIterator, Callable, Iterator, List, Tuple, Optional
 from datetime import datetime
 import os
 from ..utils.data_manager import GerenciadorDados
 from ..core.validator import ValidadorSolucao
 from ..core.cost_calculator import CalculadorCusto
 from ..algorithms.genetic_algorithm import AlgoritmoGenetico
+from ..algorithms.decomposition import SolucionadorDecomposicao
+from ..algorithms.daily_planner import PlanejadorDiario
+from ..algorithms.anytime import iterar_em_thread
 from ..utils.report_generator import GeradorRelatorio
 from ..visualization.route_plotter import PlotadorRota
-from ..config import DRONE_CONFIG, OPERATION_CONFIG
+from ..config import DRONE_CONFIG, OPERATION_CONFIG, DECOMPOSITION_CONFIG, DAILY_PLAN_CONFIG
 
 class GerenciadorRota:
-    def __init__(self, csv_file: str = "data/coordenadas.csv"):
+    def __init__(self, csv_file: str = "data/coordenadas.csv", workers: Optional[int] = None,
+                 ilhas: Optional[int] = None, decomposicao: Optional[bool] = None,
+                 planejamento_diario: Optional[bool] = None):
         self.gerenciador_dados = GerenciadorDados(csv_file)
         self.validador = ValidadorSolucao(self.gerenciador_dados)
         self.calculador_custo = CalculadorCusto(self.gerenciador_dados)
         self.algoritmo_genetico = AlgoritmoGenetico(
-            self.gerenciador_dados, self.validador, self.calculador_custo
+            self.gerenciador_dados, self.validador, self.calculador_custo, 
+            workers=workers, ilhas=ilhas
         )
+        self.decomposicao = (decomposicao if decomposicao is not None else
+                             len(self.gerenciador_dados.obter_visao_ceps()) >= DECOMPOSITION_CONFIG['min_points'])
+        self.solucionador_decomposicao = SolucionadorDecomposicao(self.gerenciador_dados, workers=workers)
+        self.planejamento_diario = (planejamento_diario if planejamento_diario is not None
+                                    else DAILY_PLAN_CONFIG['enabled'])
+        self.planejador_diario = PlanejadorDiario(self.gerenciador_dados, self.calculador_custo, workers=workers)
         self.gerador_relatorio = GeradorRelatorio()
         self.plotador_rota = PlotadorRota(self.gerenciador_dados)
         
         self.drone_config = DRONE_CONFIG
         self.operation_config = OPERATION_CONFIG
     
-    def executar(self) -> Tuple[List[str], List[int], List[bool], float]:
-        rota_ids, velocidades, tempos_pouso, fitness = self.algoritmo_genetico.executar()
-        rota_ceps = self.gerenciador_dados.converter_rota_para_ceps(rota_ids)
-        return rota_ceps, velocidades, tempos_pouso, fitness
+    def executar(self, resume_from: Optional[str] = None) -> Tuple[List[str], List[int], List[bool], float]:
+        solucao = None
+        for solucao in self.executar_iterativo(resume_from):
+            pass
+        return solucao
+    
+    def executar_iterativo(self, resume_from: Optional[str] = None) -> Iterator[Tuple[List[str], List[int], List[bool], float]]:
+        if resume_from is not None and (self.planejamento_diario or self.decomposicao):
+            modo = "planejamento diário" if self.planejamento_diario else "decomposição"
+            raise ValueError(f"Retomada de checkpoint não suportada no modo de {modo}")
+        if self.planejamento_diario:
+            solucoes = self._solucao_unica(self.planejador_diario.executar)
+        elif self.decomposicao:
+            solucoes = self._solucao_unica(self.solucionador_decomposicao.executar)
+        else:
+            solucoes = self.algoritmo_genetico.executar_iterativo(resume_from=resume_from)
+        return ((self.gerenciador_dados.converter_rota_para_ceps(rota_ids), velocidades, tempos_pouso, fitness)
+                for rota_ids, velocidades, tempos_pouso, fitness in solucoes)
+    
+    def executar_async(self, resume_from: Optional[str] = None) -> AsyncIterator[Tuple[List[str], List[int], List[bool], float]]:
+        return iterar_em_thread(self.executar_iterativo(resume_from), self.cancelar)
+    
+    def cancelar(self):
+        self.algoritmo_genetico.cancelar()
+    
+    @staticmethod
+    def _solucao_unica(solucionar: Callable[[], Tuple]) -> Iterator[Tuple]:
+        yield solucionar()
     
     def gerar_relatorios(self, rota: List[str], velocidades: List[int], 
                         tempos_pouso: List[bool], fitness: float):
@@ -0,0 +1,58 @@
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Optional
+
+class CacheFitness:
+    def __init__(self, capacidade: int = 2048):
+        self.capacidade = capacidade
+        self.entradas: "OrderedDict[bytes, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def calcular_chave(rota_ids: np.ndarray, velocidades: np.ndarray, 
+                       tempos_pouso: np.ndarray) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(rota_ids, dtype=np.int32).tobytes())
+        digest.update(np.ascontiguousarray(velocidades, dtype=np.int32).tobytes())
+        digest.update(np.packbits(np.asarray(tempos_pouso, dtype=bool)).tobytes())
+        return digest.digest()
+    
+    def obter(self, chave: bytes) -> Optional[float]:
+        fitness = self.entradas.get(chave)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self.entradas.move_to_end(chave)
+        self.hits += 1
+        return fitness
+    
+    def armazenar(self, chave: bytes, fitness: float):
+        if self.capacidade <= 0:
+            return
+        self.entradas[chave] = fitness
+        self.entradas.move_to_end(chave)
+        while len(self.entradas) > self.capacidade:
+            self.entradas.popitem(last=False)
+            self.evictions += 1
+    
+    def limpar(self):
+        self.entradas.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def estatisticas(self) -> Dict[str, float]:
+        consultas = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entradas),
+            'hit_rate': self.hits / consultas if consultas else 0.0,
+        }
+    
+    def __len__(self) -> int:
+        return len(self.entradas)
@@ -0,0 +1,116 @@
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+from ..utils.calculations import calculate_effective_speed_vector_array, calculate_autonomy_array
+from ..utils.data_manager import GerenciadorDados
+from ..config import DRONE_CONFIG, OPERATION_CONFIG, GENETIC_CONFIG
+
+class OtimizadorVelocidades:
+    def __init__(self, gerenciador_dados: GerenciadorDados, faixas_bateria: Optional[int] = None):
+        self.gerenciador_dados = gerenciador_dados
+        self.drone_config = DRONE_CONFIG
+        self.operation_config = OPERATION_CONFIG
+        self.faixas_bateria = faixas_bateria if faixas_bateria is not None else GENETIC_CONFIG['battery_bins']
+        self.velocidades = np.arange(self.drone_config['min_speed'],
+                                     self.drone_config['max_speed'] + 1,
+                                     self.drone_config['speed_step'])
+        self.autonomias = calculate_autonomy_array(self.velocidades,
+                                                   self.drone_config['base_autonomy'],
+                                                   self.drone_config['autonomy_correction'])
+    
+    def otimizar(self, rota_ids: Sequence[int], dia_inicial: int = 1) -> Tuple[List[int], List[bool], float]:
+        num_trechos = len(rota_ids) - 1
+        if num_trechos < 1:
+            return [], [], 0.0
+        
+        base_autonomy = self.drone_config['base_autonomy']
+        stop_consumption = self.drone_config['stop_consumption']
+        landing_cost = self.drone_config['landing_cost']
+        start_hour = self.operation_config['start_hour']
+        end_hour = self.operation_config['end_hour']
+        max_days = self.operation_config['max_days']
+        
+        distancias, senos, cossenos = self.gerenciador_dados.obter_geometria_trechos(rota_ids)
+        vento_x = self.gerenciador_dados.vento_x
+        vento_y = self.gerenciador_dados.vento_y
+        ultimo_dia_clima = vento_x.shape[0] - 1
+        num_velocidades = len(self.velocidades)
+        consumo_por_segundo = base_autonomy / self.autonomias
+        largura_faixa = float(self.autonomias.max()) / self.faixas_bateria
+        
+        bateria = self.autonomias.copy()
+        dia = np.full(num_velocidades, dia_inicial, dtype=np.int64)
+        hora = np.full(num_velocidades, start_hour, dtype=np.int64)
+        segundos_hora = np.zeros(num_velocidades, dtype=np.int64)
+        tempo = np.zeros(num_velocidades, dtype=np.int64)
+        custo = np.zeros(num_velocidades, dtype=np.float64)
+        
+        pais: List[np.ndarray] = []
+        escolhas: List[np.ndarray] = []
+        pousos: List[np.ndarray] = []
+        
+        for i in range(num_trechos):
+            distancia = distancias[i]
+            
+            indice_dia = np.minimum(dia, ultimo_dia_clima)
+            indice_hora = np.minimum(hora, 23)
+            velocidade_efetiva = calculate_effective_speed_vector_array(
+                self.velocidades[None, :], senos[i], cossenos[i],
+                vento_x[indice_dia, indice_hora][:, None], vento_y[indice_dia, indice_hora][:, None])
+            with np.errstate(divide='ignore'):
+                tempo_voo = np.ceil(distancia / velocidade_efetiva * 3600).astype(np.int64)
+            consumo = tempo_voo * consumo_por_segundo[None, :]
+            
+            bateria_antes = bateria[:, None]
+            pouso_forcado = bateria_antes < consumo + stop_consumption
+            nova_bateria = np.where(pouso_forcado, self.autonomias[None, :], bateria_antes - consumo) - stop_consumption
+            custo_pouso = np.where(hora >= 17, landing_cost, 0.0)[:, None]
+            novo_custo = custo[:, None] + 2 * custo_pouso * pouso_forcado
+            
+            total_segundos = tempo_voo + stop_consumption
+            novo_tempo = tempo[:, None] + total_segundos
+            acumulado = segundos_hora[:, None] + total_segundos
+            hora_fim = hora[:, None] + acumulado // 3600
+            virou_dia = hora_fim >= end_hour
+            novo_dia = dia[:, None] + virou_dia
+            nova_hora = np.where(virou_dia, start_hour, hora_fim)
+            
+            viaveis = (novo_dia <= max_days).ravel()
+            if i == 0:
+                viaveis &= np.eye(num_velocidades, dtype=bool).ravel()
+            candidatos = np.flatnonzero(viaveis)
+            if len(candidatos) == 0:
+                return self.velocidades[-1:].repeat(num_trechos).tolist(), [False] * num_trechos, float('inf')
+            
+            nova_bateria = nova_bateria.ravel()[candidatos]
+            novo_dia = novo_dia.ravel()[candidatos]
+            nova_hora = nova_hora.ravel()[candidatos]
+            fitness = novo_tempo.ravel()[candidatos] + novo_custo.ravel()[candidatos] * 10
+            
+            faixa = np.minimum((nova_bateria // largura_faixa).astype(np.int64), self.faixas_bateria - 1)
+            chave = faixa + self.faixas_bateria * (nova_hora + 24 * novo_dia)
+            ordem = np.lexsort((-nova_bateria, fitness, chave))
+            _, primeiros = np.unique(chave[ordem], return_index=True)
+            selecionados = candidatos[ordem[primeiros]]
+            
+            pais.append(selecionados // num_velocidades)
+            escolhas.append(selecionados % num_velocidades)
+            pousos.append(pouso_forcado.ravel()[selecionados])
+            
+            bateria = nova_bateria[ordem[primeiros]]
+            dia = novo_dia[ordem[primeiros]]
+            hora = nova_hora[ordem[primeiros]]
+            segundos_hora = (acumulado.ravel()[selecionados]) % 3600
+            tempo = novo_tempo.ravel()[selecionados]
+            custo = novo_custo.ravel()[selecionados]
+        
+        rotulo = int(np.argmin(tempo + custo * 10))
+        melhor_fitness = float(tempo[rotulo] + custo[rotulo] * 10)
+        
+        indices_velocidade = np.empty(num_trechos, dtype=np.int64)
+        pousos_rota = np.empty(num_trechos, dtype=bool)
+        for i in range(num_trechos - 1, -1, -1):
+            indices_velocidade[i] = escolhas[i][rotulo]
+            pousos_rota[i] = pousos[i][rotulo]
+            rotulo = pais[i][rotulo]
+        
+        return self.velocidades[indices_velocidade].tolist(), pousos_rota.tolist(), melhor_fitness
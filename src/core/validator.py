@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Tuple
 from ..utils.data_manager import GerenciadorDados
 
@@ -49,4 +50,23 @@ class ValidadorSolucao:
         if len(ids_visitados) != len(rota_ids) - 2:
             return False, "CEPs duplicados na rota"
         
-        return True, "Solução válida"
\ No newline at end of file
+        return True, "Solução válida"
+    
+    def validar_populacao_ids(self, rotas_ids: np.ndarray, velocidades: np.ndarray, 
+                              tempos_pouso: np.ndarray) -> np.ndarray:
+        rotas_ids = np.asarray(rotas_ids)
+        num_individuos, num_pontos = rotas_ids.shape
+        if num_pontos < 3:
+            return np.zeros(num_individuos, dtype=bool)
+        
+        if (np.shape(velocidades) != (num_individuos, num_pontos - 1) or 
+                np.shape(tempos_pouso) != (num_individuos, num_pontos - 1)):
+            return np.zeros(num_individuos, dtype=bool)
+        
+        validos = (rotas_ids[:, 0] == self.unibrasil_id) & (rotas_ids[:, -1] == self.unibrasil_id)
+        validos &= (rotas_ids == self.unibrasil_id).sum(axis=1) == 2
+        
+        meio_ordenado = np.sort(rotas_ids[:, 1:-1], axis=1)
+        validos &= ~(meio_ordenado[:, 1:] == meio_ordenado[:, :-1]).any(axis=1)
+        
+        return validos
\ No newline at end of file
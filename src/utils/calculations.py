@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from typing import Tuple, List
 
 def haversine_distance(coord1: Tuple[float, float], coord2: Tuple[float, float]) -> float:
@@ -33,16 +34,82 @@ def calculate_flight_angle(coord1: Tuple[float, float], coord2: Tuple[float, flo
         
     return angle_deg
 
+def haversine_distance_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    lats_rad = np.radians(lats)
+    delta_lat = np.radians(lats[np.newaxis, :] - lats[:, np.newaxis])
+    delta_lon = np.radians(lons[np.newaxis, :] - lons[:, np.newaxis])
+    
+    a = (np.sin(delta_lat / 2) ** 2 + 
+         np.cos(lats_rad)[:, np.newaxis] * np.cos(lats_rad)[np.newaxis, :] * 
+         np.sin(delta_lon / 2) ** 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    
+    R = 6371
+    return R * c
+
+def haversine_distance_array(lat: float, lon: float, 
+                             lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    delta_lat = np.radians(lats - lat)
+    delta_lon = np.radians(lons - lon)
+    
+    a = (np.sin(delta_lat / 2) ** 2 + 
+         np.cos(np.radians(lat)) * np.cos(np.radians(lats)) * 
+         np.sin(delta_lon / 2) ** 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    
+    R = 6371
+    return R * c
+
+def flight_angle_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    delta_lon = lons[np.newaxis, :] - lons[:, np.newaxis]
+    delta_lat = lats[np.newaxis, :] - lats[:, np.newaxis]
+    
+    angle_deg = np.degrees(np.arctan2(delta_lon, delta_lat))
+    angle_deg[angle_deg < 0] += 360
+    
+    return angle_deg
+
+def haversine_distance_pairs(lats1: np.ndarray, lons1: np.ndarray,
+                             lats2: np.ndarray, lons2: np.ndarray) -> np.ndarray:
+    delta_lat = np.radians(lats2 - lats1)
+    delta_lon = np.radians(lons2 - lons1)
+    
+    a = (np.sin(delta_lat / 2) ** 2 + 
+         np.cos(np.radians(lats1)) * np.cos(np.radians(lats2)) * 
+         np.sin(delta_lon / 2) ** 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    
+    R = 6371
+    return R * c
+
+def flight_angle_pairs(lats1: np.ndarray, lons1: np.ndarray,
+                       lats2: np.ndarray, lons2: np.ndarray) -> np.ndarray:
+    angle_deg = np.degrees(np.arctan2(lons2 - lons1, lats2 - lats1))
+    angle_deg[angle_deg < 0] += 360
+    
+    return angle_deg
+
+def nearest_neighbors_matrix(distances: np.ndarray, k: int) -> np.ndarray:
+    distances = distances.copy()
+    np.fill_diagonal(distances, np.inf)
+    k = max(0, min(k, len(distances) - 1))
+    if k == 0:
+        return np.empty((len(distances), 0), dtype=np.intp)
+    
+    candidates = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    order = np.argsort(np.take_along_axis(distances, candidates, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(candidates, order, axis=1)
+
+WIND_ANGLES = {
+    "N": 0, "NNE": 22.5, "NE": 45, "ENE": 67.5,
+    "E": 90, "ESE": 112.5, "SE": 135, "SSE": 157.5,
+    "S": 180, "SSW": 202.5, "SW": 225, "WSW": 247.5,
+    "W": 270, "WNW": 292.5, "NW": 315, "NNW": 337.5
+}
+
 def calculate_effective_speed(speed: int, wind_speed: int, wind_direction: str, 
                             flight_angle: float) -> float:
-    wind_angles = {
-        "N": 0, "NNE": 22.5, "NE": 45, "ENE": 67.5,
-        "E": 90, "ESE": 112.5, "SE": 135, "SSE": 157.5,
-        "S": 180, "SSW": 202.5, "SW": 225, "WSW": 247.5,
-        "W": 270, "WNW": 292.5, "NW": 315, "NNW": 337.5
-    }
-    
-    wind_angle_rad = math.radians(wind_angles.get(wind_direction, 0))
+    wind_angle_rad = math.radians(WIND_ANGLES.get(wind_direction, 0))
     flight_angle_rad = math.radians(flight_angle)
     
     drone_x = speed * math.sin(flight_angle_rad)
@@ -56,6 +123,32 @@ def calculate_effective_speed(speed: int, wind_speed: int, wind_direction: str,
     
     return math.sqrt(effective_x**2 + effective_y**2)
 
+def calculate_effective_speed_array(speed: np.ndarray, wind_speed: np.ndarray, 
+                                    wind_angle: np.ndarray, flight_angle: np.ndarray) -> np.ndarray:
+    wind_angle_rad = np.radians(wind_angle)
+    flight_angle_rad = np.radians(flight_angle)
+    
+    effective_x = speed * np.sin(flight_angle_rad) + wind_speed * np.sin(wind_angle_rad)
+    effective_y = speed * np.cos(flight_angle_rad) + wind_speed * np.cos(wind_angle_rad)
+    
+    return np.sqrt(effective_x**2 + effective_y**2)
+
+def calculate_effective_speed_vector(speed: int, flight_sin: float, flight_cos: float,
+                                     wind_x: float, wind_y: float) -> float:
+    effective_x = speed * flight_sin + wind_x
+    effective_y = speed * flight_cos + wind_y
+    return math.sqrt(effective_x**2 + effective_y**2)
+
+def calculate_effective_speed_vector_array(speed: np.ndarray, flight_sin: np.ndarray, flight_cos: np.ndarray,
+                                           wind_x: np.ndarray, wind_y: np.ndarray) -> np.ndarray:
+    effective_x = speed * flight_sin + wind_x
+    effective_y = speed * flight_cos + wind_y
+    return np.sqrt(effective_x**2 + effective_y**2)
+
+def wind_vector(wind_speed: int, wind_direction: str) -> Tuple[float, float]:
+    wind_angle_rad = math.radians(WIND_ANGLES.get(wind_direction, 0))
+    return wind_speed * math.sin(wind_angle_rad), wind_speed * math.cos(wind_angle_rad)
+
 def calculate_autonomy(speed: int, base_autonomy: int = 5000, 
                       correction_factor: float = 0.93) -> float:
     if speed <= 36:
@@ -63,6 +156,12 @@ def calculate_autonomy(speed: int, base_autonomy: int = 5000,
     else:
         return base_autonomy * (36 / speed) ** 2 * correction_factor
 
+def calculate_autonomy_array(speed: np.ndarray, base_autonomy: int = 5000, 
+                             correction_factor: float = 0.93) -> np.ndarray:
+    speed = np.asarray(speed, dtype=np.float64)
+    return np.where(speed <= 36, base_autonomy * correction_factor,
+                    base_autonomy * (36 / np.maximum(speed, 36)) ** 2 * correction_factor)
+
 def ccw(p1: Tuple[float, float], p2: Tuple[float, float], p3: Tuple[float, float]) -> bool:
     return (p3[1] - p1[1]) * (p2[0] - p1[0]) > (p2[1] - p1[1]) * (p3[0] - p1[0])
 
@@ -78,16 +177,85 @@ def two_opt_swap(route: List[int], i: int, j: int) -> List[int]:
         return route.copy()
     return route[:i+1] + route[i+1:j+1][::-1] + route[j+1:]
 
+def _segments_intersect_array(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray, p4: np.ndarray) -> np.ndarray:
+    def ccw_array(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+        return (c[:, 1] - a[:, 1]) * (b[:, 0] - a[:, 0]) > (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    
+    shared = ((p1 == p3).all(axis=1) | (p1 == p4).all(axis=1) |
+              (p2 == p3).all(axis=1) | (p2 == p4).all(axis=1))
+    return (~shared & (ccw_array(p1, p3, p4) != ccw_array(p2, p3, p4)) &
+            (ccw_array(p1, p2, p3) != ccw_array(p1, p2, p4)))
+
+def _crossing_pairs(coords: np.ndarray, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    valid = np.abs(first - second) >= 2
+    first, second = first[valid], second[valid]
+    hits = _segments_intersect_array(coords[first], coords[first + 1], coords[second], coords[second + 1])
+    pairs = np.column_stack((np.minimum(first, second), np.maximum(first, second)))[hits]
+    return np.unique(pairs, axis=0) if len(pairs) else pairs.reshape(0, 2)
+
+def find_crossings(coords_list) -> np.ndarray:
+    coords = np.asarray(coords_list, dtype=np.float64).reshape(-1, 2)
+    num_segments = len(coords) - 1
+    if num_segments < 3:
+        return np.empty((0, 2), dtype=np.intp)
+    
+    starts, ends = coords[:-1], coords[1:]
+    lower = np.minimum(starts, ends)
+    upper = np.maximum(starts, ends)
+    origin = lower.min(axis=0)
+    span = max(float((upper.max(axis=0) - origin).max()), 1e-12)
+    cell = max(float((upper - lower).max(axis=1).mean()), span / (2 * np.sqrt(num_segments)), 1e-12)
+    
+    first_cell = np.floor((lower - origin) / cell).astype(np.int64)
+    last_cell = np.floor((upper - origin) / cell).astype(np.int64)
+    widths = last_cell[:, 0] - first_cell[:, 0] + 1
+    counts = widths * (last_cell[:, 1] - first_cell[:, 1] + 1)
+    
+    segments = np.repeat(np.arange(num_segments), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cell_x = first_cell[segments, 0] + offsets % widths[segments]
+    cell_y = first_cell[segments, 1] + offsets // widths[segments]
+    keys = cell_x * (int(last_cell[:, 1].max()) + 1) + cell_y
+    
+    order = np.argsort(keys, kind='stable')
+    keys, segments = keys[order], segments[order]
+    first, second = [], []
+    for distance in range(1, len(keys)):
+        same_cell = np.flatnonzero(keys[distance:] == keys[:-distance])
+        if len(same_cell) == 0:
+            break
+        first.append(segments[same_cell])
+        second.append(segments[same_cell + distance])
+    if not first:
+        return np.empty((0, 2), dtype=np.intp)
+    return _crossing_pairs(coords, np.concatenate(first), np.concatenate(second))
+
+def find_crossings_for_segments(coords_list, segment_indices) -> np.ndarray:
+    coords = np.asarray(coords_list, dtype=np.float64).reshape(-1, 2)
+    num_segments = len(coords) - 1
+    segment_indices = np.unique(np.asarray(segment_indices, dtype=np.intp))
+    segment_indices = segment_indices[(segment_indices >= 0) & (segment_indices < num_segments)]
+    if num_segments < 3 or len(segment_indices) == 0:
+        return np.empty((0, 2), dtype=np.intp)
+    
+    lower_x, lower_y = np.minimum(coords[:-1], coords[1:]).T
+    upper_x, upper_y = np.maximum(coords[:-1], coords[1:]).T
+    first, second = [], []
+    for segment in segment_indices.tolist():
+        overlapping = np.flatnonzero((lower_x <= upper_x[segment]) & (upper_x >= lower_x[segment]) &
+                                     (lower_y <= upper_y[segment]) & (upper_y >= lower_y[segment]))
+        first.append(np.full(len(overlapping), segment, dtype=np.intp))
+        second.append(overlapping)
+    return _crossing_pairs(coords, np.concatenate(first), np.concatenate(second))
+
 def has_crossings(coords_list: List[Tuple[float, float]]) -> bool:
-    n = len(coords_list)
-    if n < 4:
-        return False
-    for i in range(n - 1):
-        for j in range(i + 2, n - 1):
-            if segments_intersect(coords_list[i], coords_list[i+1],
-                                 coords_list[j], coords_list[j+1]):
-                return True
-    return False
+    return len(coords_list) >= 4 and len(find_crossings(coords_list)) > 0
+
+def _reindex_after_swap(pairs: np.ndarray, i: int, j: int) -> np.ndarray:
+    pairs = pairs[~np.isin(pairs, (i, j)).any(axis=1)]
+    inside = (pairs > i) & (pairs < j)
+    pairs = np.where(inside, i + j - pairs, pairs)
+    return np.sort(pairs, axis=1)
 
 def remove_crossings_2opt(route_ids: List[int], 
                          get_coords_func,
@@ -96,97 +264,18 @@ def remove_crossings_2opt(route_ids: List[int],
     if len(route_ids) < 4:
         return route_ids.copy()
     
-    coords_list = [get_coords_func(route_id) for route_id in route_ids]
-    
-    if not force_complete:
-        has_any_crossing = False
-        for i in range(len(route_ids) - 2):
-            for j in range(i + 2, len(route_ids) - 1):
-                if segments_intersect(coords_list[i], coords_list[i+1],
-                                      coords_list[j], coords_list[j+1]):
-                    has_any_crossing = True
-                    break
-            if has_any_crossing:
-                break
-        
-        if not has_any_crossing:
-            return route_ids.copy()
+    coords = np.array([get_coords_func(route_id) for route_id in route_ids], dtype=np.float64)
+    pending = find_crossings(coords)
+    route_ids = list(route_ids)
+    max_iters = max_iterations if not force_complete else 11000
     
     iteration = 0
-    max_iters = max_iterations if not force_complete else 10000
-    consecutive_no_improvement = 0
-    
-    while iteration < max_iters:
-        improved = False
-        
-        for i in range(len(route_ids) - 2):
-            for j in range(i + 2, len(route_ids) - 1):
-                if segments_intersect(coords_list[i], coords_list[i+1],
-                                      coords_list[j], coords_list[j+1]):
-                    route_ids = two_opt_swap(route_ids, i, j)
-                    coords_list = [get_coords_func(route_id) for route_id in route_ids]
-                    improved = True
-                    consecutive_no_improvement = 0
-                    break
-            if improved:
-                break
-        
-        if not improved:
-            if force_complete:
-                has_crossing = False
-                for i in range(len(route_ids) - 2):
-                    for j in range(i + 2, len(route_ids) - 1):
-                        if segments_intersect(coords_list[i], coords_list[i+1],
-                                              coords_list[j], coords_list[j+1]):
-                            has_crossing = True
-                            break
-                    if has_crossing:
-                        break
-                
-                if not has_crossing:
-                    break
-                else:
-                    consecutive_no_improvement += 1
-                    if consecutive_no_improvement > 100:
-                        for i in range(len(route_ids) - 2):
-                            for j in range(i + 2, len(route_ids) - 1):
-                                if segments_intersect(coords_list[i], coords_list[i+1],
-                                                      coords_list[j], coords_list[j+1]):
-                                    route_ids = two_opt_swap(route_ids, i, j)
-                                    coords_list = [get_coords_func(route_id) for route_id in route_ids]
-                                    consecutive_no_improvement = 0
-                                    break
-                            if consecutive_no_improvement == 0:
-                                break
-            else:
-                break
-        
+    while len(pending) and iteration < max_iters:
+        i = int(pending[:, 0].min())
+        j = int(pending[pending[:, 0] == i, 1].min())
+        route_ids = two_opt_swap(route_ids, i, j)
+        coords[i + 1:j + 1] = coords[i + 1:j + 1][::-1].copy()
+        pending = np.concatenate((_reindex_after_swap(pending, i, j), find_crossings_for_segments(coords, (i, j))))
         iteration += 1
     
-    if force_complete:
-        has_crossing = False
-        for i in range(len(route_ids) - 2):
-            for j in range(i + 2, len(route_ids) - 1):
-                if segments_intersect(coords_list[i], coords_list[i+1],
-                                      coords_list[j], coords_list[j+1]):
-                    has_crossing = True
-                    break
-            if has_crossing:
-                break
-        
-        if has_crossing:
-            for _ in range(1000):
-                for i in range(len(route_ids) - 2):
-                    for j in range(i + 2, len(route_ids) - 1):
-                        if segments_intersect(coords_list[i], coords_list[i+1],
-                                              coords_list[j], coords_list[j+1]):
-                            route_ids = two_opt_swap(route_ids, i, j)
-                            coords_list = [get_coords_func(route_id) for route_id in route_ids]
-                            break
-                    else:
-                        continue
-                    break
-                else:
-                    break
-    
     return route_ids
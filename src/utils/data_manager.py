@@ -1,42 +1,185 @@
 import csv
-from typing import Dict, Tuple, List
-from ..config import CSV_FILE, WEATHER_DATA
+import numpy as np
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple, List, Sequence
+from ..config import CSV_FILE, WEATHER_DATA, DATASET_CACHE_CONFIG
 from .id_mapper import MapeadorID
+from .spatial_index import IndiceEspacial
+from .dataset_cache import calcular_hash_arquivo, caminho_cache, carregar_cache, salvar_cache
+from .calculations import (haversine_distance_matrix, flight_angle_matrix, haversine_distance_pairs,
+                           flight_angle_pairs, nearest_neighbors_matrix, wind_vector)
+
+LIMITE_MATRIZES_CACHE = 512
+
+class VisaoCeps(Mapping):
+    def __init__(self, mapeador_id: MapeadorID, coords_array: np.ndarray, quantidade: int):
+        self.mapeador_id = mapeador_id
+        self.coords_array = coords_array
+        self.quantidade = quantidade
+    
+    def __getitem__(self, cep: str) -> Tuple[float, float]:
+        id_cep = self.mapeador_id.obter_id_cep(cep)
+        if not 0 <= id_cep < self.quantidade:
+            raise KeyError(cep)
+        return tuple(self.coords_array[id_cep].tolist())
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.mapeador_id.ceps_por_id[:self.quantidade].tolist())
+    
+    def __len__(self) -> int:
+        return self.quantidade
 
 class GerenciadorDados:
-    def __init__(self, csv_file: str = CSV_FILE):
+    def __init__(self, csv_file: str = CSV_FILE, usar_cache: Optional[bool] = None,
+                 diretorio_cache: Optional[str] = None):
         self.csv_file = csv_file
         self.mapeador_id = MapeadorID()
-        self.ceps = self._carregar_ceps()
         self.unibrasil_cep = "82821020"
-        self.unibrasil_id = self.mapeador_id.definir_unibrasil(self.unibrasil_cep)
-        self.unibrasil_coords = self._obter_coords_unibrasil()
         self.weather_data = WEATHER_DATA
+        usar_cache = usar_cache if usar_cache is not None else DATASET_CACHE_CONFIG['enabled']
+        self.caminho_cache = caminho_cache(csv_file, diretorio_cache or DATASET_CACHE_CONFIG['directory'])
+        self.hash_dados = calcular_hash_arquivo(csv_file) if usar_cache else None
+        self._matriz_distancias = None
+        self._matriz_angulos = None
+        self._matriz_senos = None
+        self._matriz_cossenos = None
+        self._vizinhos_proximos: Dict[int, np.ndarray] = {}
+        if not (usar_cache and self._carregar_cache()):
+            self._carregar_ceps()
+            self._definir_unibrasil()
+            if usar_cache:
+                self._salvar_cache()
+        self.ceps = VisaoCeps(self.mapeador_id, self.coords_array, self.num_ceps_csv)
+        self.unibrasil_coords = self._obter_coords_unibrasil()
+        self._construir_tabela_clima()
     
-    def _carregar_ceps(self) -> Dict[str, Tuple[float, float]]:
-        ceps = {}
+    def _carregar_cache(self) -> bool:
+        if self.hash_dados is None:
+            return False
+        conteudo = carregar_cache(self.caminho_cache, self.hash_dados)
+        if conteudo is None:
+            return False
+        metadados, arrays = conteudo
+        
+        self.mapeador_id.carregar_ceps(arrays['ceps'])
+        self.num_ceps_csv = metadados['num_ceps_csv']
+        self.coords_array = arrays['coords']
+        self._definir_unibrasil()
+        if 'matriz_distancias' in arrays:
+            self._matriz_distancias = arrays['matriz_distancias']
+            self._matriz_angulos = arrays['matriz_angulos']
+            self._matriz_senos = arrays['matriz_senos']
+            self._matriz_cossenos = arrays['matriz_cossenos']
+        return True
+    
+    def _salvar_cache(self):
+        if self.hash_dados is None or self.num_ceps_csv == 0:
+            return
+        arrays = {'ceps': self.mapeador_id.ceps_por_id, 'coords': self.coords_array}
+        if len(self.coords_array) <= LIMITE_MATRIZES_CACHE:
+            arrays.update({
+                'matriz_distancias': self.matriz_distancias,
+                'matriz_angulos': self.matriz_angulos,
+                'matriz_senos': self.matriz_senos,
+                'matriz_cossenos': self.matriz_cossenos,
+            })
+        try:
+            salvar_cache(self.caminho_cache, self.hash_dados, 
+                         {'num_ceps_csv': self.num_ceps_csv}, arrays)
+        except OSError:
+            pass
+    
+    def _carregar_ceps(self):
+        ceps: List[str] = []
+        coords = np.empty((0, 2), dtype=np.float64)
         try:
             with open(self.csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    cep = row['cep']
-                    lat = float(row['latitude'])
-                    lon = float(row['longitude'])
-                    ceps[cep] = (lat, lon)
-                    self.mapeador_id.adicionar_cep(cep)
+                reader = csv.reader(file)
+                cabecalho = next(reader)
+                indice_cep, indice_lat, indice_lon = (cabecalho.index(coluna) 
+                                                      for coluna in ('cep', 'latitude', 'longitude'))
+                linhas = [linha for linha in reader if linha]
+            ceps = [linha[indice_cep] for linha in linhas]
+            coords = np.array([(float(linha[indice_lat]), float(linha[indice_lon])) for linha in linhas],
+                              dtype=np.float64).reshape(-1, 2)
         except FileNotFoundError:
             print(f"ERRO: Arquivo {self.csv_file} não encontrado!")
-            return {}
+            ceps = []
         except Exception as e:
             print(f"ERRO ao carregar dados: {e}")
-            return {}
+            ceps = []
         
-        return ceps
+        ids = self.mapeador_id.carregar_ceps(ceps)
+        self.num_ceps_csv = self.mapeador_id.obter_quantidade_ids()
+        self.coords_array = np.zeros((self.num_ceps_csv, 2), dtype=np.float64)
+        if len(ids):
+            _, ultimos_invertidos = np.unique(ids[::-1], return_index=True)
+            ultimos = len(ids) - 1 - ultimos_invertidos
+            self.coords_array[ids[ultimos]] = coords[ultimos]
+    
+    def _definir_unibrasil(self):
+        self.unibrasil_id = self.mapeador_id.definir_unibrasil(self.unibrasil_cep)
+        faltantes = self.mapeador_id.obter_quantidade_ids() - len(self.coords_array)
+        if faltantes > 0:
+            self.coords_array = np.vstack([self.coords_array, np.zeros((faltantes, 2), dtype=np.float64)])
+    
+    def _construir_matrizes(self):
+        lats = self.coords_array[:, 0]
+        lons = self.coords_array[:, 1]
+        self._matriz_distancias = haversine_distance_matrix(lats, lons)
+        self._matriz_angulos = flight_angle_matrix(lats, lons)
+        self._matriz_senos = np.sin(np.radians(self._matriz_angulos))
+        self._matriz_cossenos = np.cos(np.radians(self._matriz_angulos))
+    
+    @property
+    def matriz_distancias(self) -> np.ndarray:
+        if self._matriz_distancias is None:
+            self._construir_matrizes()
+        return self._matriz_distancias
+    
+    @property
+    def matriz_angulos(self) -> np.ndarray:
+        if self._matriz_angulos is None:
+            self._construir_matrizes()
+        return self._matriz_angulos
+    
+    @property
+    def matriz_senos(self) -> np.ndarray:
+        if self._matriz_senos is None:
+            self._construir_matrizes()
+        return self._matriz_senos
+    
+    @property
+    def matriz_cossenos(self) -> np.ndarray:
+        if self._matriz_cossenos is None:
+            self._construir_matrizes()
+        return self._matriz_cossenos
+    
+    def _construir_tabela_clima(self):
+        num_dias = max(self.weather_data.keys(), default=0) + 2
+        self.tabela_clima = [[self._calcular_clima_por_horario(dia, hora) for hora in range(24)]
+                             for dia in range(num_dias)]
+        self.vento_x = np.zeros((num_dias, 24), dtype=np.float64)
+        self.vento_y = np.zeros((num_dias, 24), dtype=np.float64)
+        for dia in range(num_dias):
+            for hora in range(24):
+                velocidade_vento, direcao_vento = self.tabela_clima[dia][hora]
+                self.vento_x[dia, hora], self.vento_y[dia, hora] = wind_vector(velocidade_vento, direcao_vento)
+        self.tabela_vento = [[(float(self.vento_x[dia, hora]), float(self.vento_y[dia, hora])) for hora in range(24)]
+                             for dia in range(num_dias)]
     
     def _obter_coords_unibrasil(self) -> Tuple[float, float]:
         return self.ceps.get(self.unibrasil_cep, (0, 0))
     
     def obter_clima_por_horario(self, dia: int, hora: int) -> Tuple[int, str]:
+        if 0 <= dia < len(self.tabela_clima) and 0 <= hora < 24:
+            return self.tabela_clima[dia][hora]
+        return self._calcular_clima_por_horario(dia, hora)
+    
+    def obter_vento_por_horario(self, dia: int, hora: int) -> Tuple[float, float]:
+        return self.tabela_vento[min(max(dia, 0), len(self.tabela_vento) - 1)][min(max(hora, 0), 23)]
+    
+    def _calcular_clima_por_horario(self, dia: int, hora: int) -> Tuple[int, str]:
         if dia not in self.weather_data:
             return (0, "N")
         
@@ -47,8 +190,35 @@ class GerenciadorDados:
         return wind_speed, wind_direction
     
     def obter_coords_por_id(self, id_cep: int) -> Tuple[float, float]:
-        cep = self.mapeador_id.obter_cep_id(id_cep)
-        return self.ceps.get(cep, (0, 0))
+        if 0 <= id_cep < len(self.coords_array):
+            return tuple(self.coords_array[id_cep].tolist())
+        return (0, 0)
+    
+    def obter_distancia_por_ids(self, id1: int, id2: int) -> float:
+        return float(self.matriz_distancias[id1, id2])
+    
+    def obter_geometria_trechos(self, rota_ids: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rota = np.asarray(rota_ids, dtype=np.intp)
+        origens, destinos = rota[:-1], rota[1:]
+        if self._matriz_distancias is not None or len(self.coords_array) <= LIMITE_MATRIZES_CACHE:
+            return (self.matriz_distancias[origens, destinos], self.matriz_senos[origens, destinos],
+                    self.matriz_cossenos[origens, destinos])
+        
+        lats, lons = self.coords_array[:, 0], self.coords_array[:, 1]
+        distancias = haversine_distance_pairs(lats[origens], lons[origens], lats[destinos], lons[destinos])
+        angulos = np.radians(flight_angle_pairs(lats[origens], lons[origens], lats[destinos], lons[destinos]))
+        return distancias, np.sin(angulos), np.cos(angulos)
+    
+    def obter_vizinhos_proximos(self, k: int) -> np.ndarray:
+        if k not in self._vizinhos_proximos:
+            self._vizinhos_proximos[k] = nearest_neighbors_matrix(self.matriz_distancias, k)
+        return self._vizinhos_proximos[k]
+    
+    def criar_indice_espacial(self, ids: List[int]) -> IndiceEspacial:
+        return IndiceEspacial(ids, self.coords_array[:, 0], self.coords_array[:, 1])
+    
+    def obter_angulo_por_ids(self, id1: int, id2: int) -> float:
+        return float(self.matriz_angulos[id1, id2])
     
     def obter_coords_cep(self, cep: str) -> Tuple[float, float]:
         return self.ceps.get(cep, (0, 0))
@@ -59,11 +229,20 @@ class GerenciadorDados:
     def obter_ids_excluindo_unibrasil(self) -> List[int]:
         return self.mapeador_id.obter_ids_excluindo_unibrasil()
     
+    def obter_array_ids_excluindo_unibrasil(self) -> np.ndarray:
+        return self.mapeador_id.obter_array_ids_excluindo_unibrasil()
+    
     def obter_id_unibrasil(self) -> int:
         return self.mapeador_id.obter_id_unibrasil()
     
     def converter_rota_para_ceps(self, rota_ids: List[int]) -> List[str]:
         return self.mapeador_id.converter_rota_para_ceps(rota_ids)
     
+    def converter_rota_para_ids(self, rota_ceps: List[str]) -> List[int]:
+        return self.mapeador_id.converter_rota_para_ids(rota_ceps)
+    
     def obter_todos_ceps(self) -> Dict[str, Tuple[float, float]]:
-        return self.ceps.copy()
\ No newline at end of file
+        return dict(zip(self.ceps, map(tuple, self.coords_array[:self.num_ceps_csv].tolist())))
+    
+    def obter_visao_ceps(self) -> Mapping[str, Tuple[float, float]]:
+        return self.ceps
\ No newline at end of file
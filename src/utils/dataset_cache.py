@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+ASSINATURA_CACHE = b'GDCACHE1'
+VERSAO_CACHE = 1
+ALINHAMENTO = 64
+
+def calcular_hash_arquivo(caminho: str) -> Optional[str]:
+    digest = hashlib.sha256()
+    try:
+        with open(caminho, 'rb') as arquivo:
+            for bloco in iter(lambda: arquivo.read(1 << 20), b''):
+                digest.update(bloco)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def caminho_cache(csv_file: str, diretorio: str) -> str:
+    nome = os.path.splitext(os.path.basename(csv_file))[0]
+    sufixo = hashlib.sha256(os.path.abspath(csv_file).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(diretorio, f'{nome}.{sufixo}.cache.bin')
+
+def _modo_padrao() -> int:
+    mascara = os.umask(0)
+    os.umask(mascara)
+    return 0o666 & ~mascara
+
+def _alinhar(posicao: int) -> int:
+    return (posicao + ALINHAMENTO - 1) // ALINHAMENTO * ALINHAMENTO
+
+def salvar_cache(caminho: str, hash_origem: str, metadados: Dict, arrays: Dict[str, np.ndarray]):
+    descritores = {}
+    posicao = 0
+    for nome, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[nome] = array
+        descritores[nome] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': posicao}
+        posicao = _alinhar(posicao + array.nbytes)
+    
+    cabecalho = json.dumps({
+        'versao': VERSAO_CACHE,
+        'hash': hash_origem,
+        'metadados': metadados,
+        'arrays': descritores,
+    }).encode('utf-8')
+    inicio_dados = _alinhar(len(ASSINATURA_CACHE) + 8 + len(cabecalho))
+    
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    os.makedirs(diretorio, exist_ok=True)
+    descritor, caminho_temporario = tempfile.mkstemp(dir=diretorio, prefix='.cache_', suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            arquivo.write(ASSINATURA_CACHE)
+            arquivo.write(struct.pack('<Q', len(cabecalho)))
+            arquivo.write(cabecalho)
+            for nome, array in arrays.items():
+                arquivo.seek(inicio_dados + descritores[nome]['offset'])
+                arquivo.write(array.tobytes())
+            arquivo.truncate(inicio_dados + posicao)
+        os.chmod(caminho_temporario, _modo_padrao())
+        os.replace(caminho_temporario, caminho)
+    except BaseException:
+        if os.path.exists(caminho_temporario):
+            os.remove(caminho_temporario)
+        raise
+
+def carregar_cache(caminho: str, hash_origem: str) -> Optional[Tuple[Dict, Dict[str, np.ndarray]]]:
+    try:
+        mapa = np.memmap(caminho, dtype=np.uint8, mode='r')
+    except (OSError, ValueError):
+        return None
+    
+    inicio_cabecalho = len(ASSINATURA_CACHE) + 8
+    if len(mapa) < inicio_cabecalho or mapa[:len(ASSINATURA_CACHE)].tobytes() != ASSINATURA_CACHE:
+        return None
+    tamanho_cabecalho, = struct.unpack('<Q', mapa[len(ASSINATURA_CACHE):inicio_cabecalho].tobytes())
+    try:
+        cabecalho = json.loads(mapa[inicio_cabecalho:inicio_cabecalho + tamanho_cabecalho].tobytes())
+    except ValueError:
+        return None
+    if cabecalho.get('versao') != VERSAO_CACHE or cabecalho.get('hash') != hash_origem:
+        return None
+    
+    inicio_dados = _alinhar(inicio_cabecalho + tamanho_cabecalho)
+    arrays = {}
+    for nome, descritor in cabecalho['arrays'].items():
+        dtype = np.dtype(descritor['dtype'])
+        shape = tuple(descritor['shape'])
+        inicio = inicio_dados + descritor['offset']
+        fim = inicio + dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+        if fim > len(mapa):
+            return None
+        arrays[nome] = np.asarray(mapa[inicio:fim]).view(dtype).reshape(shape)
+    return cabecalho['metadados'], arrays
@@ -1,33 +1,77 @@
-from typing import Dict, List, Tuple
+import numpy as np
+from typing import List, Optional, Sequence
 
 class MapeadorID:
     def __init__(self):
-        self.cep_to_id: Dict[str, int] = {}
-        self.id_to_cep: Dict[int, str] = {}
-        self.next_id = 0
+        self.ceps_por_id = np.empty(0, dtype=str)
         self.unibrasil_id = None
+        self._ceps_ordenados: Optional[np.ndarray] = None
+        self._ids_ordenados: Optional[np.ndarray] = None
+        self._ids_sem_unibrasil: Optional[np.ndarray] = None
+    
+    def carregar_ceps(self, ceps: Sequence[str]) -> np.ndarray:
+        ceps = np.asarray(ceps, dtype=str)
+        unicos, primeiros, inversos = np.unique(ceps, return_index=True, return_inverse=True)
+        ids_por_unico = np.empty(len(unicos), dtype=np.int64)
+        ids_por_unico[np.argsort(primeiros, kind='stable')] = np.arange(len(unicos))
+        
+        self.ceps_por_id = unicos[np.argsort(ids_por_unico)]
+        self._ceps_ordenados = unicos
+        self._ids_ordenados = ids_por_unico
+        self._ids_sem_unibrasil = None
+        self.unibrasil_id = None
+        return ids_por_unico[inversos.ravel()]
     
     def adicionar_cep(self, cep: str) -> int:
-        if cep not in self.cep_to_id:
-            self.cep_to_id[cep] = self.next_id
-            self.id_to_cep[self.next_id] = cep
-            self.next_id += 1
-        return self.cep_to_id[cep]
+        id_cep = self.obter_id_cep(cep)
+        if id_cep >= 0:
+            return id_cep
+        id_cep = len(self.ceps_por_id)
+        self.ceps_por_id = np.append(self.ceps_por_id, cep)
+        self._ceps_ordenados = None
+        self._ids_sem_unibrasil = None
+        return id_cep
+    
+    def _indice_ordenado(self):
+        if self._ceps_ordenados is None:
+            self._ids_ordenados = np.argsort(self.ceps_por_id, kind='stable')
+            self._ceps_ordenados = self.ceps_por_id[self._ids_ordenados]
+        return self._ceps_ordenados, self._ids_ordenados
+    
+    def converter_ceps_para_ids(self, ceps: Sequence[str]) -> np.ndarray:
+        ceps = np.asarray(ceps, dtype=str)
+        ceps_ordenados, ids_ordenados = self._indice_ordenado()
+        if len(ceps_ordenados) == 0:
+            return np.full(ceps.shape, -1, dtype=np.int64)
+        posicoes = np.minimum(np.searchsorted(ceps_ordenados, ceps), len(ceps_ordenados) - 1)
+        encontrados = ceps_ordenados[posicoes] == ceps
+        return np.where(encontrados, ids_ordenados[posicoes], -1)
+    
+    def converter_ids_para_ceps(self, ids: Sequence[int]) -> np.ndarray:
+        ids = np.asarray(ids, dtype=np.int64)
+        validos = (ids >= 0) & (ids < len(self.ceps_por_id))
+        if len(self.ceps_por_id) == 0:
+            return np.full(ids.shape, "", dtype=str)
+        return np.where(validos, self.ceps_por_id[np.where(validos, ids, 0)], "")
     
     def obter_id_cep(self, cep: str) -> int:
-        return self.cep_to_id.get(cep, -1)
+        return int(self.converter_ceps_para_ids([cep])[0])
     
     def obter_cep_id(self, id_cep: int) -> str:
-        return self.id_to_cep.get(id_cep, "")
+        if 0 <= id_cep < len(self.ceps_por_id):
+            return str(self.ceps_por_id[id_cep])
+        return ""
     
     def obter_todos_ids(self) -> List[int]:
-        return list(self.id_to_cep.keys())
+        return list(range(len(self.ceps_por_id)))
     
     def obter_quantidade_ids(self) -> int:
-        return len(self.cep_to_id)
+        return len(self.ceps_por_id)
     
-    def definir_unibrasil(self, cep_unibrasil: str):
+    def definir_unibrasil(self, cep_unibrasil: str) -> int:
         self.unibrasil_id = self.adicionar_cep(cep_unibrasil)
+        self._ids_sem_unibrasil = None
+        return self.unibrasil_id
     
     def eh_id_unibrasil(self, id_cep: int) -> bool:
         return id_cep == self.unibrasil_id
@@ -36,21 +80,22 @@ class MapeadorID:
         return self.unibrasil_id
     
     def converter_rota_para_ids(self, rota_ceps: List[str]) -> List[int]:
-        return [self.obter_id_cep(cep) for cep in rota_ceps]
+        return self.converter_ceps_para_ids(rota_ceps).tolist()
     
     def converter_rota_para_ceps(self, rota_ids: List[int]) -> List[str]:
-        return [self.obter_cep_id(id_cep) for id_cep in rota_ids]
+        return self.converter_ids_para_ceps(rota_ids).tolist()
     
     def obter_ceps_excluindo_unibrasil(self) -> List[str]:
-        ceps = []
-        for cep, id_cep in self.cep_to_id.items():
-            if id_cep != self.unibrasil_id:
-                ceps.append(cep)
-        return ceps
+        return self.ceps_por_id[self.obter_array_ids_excluindo_unibrasil()].tolist()
+    
+    def obter_array_ids_excluindo_unibrasil(self) -> np.ndarray:
+        if self._ids_sem_unibrasil is None:
+            ids = np.arange(len(self.ceps_por_id))
+            if self.unibrasil_id is not None:
+                ids = ids[ids != self.unibrasil_id]
+            ids.setflags(write=False)
+            self._ids_sem_unibrasil = ids
+        return self._ids_sem_unibrasil
     
     def obter_ids_excluindo_unibrasil(self) -> List[int]:
-        ids = []
-        for id_cep in self.id_to_cep.keys():
-            if id_cep != self.unibrasil_id:
-                ids.append(id_cep)
-        return ids
+        return self.obter_array_ids_excluindo_unibrasil().tolist()
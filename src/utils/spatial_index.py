@@ -0,0 +1,103 @@
+import math
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from .calculations import haversine_distance_array
+
+RAIO_TERRA_KM = 6371
+PONTOS_POR_CELULA = 2
+
+class IndiceEspacial:
+    def __init__(self, ids: List[int], lats: np.ndarray, lons: np.ndarray):
+        self.lats = lats
+        self.lons = lons
+        self.ordem: Dict[int, int] = {id_cep: i for i, id_cep in enumerate(ids)}
+        self._construir(list(ids))
+    
+    def _construir(self, ids: List[int]):
+        self.celula_de: Dict[int, Tuple[int, int]] = {}
+        self.celulas: Dict[Tuple[int, int], List[int]] = {}
+        self.tamanho_construcao = len(ids)
+        if not ids:
+            return
+        
+        lats = self.lats[ids]
+        lons = self.lons[ids]
+        self.lat_min, self.lon_min = float(lats.min()), float(lons.min())
+        cos_referencia = max(math.cos(math.radians(float(lats.mean()))), 1e-6)
+        extensao_lat = float(lats.max()) - self.lat_min
+        extensao_lon = (float(lons.max()) - self.lon_min) * cos_referencia
+        area = max(extensao_lat, 1e-9) * max(extensao_lon, 1e-9)
+        lado = math.sqrt(area * PONTOS_POR_CELULA / len(ids))
+        
+        self.passo_lat = lado
+        self.passo_lon = lado / cos_referencia
+        cos_maximo = math.cos(math.radians(max(abs(self.lat_min), abs(float(lats.max())))))
+        self.passo_km = 0.999 * RAIO_TERRA_KM * min(math.radians(self.passo_lat),
+                                                    cos_maximo * math.radians(self.passo_lon))
+        
+        colunas_x = np.floor((lats - self.lat_min) / self.passo_lat).astype(int).tolist()
+        colunas_y = np.floor((lons - self.lon_min) / self.passo_lon).astype(int).tolist()
+        for id_cep, x, y in zip(ids, colunas_x, colunas_y):
+            self.celula_de[id_cep] = (x, y)
+            self.celulas.setdefault((x, y), []).append(id_cep)
+        self.max_x = max(colunas_x)
+        self.max_y = max(colunas_y)
+    
+    def __len__(self) -> int:
+        return len(self.celula_de)
+    
+    def __contains__(self, id_cep: int) -> bool:
+        return id_cep in self.celula_de
+    
+    def remover(self, id_cep: int):
+        celula = self.celula_de.pop(id_cep)
+        ids_celula = self.celulas[celula]
+        ids_celula.remove(id_cep)
+        if not ids_celula:
+            del self.celulas[celula]
+        
+        restantes = len(self.celula_de)
+        if restantes and self.tamanho_construcao > 64 and restantes * 4 < self.tamanho_construcao:
+            self._construir(list(self.celula_de.keys()))
+    
+    def mais_proximo(self, id_origem: int) -> Optional[int]:
+        if not self.celula_de:
+            return None
+        
+        lat = float(self.lats[id_origem])
+        lon = float(self.lons[id_origem])
+        qx = math.floor((lat - self.lat_min) / self.passo_lat)
+        qy = math.floor((lon - self.lon_min) / self.passo_lon)
+        anel_maximo = max(abs(qx), abs(qx - self.max_x), abs(qy), abs(qy - self.max_y))
+        
+        melhor_id = None
+        melhor_chave = (float('inf'), 0)
+        for anel in range(anel_maximo + 1):
+            candidatos = []
+            for celula in self._celulas_anel(qx, qy, anel):
+                candidatos.extend(self.celulas.get(celula, ()))
+            
+            if candidatos:
+                distancias = haversine_distance_array(lat, lon, self.lats[candidatos], self.lons[candidatos])
+                for id_cep, distancia in zip(candidatos, distancias.tolist()):
+                    chave = (distancia, self.ordem[id_cep])
+                    if chave < melhor_chave:
+                        melhor_chave = chave
+                        melhor_id = id_cep
+            
+            if melhor_id is not None and melhor_chave[0] <= anel * self.passo_km:
+                break
+        
+        return melhor_id
+    
+    @staticmethod
+    def _celulas_anel(qx: int, qy: int, anel: int):
+        if anel == 0:
+            yield (qx, qy)
+            return
+        for x in range(qx - anel, qx + anel + 1):
+            yield (x, qy - anel)
+            yield (x, qy + anel)
+        for y in range(qy - anel + 1, qy + anel):
+            yield (qx - anel, y)
+            yield (qx + anel, y)
@@ -0,0 +1,33 @@
+import numpy as np
+from benchmarks.datasets import DISTRIBUICOES, gerar_coordenadas, LIMITES_CURITIBA
+from benchmarks.run import executar_suite, comparar_com_baseline
+
+def test_geradores_sinteticos_reprodutiveis():
+    """Testa que os geradores sintéticos são determinísticos e ficam dentro de Curitiba"""
+    print("\n[TEST] Testando geradores de conjuntos sintéticos")
+    (lat_min, lat_max), (lon_min, lon_max) = LIMITES_CURITIBA
+    for distribuicao in DISTRIBUICOES:
+        coords = gerar_coordenadas(distribuicao, 500, semente=3)
+        assert coords.shape == (500, 2)
+        assert np.array_equal(coords, gerar_coordenadas(distribuicao, 500, semente=3))
+        assert (coords[:, 0] >= lat_min).all() and (coords[:, 0] <= lat_max).all()
+        assert (coords[:, 1] >= lon_min).all() and (coords[:, 1] <= lon_max).all()
+        print(f"  {distribuicao}: centro {coords.mean(axis=0).round(3).tolist()}")
+    print("  ✓ Teste passou: conjuntos reprodutíveis e dentro dos limites")
+
+def test_suite_compara_com_baseline():
+    """Testa a execução reduzida da suíte e a detecção de regressões pela tolerância"""
+    print("\n[TEST] Testando suíte de benchmarks e comparação com baseline")
+    resultados = executar_suite([100], ['uniform'], ['haversine_distance', 'mutar'], log=lambda _: None)
+    assert [resultado['case'] for resultado in resultados] == ['haversine_distance', 'mutar']
+    assert all(resultado['median_s'] > 0 for resultado in resultados)
+    
+    baseline = {'results': [dict(resultado) for resultado in resultados]}
+    assert comparar_com_baseline(resultados, baseline, 0.25) == []
+    
+    baseline['results'][0]['median_s'] = resultados[0]['median_s'] / 2
+    regressoes = comparar_com_baseline(resultados, baseline, 0.25)
+    print(f"  Regressões detectadas: {regressoes}")
+    assert len(regressoes) == 1 and regressoes[0]['case'] == 'haversine_distance'
+    assert regressoes[0]['ratio'] == 2
+    print("  ✓ Teste passou: regressão acima da tolerância sinalizada")
@@ -1,5 +1,10 @@
 import pytest
-from src.utils.calculations import haversine_distance, calculate_autonomy
+import numpy as np
+from src.utils.calculations import (
+    haversine_distance, calculate_autonomy, calculate_flight_angle,
+    haversine_distance_matrix, flight_angle_matrix, segments_intersect, find_crossings,
+    find_crossings_for_segments, remove_crossings_2opt, has_crossings
+)
 
 def test_haversine_distance_pontos_proximos():
     """Testa cálculo de distância entre pontos próximos"""
@@ -57,3 +62,71 @@ def test_calculate_autonomy_velocidade_alta():
     assert autonomia_40 > autonomia_80
     print(f"  ✓ Teste passou: autonomia a 40 km/h ({autonomia_40:.2f}) > autonomia a 80 km/h ({autonomia_80:.2f})")
 
+
+def test_haversine_distance_matrix_igual_escalar():
+    """Testa que a matriz de distâncias coincide com o cálculo ponto a ponto"""
+    print("\n[TEST] Testando matriz de distâncias vetorizada")
+    pontos = [(-25.422264, -49.264543), (-25.422000, -49.264000), (-25.500000, -49.300000)]
+    lats = np.array([p[0] for p in pontos])
+    lons = np.array([p[1] for p in pontos])
+    
+    matriz = haversine_distance_matrix(lats, lons)
+    print(f"  Matriz calculada:\n{matriz}")
+    
+    assert matriz.shape == (3, 3)
+    for i, p1 in enumerate(pontos):
+        for j, p2 in enumerate(pontos):
+            assert matriz[i, j] == pytest.approx(haversine_distance(p1, p2), abs=1e-9)
+    print("  ✓ Teste passou: matriz igual ao cálculo escalar")
+
+def test_flight_angle_matrix_igual_escalar():
+    """Testa que a matriz de ângulos coincide com o cálculo ponto a ponto"""
+    print("\n[TEST] Testando matriz de ângulos de voo vetorizada")
+    pontos = [(-25.422264, -49.264543), (-25.422000, -49.264000), (-25.500000, -49.300000)]
+    lats = np.array([p[0] for p in pontos])
+    lons = np.array([p[1] for p in pontos])
+    
+    matriz = flight_angle_matrix(lats, lons)
+    
+    for i, p1 in enumerate(pontos):
+        for j, p2 in enumerate(pontos):
+            assert matriz[i, j] == pytest.approx(calculate_flight_angle(p1, p2), abs=1e-9)
+    assert (matriz >= 0).all() and (matriz < 360).all()
+    print("  ✓ Teste passou: ângulos entre 0 e 360 graus")
+
+def cruzamentos_forca_bruta(coords):
+    return [(i, j) for i in range(len(coords) - 1) for j in range(i + 2, len(coords) - 1)
+            if segments_intersect(coords[i], coords[i + 1], coords[j], coords[j + 1])]
+
+def test_find_crossings_igual_forca_bruta():
+    """Testa que a grade espacial lista os mesmos pares que a comparação de todos os segmentos"""
+    print("\n[TEST] Testando detecção de cruzamentos com grade espacial")
+    rng = np.random.default_rng(7)
+    for tamanho in (2, 4, 10, 60, 200):
+        coords = [tuple(p) for p in rng.random((tamanho, 2)).tolist()]
+        coords.append(coords[0])
+        
+        esperado = cruzamentos_forca_bruta(coords)
+        assert [tuple(par) for par in find_crossings(coords).tolist()] == esperado
+        assert has_crossings(coords) == bool(esperado)
+        
+        segmentos = [0, len(coords) // 2, len(coords) - 2]
+        incremental = [par for par in esperado if par[0] in segmentos or par[1] in segmentos]
+        assert [tuple(par) for par in find_crossings_for_segments(coords, segmentos).tolist()] == incremental
+        print(f"  {len(coords)} pontos: {len(esperado)} cruzamentos")
+    print("  ✓ Teste passou: pares idênticos à força bruta")
+
+def test_remove_crossings_2opt_elimina_cruzamentos():
+    """Testa que a remoção completa deixa a rota sem cruzamentos e preserva as extremidades"""
+    print("\n[TEST] Testando remoção de cruzamentos com verificação incremental")
+    rng = np.random.default_rng(3)
+    coords = [tuple(p) for p in rng.random((150, 2)).tolist()]
+    rota = [0] + rng.permutation(np.arange(1, 150)).tolist() + [0]
+    
+    assert has_crossings([coords[i] for i in rota])
+    resultado = remove_crossings_2opt(rota, lambda indice: coords[indice], force_complete=True)
+    
+    assert resultado[0] == resultado[-1] == 0
+    assert sorted(resultado[1:-1]) == list(range(1, 150))
+    assert not cruzamentos_forca_bruta([coords[i] for i in resultado])
+    print("  ✓ Teste passou: rota sem cruzamentos")
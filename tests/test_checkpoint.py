@@ -0,0 +1,96 @@
+import os
+import random
+import pytest
+from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.algorithms.checkpoint import salvar_checkpoint, carregar_checkpoint
+from src.utils.data_manager import GerenciadorDados
+from src.core.validator import ValidadorSolucao
+from src.core.cost_calculator import CalculadorCusto
+from src.core.drone_optimizer import GerenciadorRota
+
+@pytest.fixture
+def gerenciador():
+    """Fixture para criar gerenciador de dados"""
+    return GerenciadorDados("data/coordenadas.csv")
+
+def criar_algoritmo(gerenciador, geracoes, checkpoint_path=None):
+    algoritmo = AlgoritmoGenetico(gerenciador, ValidadorSolucao(gerenciador), CalculadorCusto(gerenciador))
+    algoritmo.population_size = 12
+    algoritmo.elite_size = 2
+    algoritmo.generations = geracoes
+    algoritmo.checkpoint_path = checkpoint_path
+    algoritmo.checkpoint_interval = 2
+    return algoritmo
+
+def test_checkpoint_escrita_atomica(tmp_path):
+    """Testa gravação atômica e leitura de checkpoint"""
+    print("\n[TEST] Testando gravação atômica de checkpoint")
+    caminho = str(tmp_path / "estado.pkl")
+    salvar_checkpoint(caminho, {'geracao': 3})
+    salvar_checkpoint(caminho, {'geracao': 4})
+    
+    estado = carregar_checkpoint(caminho)
+    print(f"  Arquivos no diretório: {os.listdir(tmp_path)}")
+    assert estado['geracao'] == 4
+    assert os.listdir(tmp_path) == ["estado.pkl"]
+    print("  ✓ Teste passou: checkpoint substituído sem arquivos temporários")
+
+def test_checkpoint_invalido(tmp_path):
+    """Testa rejeição de arquivo que não é checkpoint"""
+    print("\n[TEST] Testando checkpoint inválido")
+    caminho = tmp_path / "invalido.pkl"
+    caminho.write_bytes(b"\x80\x05N.")
+    with pytest.raises(ValueError):
+        carregar_checkpoint(str(caminho))
+    print("  ✓ Teste passou: checkpoint inválido rejeitado")
+
+def test_retomada_reproduz_execucao_completa(gerenciador, tmp_path):
+    """Testa que retomar de um checkpoint continua exatamente a mesma execução"""
+    print("\n[TEST] Testando retomada de execução a partir de checkpoint")
+    caminho = str(tmp_path / "ga.pkl")
+    
+    random.seed(21)
+    completo = criar_algoritmo(gerenciador, 6)
+    resultado_completo = completo.executar()
+    
+    random.seed(21)
+    criar_algoritmo(gerenciador, 3, checkpoint_path=caminho).executar()
+    estado = carregar_checkpoint(caminho)
+    print(f"  Checkpoint salvo na geração {estado['geracao']}")
+    assert estado['geracao'] == 2
+    
+    random.seed(999)
+    retomado = criar_algoritmo(gerenciador, 6)
+    resultado_retomado = retomado.executar(resume_from=caminho)
+    
+    print(f"  Fitness completo: {resultado_completo[3]:.0f}, retomado: {resultado_retomado[3]:.0f}")
+    assert resultado_retomado == resultado_completo
+    assert retomado.geracao_melhoria == completo.geracao_melhoria
+    print("  ✓ Teste passou: execução retomada idêntica à execução ininterrupta")
+
+def test_checkpoint_guarda_geracao_da_ultima_melhoria(gerenciador, tmp_path):
+    """Testa que a retomada restaura a geração da última melhoria em vez de reiniciar a contagem"""
+    print("\n[TEST] Testando geração da última melhoria no checkpoint")
+    caminho = str(tmp_path / "ga.pkl")
+    random.seed(21)
+    original = criar_algoritmo(gerenciador, 3, checkpoint_path=caminho)
+    original.executar()
+    estado = carregar_checkpoint(caminho)
+    
+    retomado = criar_algoritmo(gerenciador, 3)
+    retomado.executar(resume_from=caminho)
+    print(f"  Última melhoria: geração {estado['geracao_melhoria']} (checkpoint na geração {estado['geracao']})")
+    
+    assert estado['geracao_melhoria'] == original.geracao_melhoria
+    assert retomado.geracao_melhoria == estado['geracao_melhoria']
+    print("  ✓ Teste passou: contagem de estagnação preservada na retomada")
+
+@pytest.mark.parametrize("modo", ["decomposicao", "planejamento_diario"])
+def test_retomada_rejeitada_fora_do_algoritmo_genetico(tmp_path, modo):
+    """Testa que resume_from gera erro nos modos que não usam checkpoints"""
+    print(f"\n[TEST] Testando retomada no modo {modo}")
+    gerenciador_rota = GerenciadorRota("data/coordenadas.csv", **{modo: True})
+    
+    with pytest.raises(ValueError):
+        gerenciador_rota.executar(resume_from=str(tmp_path / "ga.pkl"))
+    print("  ✓ Teste passou: retomada rejeitada em vez de iniciar nova execução")
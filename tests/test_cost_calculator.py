@@ -0,0 +1,164 @@
+import random
+import pytest
+import numpy as np
+from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.utils.data_manager import GerenciadorDados
+from src.core.validator import ValidadorSolucao
+from src.core.cost_calculator import CalculadorCusto
+from src.core.fitness_cache import CacheFitness
+
+@pytest.fixture
+def algoritmo_genetico():
+    """Fixture para criar instância de algoritmo genético"""
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    validador = ValidadorSolucao(gerenciador)
+    calculador = CalculadorCusto(gerenciador)
+    return AlgoritmoGenetico(gerenciador, validador, calculador)
+
+def test_custo_populacao_igual_escalar(algoritmo_genetico):
+    """Testa que a avaliação em lote coincide com a simulação individual"""
+    print("\n[TEST] Testando custo da população em lote contra cálculo individual")
+    random.seed(42)
+    populacao = [algoritmo_genetico.criar_individuo() for _ in range(15)]
+    populacao += [algoritmo_genetico.criar_individuo_vizinho_mais_proximo() for _ in range(5)]
+    
+    rotas_ids = np.array([individuo[0] for individuo in populacao])
+    velocidades = np.array([individuo[1] for individuo in populacao])
+    tempos_pouso = np.array([individuo[2] for individuo in populacao])
+    
+    calculador = algoritmo_genetico.calculador_custo
+    fitness_lote = calculador.calcular_custo_populacao(rotas_ids, velocidades, tempos_pouso)
+    fitness_escalar = [calculador.calcular_custo_rota_ids(*individuo)[0] for individuo in populacao]
+    print(f"  Melhor fitness em lote: {fitness_lote.min():.0f}")
+    
+    assert fitness_lote.shape == (len(populacao),)
+    for lote, escalar in zip(fitness_lote, fitness_escalar):
+        assert lote == pytest.approx(escalar)
+    print("  ✓ Teste passou: fitness em lote igual ao escalar")
+
+def test_custo_populacao_excede_prazo(algoritmo_genetico):
+    """Testa que rotas que excedem o prazo recebem fitness infinito"""
+    print("\n[TEST] Testando rota que excede o prazo de dias")
+    rota_ids, _, _ = algoritmo_genetico.criar_individuo()
+    rota_ids = rota_ids * 3
+    velocidades = [36] * (len(rota_ids) - 1)
+    tempos_pouso = [True] * (len(rota_ids) - 1)
+    
+    calculador = algoritmo_genetico.calculador_custo
+    custo_escalar, _ = calculador.calcular_custo_rota_ids(rota_ids, velocidades, tempos_pouso)
+    fitness = calculador.calcular_custo_populacao([rota_ids], [velocidades], [tempos_pouso])
+    print(f"  Custo escalar: {custo_escalar}, custo em lote: {fitness[0]}")
+    
+    assert custo_escalar == float('inf')
+    assert fitness[0] == float('inf')
+    print("  ✓ Teste passou: prazo excedido detectado nos dois caminhos")
+
+def test_avaliar_populacao_invalidos(algoritmo_genetico):
+    """Testa que indivíduos inválidos recebem fitness infinito na avaliação da população"""
+    print("\n[TEST] Testando avaliação de população com indivíduo inválido")
+    random.seed(7)
+    populacao = [algoritmo_genetico.criar_individuo() for _ in range(4)]
+    populacao[1][0][2] = populacao[1][0][3]
+    
+    fitness = algoritmo_genetico.avaliar_populacao(populacao)
+    print(f"  Fitness: {fitness}")
+    
+    assert fitness[1] == float('inf')
+    assert all(f < float('inf') for i, f in enumerate(fitness) if i != 1)
+    print("  ✓ Teste passou: indivíduo com CEP duplicado descartado")
+
+def test_cache_fitness_lru():
+    """Testa contadores e descarte LRU do cache de fitness"""
+    print("\n[TEST] Testando cache LRU de fitness")
+    cache = CacheFitness(capacidade=2)
+    chaves = [CacheFitness.calcular_chave([0, i, 0], [60, 60], [False, True]) for i in range(1, 4)]
+    
+    assert cache.obter(chaves[0]) is None
+    cache.armazenar(chaves[0], 10.0)
+    cache.armazenar(chaves[1], 20.0)
+    assert cache.obter(chaves[0]) == 10.0
+    cache.armazenar(chaves[2], 30.0)
+    
+    estatisticas = cache.estatisticas()
+    print(f"  Estatísticas: {estatisticas}")
+    
+    assert cache.obter(chaves[1]) is None
+    assert cache.obter(chaves[0]) == 10.0
+    assert estatisticas['hits'] == 1
+    assert estatisticas['misses'] == 1
+    assert estatisticas['evictions'] == 1
+    assert len(cache) == 2
+    print("  ✓ Teste passou: entrada menos recente descartada")
+
+def test_avaliar_populacao_usa_cache(algoritmo_genetico):
+    """Testa que indivíduos repetidos são servidos pelo cache"""
+    print("\n[TEST] Testando reaproveitamento de fitness entre gerações")
+    random.seed(5)
+    populacao = [algoritmo_genetico.criar_individuo() for _ in range(4)]
+    
+    primeira = algoritmo_genetico.avaliar_populacao(populacao)
+    segunda = algoritmo_genetico.avaliar_populacao(populacao + [populacao[0]])
+    estatisticas = algoritmo_genetico.cache_fitness.estatisticas()
+    print(f"  Estatísticas: {estatisticas}")
+    
+    assert segunda[:4] == primeira
+    assert segunda[4] == primeira[0]
+    assert estatisticas['misses'] == 4
+    assert estatisticas['hits'] == 5
+    print("  ✓ Teste passou: segunda avaliação sem nova simulação")
+
+def test_custo_incremental_igual_simulacao_completa(algoritmo_genetico):
+    """Testa que a re-simulação a partir de checkpoints coincide com a simulação completa"""
+    print("\n[TEST] Testando avaliação incremental com checkpoints de estado")
+    random.seed(21)
+    calculador = algoritmo_genetico.calculador_custo
+    base = algoritmo_genetico.criar_individuo_vizinho_mais_proximo()
+    custo_base, checkpoints = calculador.simular_com_checkpoints(*base)
+    
+    assert custo_base == calculador.calcular_custo_rota_ids(*base)[0]
+    assert len(checkpoints) == len(base[0])
+    
+    for _ in range(10):
+        rota_ids, velocidades, tempos_pouso = (list(genes) for genes in base)
+        i, j = sorted(random.sample(range(1, len(rota_ids) - 1), 2))
+        rota_ids[i:j + 1] = reversed(rota_ids[i:j + 1])
+        velocidades[j] = random.choice(range(36, 97, 4))
+        novo = (rota_ids, velocidades, tempos_pouso)
+        
+        primeiro_trecho = calculador.primeiro_trecho_alterado(base, novo)
+        custo_incremental, _ = calculador.calcular_custo_incremental(*novo, checkpoints, primeiro_trecho)
+        custo_completo, _ = calculador.calcular_custo_rota_ids(*novo)
+        
+        assert primeiro_trecho == i - 1
+        assert custo_incremental == custo_completo
+    
+    print(f"  Custo base: {custo_base:.0f}")
+    print("  ✓ Teste passou: custo incremental igual ao completo em 10 mutações")
+
+def test_caminho_rapido_igual_detalhado(algoritmo_genetico):
+    """Testa que o kernel sem detalhes e o caminho por CEP coincidem com o detalhado"""
+    print("\n[TEST] Testando caminho rápido de custo sem relatório por trecho")
+    random.seed(8)
+    calculador = algoritmo_genetico.calculador_custo
+    gerenciador = algoritmo_genetico.gerenciador_dados
+    
+    for _ in range(10):
+        rota_ids, velocidades, tempos_pouso = algoritmo_genetico.criar_individuo()
+        custo_detalhado, info = calculador.calcular_custo_rota_ids(rota_ids, velocidades, tempos_pouso)
+        custo_rapido = calculador.calcular_fitness_ids(rota_ids, velocidades, tempos_pouso)
+        custo_sem_detalhe, info_vazia = calculador.calcular_custo_rota_ids(
+            rota_ids, velocidades, tempos_pouso, detail=False)
+        rota_ceps = gerenciador.converter_rota_para_ceps(rota_ids)
+        custo_ceps, info_ceps = calculador.calcular_custo_rota(rota_ceps, velocidades, tempos_pouso)
+        
+        assert custo_rapido == custo_detalhado == custo_sem_detalhe == custo_ceps
+        assert info_vazia == {}
+        if custo_detalhado != float('inf'):
+            assert info_ceps == info
+            assert len(info["route_info"]) == len(rota_ids) - 1
+            assert info["route_info"][0]["start_cep"] == gerenciador.unibrasil_cep
+    
+    custo, info = calculador.calcular_custo_rota(["00000000", gerenciador.unibrasil_cep], [36], [False])
+    assert custo == float('inf')
+    assert "error" in info
+    print("  ✓ Teste passou: kernel único compartilhado entre caminhos por ID e por CEP")
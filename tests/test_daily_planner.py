@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from src.utils.data_manager import GerenciadorDados
+from src.core.cost_calculator import CalculadorCusto
+from src.algorithms.daily_planner import PlanejadorDiario, matriz_tempos_dia, otimizar_dia
+from src.utils.calculations import haversine_distance_matrix
+
+@pytest.fixture
+def componentes(tmp_path):
+    """Fixture com um conjunto sintético que exige vários dias de operação"""
+    rng = np.random.default_rng(0)
+    csv_file = tmp_path / "varios_dias.csv"
+    with open(csv_file, "w", encoding="utf-8") as arquivo:
+        arquivo.write("cep,longitude,latitude\n82821020,-49.2160678044742,-25.4233146347775\n")
+        for i in range(900):
+            arquivo.write(f"{10000000 + i},{-49.3 + rng.random() * 0.2},{-25.5 + rng.random() * 0.2}\n")
+    gerenciador = GerenciadorDados(str(csv_file), usar_cache=False)
+    return gerenciador, CalculadorCusto(gerenciador)
+
+def test_divisao_em_pacotes_diarios(componentes):
+    """Testa que os pacotes seguem os dias de chegada da simulação e cobrem a rota"""
+    print("\n[TEST] Testando divisão da rota em pacotes diários")
+    gerenciador, calculador = componentes
+    planejador = PlanejadorDiario(gerenciador, calculador, workers=1)
+    rota_ids = planejador.solucionador_inicial.construir_rota()
+    velocidades, tempos_pouso, _ = planejador.otimizador_velocidades.otimizar(rota_ids)
+    
+    pacotes = planejador.dividir_em_dias(rota_ids, velocidades, tempos_pouso)
+    print(f"  Pacotes: {[(dia, len(ids_dia)) for dia, ids_dia in pacotes]}")
+    
+    assert len(pacotes) > 1
+    assert [dia for dia, _ in pacotes] == list(range(1, len(pacotes) + 1))
+    assert [id_cep for _, ids_dia in pacotes for id_cep in ids_dia] == rota_ids[1:-1]
+    print("  ✓ Teste passou: pacotes diários contíguos e completos")
+
+def test_planejamento_diario_melhora_rota_inicial(componentes):
+    """Testa que a otimização por dia não piora a rota inicial e tem fitness reproduzível"""
+    print("\n[TEST] Testando planejamento por dias")
+    gerenciador, calculador = componentes
+    planejador = PlanejadorDiario(gerenciador, calculador, workers=2)
+    rota_inicial = planejador.solucionador_inicial.construir_rota()
+    _, _, fitness_inicial = planejador.otimizador_velocidades.otimizar(rota_inicial)
+    
+    rota_ids, velocidades, tempos_pouso, fitness = planejador.executar(rota_inicial)
+    custo, _ = calculador.calcular_custo_rota_ids(rota_ids, velocidades, tempos_pouso)
+    
+    print(f"  Fitness inicial: {fitness_inicial:.0f}, final: {fitness:.0f}")
+    print(f"  Plano diário: {planejador.plano_diario}")
+    assert fitness <= fitness_inicial
+    assert custo == fitness
+    assert sorted(rota_ids[1:-1]) == gerenciador.obter_ids_excluindo_unibrasil()
+    assert rota_ids[0] == rota_ids[-1] == gerenciador.obter_id_unibrasil()
+    print("  ✓ Teste passou: subproblemas diários combinados em rota válida")
+
+def test_busca_diaria_considera_vento_do_dia(componentes):
+    """Testa que o custo da busca diária usa o vento do dia e que o caminho escolhido não piora o fitness"""
+    print("\n[TEST] Testando busca local diária com vento do dia")
+    gerenciador, calculador = componentes
+    planejador = PlanejadorDiario(gerenciador, calculador, workers=1)
+    caminho = [gerenciador.obter_id_unibrasil()] + gerenciador.obter_ids_excluindo_unibrasil()[:60]
+    coords = gerenciador.coords_array[caminho]
+    distancias = haversine_distance_matrix(coords[:, 0], coords[:, 1])
+    fora_diagonal = ~np.eye(len(caminho), dtype=bool)
+    
+    razoes = {dia: (matriz_tempos_dia(gerenciador, caminho, dia)[fora_diagonal] / distancias[fora_diagonal])
+              for dia in (1, 5)}
+    print(f"  Segundos por km, dia 1: {razoes[1].min():.1f}-{razoes[1].max():.1f}, "
+          f"dia 5: {razoes[5].min():.1f}-{razoes[5].max():.1f}")
+    assert razoes[1].max() - razoes[1].min() > 1
+    assert not np.allclose(razoes[1], razoes[5])
+    
+    for dia in (1, 5):
+        _, _, fitness_inicial = planejador.otimizador_velocidades.otimizar(caminho, dia_inicial=dia)
+        caminho_dia, fitness = otimizar_dia(gerenciador, planejador.otimizador_velocidades, caminho, dia, 8)
+        assert fitness <= fitness_inicial
+        assert caminho_dia[0] == caminho[0] and caminho_dia[-1] == caminho[-1]
+        assert sorted(caminho_dia) == sorted(caminho)
+    print("  ✓ Teste passou: custos dependem do vento do dia e o DP escolhe o melhor caminho")
@@ -1,5 +1,13 @@
+import os
+import pickle
 import pytest
-from src.utils.data_manager import GerenciadorDados
+import numpy as np
+from src.utils.data_manager import GerenciadorDados, LIMITE_MATRIZES_CACHE
+from src.utils.dataset_cache import caminho_cache
+from src.utils.id_mapper import MapeadorID
+from src.utils.calculations import (
+    haversine_distance, calculate_flight_angle, calculate_effective_speed, calculate_effective_speed_vector
+)
 
 def test_gerenciador_carrega_dados():
     """Testa se o gerenciador carrega os dados corretamente"""
@@ -67,3 +75,191 @@ def test_gerenciador_exclui_unibrasil():
     assert "82821020" not in [gerenciador.obter_cep_por_id(id) for id in ids_sem_unibrasil]
     print("  ✓ Teste passou: Unibrasil excluído corretamente da lista")
 
+
+def test_gerenciador_matrizes_por_id():
+    """Testa matrizes de distância e ângulo pré-calculadas por ID"""
+    print("\n[TEST] Testando matrizes pré-calculadas de distância e ângulo")
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    
+    n = len(gerenciador.obter_todos_ceps())
+    unibrasil_id = gerenciador.obter_id_unibrasil()
+    outro_id = gerenciador.obter_ids_excluindo_unibrasil()[0]
+    print(f"  Dimensão das matrizes: {gerenciador.matriz_distancias.shape}")
+    
+    assert gerenciador.matriz_distancias.shape == (n, n)
+    assert gerenciador.matriz_angulos.shape == (n, n)
+    
+    coords1 = gerenciador.obter_coords_por_id(unibrasil_id)
+    coords2 = gerenciador.obter_coords_por_id(outro_id)
+    assert gerenciador.obter_distancia_por_ids(unibrasil_id, outro_id) == pytest.approx(
+        haversine_distance(coords1, coords2), abs=1e-9)
+    assert gerenciador.obter_angulo_por_ids(unibrasil_id, outro_id) == pytest.approx(
+        calculate_flight_angle(coords1, coords2), abs=1e-9)
+    print("  ✓ Teste passou: matrizes coincidem com o cálculo escalar")
+
+def test_indice_espacial_vizinho_mais_proximo():
+    """Testa que o índice espacial encontra o mesmo vizinho que a busca linear"""
+    print("\n[TEST] Testando índice espacial com remoção de pontos visitados")
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    ids = gerenciador.obter_ids_excluindo_unibrasil()
+    indice = gerenciador.criar_indice_espacial(ids)
+    
+    nao_visitados = list(ids)
+    id_atual = gerenciador.obter_id_unibrasil()
+    while nao_visitados:
+        distancias = gerenciador.matriz_distancias[id_atual, nao_visitados]
+        esperado = nao_visitados[int(distancias.argmin())]
+        
+        id_atual = indice.mais_proximo(id_atual)
+        assert id_atual == esperado
+        indice.remover(id_atual)
+        nao_visitados.remove(id_atual)
+    
+    assert len(indice) == 0
+    assert indice.mais_proximo(id_atual) is None
+    print(f"  ✓ Teste passou: {len(ids)} consultas iguais à busca linear")
+
+def test_tabela_vento_equivale_calculo_direto():
+    """Testa que os vetores de vento pré-calculados reproduzem a velocidade efetiva original"""
+    print("\n[TEST] Testando tabela de vetores de vento")
+    gerenciador_dados = GerenciadorDados("data/coordenadas.csv")
+    ids = gerenciador_dados.obter_ids_excluindo_unibrasil()[:20]
+    comparacoes = 0
+    for dia in range(0, 9):
+        for hora in range(5, 20):
+            velocidade_vento, direcao_vento = gerenciador_dados._calcular_clima_por_horario(dia, hora)
+            assert gerenciador_dados.obter_clima_por_horario(dia, hora) == (velocidade_vento, direcao_vento)
+            vento_x, vento_y = gerenciador_dados.obter_vento_por_horario(dia, hora)
+            for id1, id2 in zip(ids, ids[1:]):
+                angulo = float(gerenciador_dados.matriz_angulos[id1, id2])
+                esperado = calculate_effective_speed(60, velocidade_vento, direcao_vento, angulo)
+                obtido = calculate_effective_speed_vector(
+                    60, float(gerenciador_dados.matriz_senos[id1, id2]),
+                    float(gerenciador_dados.matriz_cossenos[id1, id2]), vento_x, vento_y)
+                assert obtido == esperado
+                comparacoes += 1
+    print(f"  Comparações realizadas: {comparacoes}")
+    print("  ✓ Teste passou: tabela de vento idêntica ao cálculo trigonométrico")
+
+def test_cache_binario_reproduz_dados(tmp_path):
+    """Testa que o cache binário reproduz os dados do CSV e é invalidado por alteração no arquivo"""
+    print("\n[TEST] Testando cache binário do conjunto de dados")
+    csv_file = tmp_path / "coordenadas.csv"
+    csv_file.write_bytes(open("data/coordenadas.csv", "rb").read())
+    
+    diretorio_cache = str(tmp_path / "cache")
+    arquivo_cache = caminho_cache(str(csv_file), diretorio_cache)
+    original = GerenciadorDados(str(csv_file))
+    assert original.hash_dados is None
+    assert not os.path.exists(arquivo_cache)
+    
+    GerenciadorDados(str(csv_file), usar_cache=True, diretorio_cache=diretorio_cache)
+    assert os.path.exists(arquivo_cache)
+    assert sorted(os.listdir(tmp_path)) == ["cache", "coordenadas.csv"]
+    mascara = os.umask(0)
+    os.umask(mascara)
+    assert os.stat(arquivo_cache).st_mode & 0o777 == 0o666 & ~mascara
+    
+    do_cache = GerenciadorDados(str(csv_file), usar_cache=True, diretorio_cache=diretorio_cache)
+    assert do_cache.obter_todos_ceps() == original.obter_todos_ceps()
+    assert np.array_equal(do_cache.coords_array, original.coords_array)
+    assert do_cache.obter_id_unibrasil() == original.obter_id_unibrasil()
+    assert np.array_equal(do_cache.matriz_distancias, original.matriz_distancias)
+    assert np.array_equal(do_cache.matriz_cossenos, original.matriz_cossenos)
+    print(f"  CEPs carregados do cache: {len(do_cache.obter_todos_ceps())}")
+    
+    with open(csv_file, "a", encoding="utf-8") as arquivo:
+        arquivo.write("99999999,-49.30,-25.40\n")
+    alterado = GerenciadorDados(str(csv_file), usar_cache=True, diretorio_cache=diretorio_cache)
+    assert "99999999" in alterado.obter_todos_ceps()
+    assert alterado.matriz_distancias.shape[0] == original.matriz_distancias.shape[0] + 1
+    
+    open(arquivo_cache, "wb").write(b"corrompido")
+    recuperado = GerenciadorDados(str(csv_file), usar_cache=True, diretorio_cache=diretorio_cache)
+    assert "99999999" in recuperado.obter_todos_ceps()
+    print("  ✓ Teste passou: cache opcional, fora do diretório de dados, invalidado por hash e recriado quando corrompido")
+
+def test_cache_sem_matrizes_acima_do_limite(tmp_path):
+    """Testa que conjuntos acima do limite gravam só CEPs e coordenadas e constroem matrizes sob demanda"""
+    print("\n[TEST] Testando cache sem matrizes densas para conjuntos médios")
+    rng = np.random.default_rng(1)
+    csv_file = tmp_path / "medio.csv"
+    with open(csv_file, "w", encoding="utf-8") as arquivo:
+        arquivo.write("cep,longitude,latitude\n82821020,-49.2160678044742,-25.4233146347775\n")
+        for i in range(LIMITE_MATRIZES_CACHE + 100):
+            arquivo.write(f"{10000000 + i},{-49.3 + rng.random() * 0.2},{-25.5 + rng.random() * 0.2}\n")
+    
+    diretorio_cache = str(tmp_path / "cache")
+    gerenciador = GerenciadorDados(str(csv_file), usar_cache=True, diretorio_cache=diretorio_cache)
+    tamanho_cache = os.path.getsize(caminho_cache(str(csv_file), diretorio_cache))
+    print(f"  Tamanho do cache: {tamanho_cache} bytes")
+    assert gerenciador._matriz_distancias is None
+    assert tamanho_cache < 64 * 1024
+    
+    do_cache = GerenciadorDados(str(csv_file), usar_cache=True, diretorio_cache=diretorio_cache)
+    assert do_cache._matriz_distancias is None
+    assert np.array_equal(do_cache.matriz_distancias, gerenciador.matriz_distancias)
+    print("  ✓ Teste passou: matrizes ausentes do cache e construídas apenas quando usadas")
+
+def test_mapeador_colunar_conversao_vetorizada():
+    """Testa busca binária de CEPs, conversão vetorizada e IDs imutáveis"""
+    print("\n[TEST] Testando mapeador de IDs colunar")
+    mapeador = MapeadorID()
+    ids = mapeador.carregar_ceps(["30000000", "10000000", "30000000", "20000000"])
+    unibrasil_id = mapeador.definir_unibrasil("82821020")
+    
+    print(f"  IDs atribuídos: {ids.tolist()}, Unibrasil: {unibrasil_id}")
+    assert ids.tolist() == [0, 1, 0, 2]
+    assert unibrasil_id == 3
+    assert mapeador.converter_rota_para_ids(["82821020", "20000000", "99999999"]) == [3, 2, -1]
+    assert mapeador.converter_rota_para_ceps([3, 0, 7]) == ["82821020", "30000000", ""]
+    
+    ids_sem_unibrasil = mapeador.obter_array_ids_excluindo_unibrasil()
+    assert ids_sem_unibrasil.tolist() == [0, 1, 2]
+    assert mapeador.obter_array_ids_excluindo_unibrasil() is ids_sem_unibrasil
+    with pytest.raises(ValueError):
+        ids_sem_unibrasil[0] = 5
+    print("  ✓ Teste passou: conversões vetorizadas e array de IDs somente leitura")
+
+def test_obter_todos_ceps_retorna_copia():
+    """Testa que obter_todos_ceps devolve um dict independente e a visão reflete os mesmos dados"""
+    print("\n[TEST] Testando cópia e visão dos CEPs")
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    
+    todos_ceps = gerenciador.obter_todos_ceps()
+    visao = gerenciador.obter_visao_ceps()
+    assert type(todos_ceps) is dict
+    assert todos_ceps == dict(visao)
+    assert pickle.loads(pickle.dumps(todos_ceps)) == todos_ceps
+    
+    todos_ceps.pop(gerenciador.unibrasil_cep)
+    todos_ceps["00000000"] = (0.0, 0.0)
+    assert gerenciador.unibrasil_cep in gerenciador.obter_todos_ceps()
+    assert "00000000" not in visao
+    print(f"  CEPs na cópia: {len(gerenciador.obter_todos_ceps())}")
+    print("  ✓ Teste passou: alterações na cópia não afetam o gerenciador")
+
+def test_gerenciador_grande_sem_matrizes(tmp_path):
+    """Testa carregamento de 100 mil pontos em arrays planos sem construir matrizes"""
+    print("\n[TEST] Testando carregamento colunar de 100 mil pontos")
+    rng = np.random.default_rng(0)
+    num_pontos = 100_000
+    lats = -25.4 + rng.random(num_pontos) * 0.2
+    lons = -49.3 + rng.random(num_pontos) * 0.2
+    csv_file = tmp_path / "grande.csv"
+    with open(csv_file, "w", encoding="utf-8") as arquivo:
+        arquivo.write("cep,longitude,latitude\n82821020,-49.2160678044742,-25.4233146347775\n")
+        for i in range(num_pontos):
+            arquivo.write(f"{10000000 + i},{lons[i]},{lats[i]}\n")
+    
+    gerenciador = GerenciadorDados(str(csv_file), usar_cache=False)
+    
+    assert len(gerenciador.obter_visao_ceps()) == num_pontos + 1
+    assert gerenciador.coords_array.shape == (num_pontos + 1, 2)
+    assert gerenciador._matriz_distancias is None
+    rota = ["82821020", "10000005", "10099999"]
+    rota_ids = gerenciador.converter_rota_para_ids(rota)
+    assert gerenciador.converter_rota_para_ceps(rota_ids) == rota
+    assert gerenciador.obter_coords_cep("10000005") == (lats[5], lons[5])
+    print(f"  Memória das coordenadas: {gerenciador.coords_array.nbytes} bytes")
+    print("  ✓ Teste passou: dados carregados em O(n) sem matrizes de pares")
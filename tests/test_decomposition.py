@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from src.utils.data_manager import GerenciadorDados
+from src.core.cost_calculator import CalculadorCusto
+from src.algorithms.decomposition import SolucionadorDecomposicao, particionar_bisseccao, resolver_caminho_aberto
+
+@pytest.fixture
+def gerenciador():
+    """Fixture com os dados reais de CEPs"""
+    return GerenciadorDados("data/coordenadas.csv")
+
+def configuracao(tamanho_grupo, workers=1):
+    return {'cluster_size': tamanho_grupo, 'boundary_window': 10, 'neighbor_k': 8, 'workers': workers}
+
+def test_particao_cobre_todos_os_pontos(gerenciador):
+    """Testa que a bissecção recursiva cobre cada CEP exatamente uma vez"""
+    print("\n[TEST] Testando particionamento espacial")
+    coords = gerenciador.coords_array[gerenciador.obter_array_ids_excluindo_unibrasil()]
+    grupos = particionar_bisseccao(coords, 40)
+    
+    tamanhos = [len(grupo) for grupo in grupos]
+    print(f"  Grupos: {len(grupos)}, tamanhos: {min(tamanhos)}-{max(tamanhos)}")
+    assert max(tamanhos) <= 40
+    assert sorted(np.concatenate(grupos).tolist()) == list(range(len(coords)))
+    print("  ✓ Teste passou: partição completa e limitada ao tamanho máximo")
+
+def test_caminho_aberto_mantem_extremidades():
+    """Testa que o caminho de um grupo começa na entrada e termina na saída"""
+    print("\n[TEST] Testando caminho aberto de um grupo")
+    rng = np.random.default_rng(4)
+    coords = np.column_stack((-25.4 + rng.random(30) * 0.1, -49.3 + rng.random(30) * 0.1))
+    caminho = resolver_caminho_aberto(coords, 7, 21, 8)
+    
+    assert caminho[0] == 7 and caminho[-1] == 21
+    assert sorted(caminho.tolist()) == list(range(30))
+    print("  ✓ Teste passou: extremidades preservadas")
+
+def test_decomposicao_gera_rota_valida(gerenciador):
+    """Testa que a rota costurada passa pelo depósito e tem custo coerente com o simulador"""
+    print("\n[TEST] Testando solucionador por decomposição")
+    calculador = CalculadorCusto(gerenciador)
+    solucionador = SolucionadorDecomposicao(gerenciador, config=configuracao(50))
+    rota_ids, velocidades, tempos_pouso, fitness = solucionador.executar()
+    
+    unibrasil_id = gerenciador.obter_id_unibrasil()
+    assert rota_ids[0] == unibrasil_id and rota_ids[-1] == unibrasil_id
+    assert sorted(rota_ids[1:-1]) == gerenciador.obter_ids_excluindo_unibrasil()
+    assert len(velocidades) == len(tempos_pouso) == len(rota_ids) - 1
+    
+    custo, _ = calculador.calcular_custo_rota_ids(rota_ids, velocidades, tempos_pouso)
+    print(f"  Fitness: {fitness:.0f}")
+    assert custo == fitness < float('inf')
+    print("  ✓ Teste passou: rota completa e fitness reproduzido pelo simulador")
+
+def test_decomposicao_grande_em_paralelo(tmp_path):
+    """Testa 20 mil pontos com pool de processos sem construir matrizes de pares"""
+    print("\n[TEST] Testando decomposição de 20 mil pontos")
+    rng = np.random.default_rng(1)
+    num_pontos = 20_000
+    csv_file = tmp_path / "grande.csv"
+    with open(csv_file, "w", encoding="utf-8") as arquivo:
+        arquivo.write("cep,longitude,latitude\n82821020,-49.2160678044742,-25.4233146347775\n")
+        for i in range(num_pontos):
+            arquivo.write(f"{10000000 + i},{-49.3 + rng.random() * 0.3},{-25.4 + rng.random() * 0.3}\n")
+    
+    gerenciador = GerenciadorDados(str(csv_file), usar_cache=False)
+    solucionador = SolucionadorDecomposicao(gerenciador, config=configuracao(150, workers=2))
+    rota_ids = solucionador.construir_rota()
+    
+    assert len(rota_ids) == num_pontos + 2
+    assert len(set(rota_ids)) == num_pontos + 1
+    assert gerenciador._matriz_distancias is None
+    
+    distancias, _, _ = gerenciador.obter_geometria_trechos(rota_ids)
+    print(f"  Comprimento da rota: {distancias.sum():.1f} km")
+    area = (0.3 * 111.2) * (0.3 * 111.2 * np.cos(np.radians(25.55)))
+    assert distancias.sum() < 1.25 * 0.7124 * np.sqrt(num_pontos * area)
+    print("  ✓ Teste passou: rota costurada sem matrizes globais")
@@ -1,5 +1,13 @@
+import asyncio
+import multiprocessing
+import random
+import tracemalloc
 import pytest
 from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.algorithms.parallel_evaluator import AvaliadorParalelo
+from src.algorithms.island_model import ModeloIlhas, _processo_ilha
+from src.algorithms.crossover import OPERADORES_CROSSOVER, herdar_genes
+from src.algorithms.population import Populacao
 from src.utils.data_manager import GerenciadorDados
 from src.core.validator import ValidadorSolucao
 from src.core.cost_calculator import CalculadorCusto
@@ -74,6 +82,23 @@ def test_algoritmo_muta_individuo(algoritmo_genetico):
     assert len(individuo_original[2]) == len(individuo_mutado[2])
     print("  ✓ Teste passou: estrutura mantida após mutação")
 
+def test_mutar_preserva_gerador_e_aceita_velocidades_fora_da_grade(algoritmo_genetico):
+    """Testa que mutar não reinicia o gerador do laço principal e arredonda velocidades fora da grade"""
+    print("\n[TEST] Testando mutação avulsa com velocidades fora da grade")
+    random.seed(6)
+    rota_ids, velocidades, tempos_pouso = algoritmo_genetico.criar_individuo()
+    velocidades = [v + 1 for v in velocidades]
+    gerador = algoritmo_genetico.rng
+    
+    _, velocidades_mutadas, _ = algoritmo_genetico.mutar((rota_ids, velocidades, tempos_pouso))
+    
+    assert algoritmo_genetico.rng is gerador
+    assert len(velocidades_mutadas) == len(velocidades)
+    assert all(36 <= v <= 96 and v % 4 == 0 for v in velocidades_mutadas)
+    assert algoritmo_genetico.avaliar_populacao([(rota_ids, velocidades, tempos_pouso)]) == \
+        [algoritmo_genetico.calculador_custo.calcular_fitness_ids(rota_ids, velocidades, tempos_pouso)]
+    print("  ✓ Teste passou: gerador preservado e velocidades ajustadas à grade")
+
 def test_algoritmo_crossover(algoritmo_genetico):
     """Testa operação de crossover"""
     print("\n[TEST] Testando crossover entre dois indivíduos")
@@ -100,3 +125,270 @@ def test_algoritmo_crossover(algoritmo_genetico):
     assert filho2[0][-1] == unibrasil_id
     print(f"  ✓ Teste passou: filhos mantêm estrutura e começam/terminam em Unibrasil (ID: {unibrasil_id})")
 
+
+def test_algoritmo_avaliacao_paralela_deterministica(algoritmo_genetico):
+    """Testa que a avaliação com processos paralelos coincide com a sequencial"""
+    print("\n[TEST] Testando avaliação paralela da população")
+    random.seed(11)
+    populacao = [algoritmo_genetico.criar_individuo() for _ in range(9)]
+    fitness_sequencial = algoritmo_genetico.avaliar_populacao(populacao)
+    
+    with AvaliadorParalelo("data/coordenadas.csv", workers=2) as avaliador:
+        algoritmo_genetico.avaliador_paralelo = avaliador
+        fitness_paralelo = algoritmo_genetico.avaliar_populacao(populacao)
+        algoritmo_genetico.avaliador_paralelo = None
+    
+    print(f"  Melhor fitness sequencial: {min(fitness_sequencial):.0f}")
+    print(f"  Melhor fitness paralelo: {min(fitness_paralelo):.0f}")
+    
+    assert fitness_paralelo == fitness_sequencial
+    print("  ✓ Teste passou: resultados idênticos com 1 e 2 workers")
+
+def test_modelo_ilhas_topologias(algoritmo_genetico):
+    """Testa destinos de migração nas topologias anel e aleatória"""
+    print("\n[TEST] Testando topologias de migração do modelo de ilhas")
+    config = {'islands': 4, 'migration_interval': 2, 'migrants': 1, 'topology': 'ring'}
+    anel = ModeloIlhas(algoritmo_genetico, config)._destinos_migracao()
+    aleatoria = ModeloIlhas(algoritmo_genetico, {**config, 'topology': 'random'})._destinos_migracao()
+    print(f"  Anel: {anel}")
+    print(f"  Aleatória: {aleatoria}")
+    
+    assert anel == [1, 2, 3, 0]
+    assert all(destino != origem for origem, destino in enumerate(aleatoria))
+    with pytest.raises(ValueError):
+        ModeloIlhas(algoritmo_genetico, {**config, 'topology': 'estrela'})
+    print("  ✓ Teste passou: nenhuma ilha migra para si mesma")
+
+def test_modelo_ilhas_executa(algoritmo_genetico):
+    """Testa execução curta do modelo de ilhas com migração"""
+    print("\n[TEST] Testando execução do algoritmo em modo ilhas")
+    algoritmo_genetico.population_size = 20
+    algoritmo_genetico.generations = 4
+    config = {'islands': 2, 'migration_interval': 2, 'migrants': 2, 'topology': 'ring'}
+    
+    random.seed(3)
+    rota_ids, velocidades, tempos_pouso, fitness = ModeloIlhas(algoritmo_genetico, config).executar()
+    print(f"  Fitness: {fitness:.0f}")
+    
+    assert fitness < float('inf')
+    assert rota_ids[0] == rota_ids[-1] == algoritmo_genetico.unibrasil_id
+    assert len(set(rota_ids[1:-1])) == len(algoritmo_genetico.ids_ceps)
+    assert len(velocidades) == len(tempos_pouso) == len(rota_ids) - 1
+    print("  ✓ Teste passou: rota completa gerada pelas ilhas")
+
+def test_modelo_ilhas_cancelado_entre_epocas(algoritmo_genetico):
+    """Testa que o cancelamento interrompe o modelo de ilhas na próxima migração"""
+    print("\n[TEST] Testando cancelamento no modo ilhas")
+    algoritmo_genetico.population_size = 20
+    algoritmo_genetico.generations = 1000
+    algoritmo_genetico.ilhas = 2
+    
+    random.seed(3)
+    solucoes = []
+    for solucao in algoritmo_genetico.executar_iterativo():
+        solucoes.append(solucao)
+        algoritmo_genetico.cancelar()
+    
+    print(f"  Soluções emitidas: {[round(solucao[3]) for solucao in solucoes]}")
+    assert algoritmo_genetico.motivo_parada == 'cancelado'
+    assert len(solucoes) <= 3
+    assert solucoes[-1][3] <= solucoes[0][3]
+    assert sorted(solucoes[-1][0][1:-1]) == sorted(algoritmo_genetico.ids_ceps)
+    print("  ✓ Teste passou: ilhas encerradas após a época corrente")
+
+def test_ilha_emigra_os_melhores_individuos(algoritmo_genetico):
+    """Testa que os emigrantes são os melhores da população avaliada mesmo com menos elites que migrantes"""
+    print("\n[TEST] Testando escolha dos emigrantes de uma ilha")
+    parametros = {'population_size': 12, 'mutation_rate': 0.1, 'crossover_rate': 0.8, 'elite_size': 1,
+                  'tournament_size': 3, 'apenas_permutacoes': False, 'migrants': 3}
+    conexao_principal, conexao_ilha = multiprocessing.Pipe()
+    conexao_principal.send(('evoluir', 0, 1, []))
+    conexao_principal.send(('encerrar',))
+    _processo_ilha(conexao_ilha, "data/coordenadas.csv", parametros, 11)
+    emigrantes, _, melhor_fitness = conexao_principal.recv()
+    
+    random.seed(11)
+    referencia = AlgoritmoGenetico(algoritmo_genetico.gerenciador_dados, algoritmo_genetico.validador,
+                                   algoritmo_genetico.calculador_custo, workers=1)
+    for nome, valor in parametros.items():
+        setattr(referencia, nome, valor)
+    fitness_populacao = sorted(referencia.avaliar_populacao(referencia._inicializar_populacao()))
+    fitness_emigrantes = algoritmo_genetico.avaliar_populacao(emigrantes)
+    print(f"  Fitness dos emigrantes: {[round(fitness) for fitness in fitness_emigrantes]}")
+    
+    assert fitness_emigrantes == fitness_populacao[:3]
+    assert fitness_emigrantes[0] == melhor_fitness
+    print("  ✓ Teste passou: emigrantes são os três melhores indivíduos")
+
+def test_modelo_ilhas_rejeita_callback_e_telemetria(algoritmo_genetico):
+    """Testa que o modo ilhas não ignora silenciosamente callback e instrumentação"""
+    print("\n[TEST] Testando configurações incompatíveis com o modo ilhas")
+    algoritmo_genetico.ilhas = 2
+    algoritmo_genetico.callback_geracao = lambda estatisticas: None
+    with pytest.raises(ValueError):
+        algoritmo_genetico.executar_iterativo()
+    
+    algoritmo_genetico.callback_geracao = None
+    algoritmo_genetico.instrumentacao.ativa = True
+    with pytest.raises(ValueError):
+        algoritmo_genetico.executar_iterativo()
+    print("  ✓ Teste passou: configurações incompatíveis rejeitadas")
+
+@pytest.mark.parametrize("nome_operador", sorted(OPERADORES_CROSSOVER))
+def test_operadores_crossover_preservam_permutacao(algoritmo_genetico, nome_operador):
+    """Testa que cada operador registrado gera rotas válidas sem reparo"""
+    print(f"\n[TEST] Testando operador de crossover '{nome_operador}'")
+    random.seed(13)
+    operador = OPERADORES_CROSSOVER[nome_operador]
+    pai1 = algoritmo_genetico.criar_individuo()
+    pai2 = algoritmo_genetico.criar_individuo()
+    pai2 = (algoritmo_genetico.busca_local.otimizar(pai2[0]), pai2[1], pai2[2])
+    
+    for _ in range(10):
+        rota_filho = operador(algoritmo_genetico, pai1[0], pai2[0])
+        velocidades, tempos_pouso = herdar_genes(rota_filho, pai1, pai2)
+        eh_valida, mensagem = algoritmo_genetico.validador.validar_solucao_ids(rota_filho, velocidades, tempos_pouso)
+        assert eh_valida, mensagem
+    print("  ✓ Teste passou: filhos são permutações válidas")
+
+def test_herdar_genes_acompanha_trechos(algoritmo_genetico):
+    """Testa que velocidade e pouso acompanham o trecho herdado de cada pai"""
+    print("\n[TEST] Testando herança de genes de velocidade e pouso por trecho")
+    random.seed(17)
+    pai1 = algoritmo_genetico.criar_individuo()
+    pai2 = algoritmo_genetico.criar_individuo()
+    rota_filho = OPERADORES_CROSSOVER['ox'](algoritmo_genetico, pai1[0], pai2[0])
+    velocidades, tempos_pouso = herdar_genes(rota_filho, pai1, pai2)
+    
+    trechos_pai1 = {(u, v): i for i, (u, v) in enumerate(zip(pai1[0], pai1[0][1:]))}
+    trechos_pai2 = {(u, v): i for i, (u, v) in enumerate(zip(pai2[0], pai2[0][1:]))}
+    for i, trecho in enumerate(zip(rota_filho, rota_filho[1:])):
+        if trecho in trechos_pai1:
+            assert velocidades[i] == pai1[1][trechos_pai1[trecho]]
+            assert tempos_pouso[i] == pai1[2][trechos_pai1[trecho]]
+        elif trecho in trechos_pai2:
+            assert velocidades[i] == pai2[1][trechos_pai2[trecho]]
+            assert tempos_pouso[i] == pai2[2][trechos_pai2[trecho]]
+    print("  ✓ Teste passou: genes herdados junto com os trechos")
+
+def test_populacao_compacta_ida_e_volta(algoritmo_genetico):
+    """Testa codificação compacta da população e avaliação equivalente"""
+    print("\n[TEST] Testando população compacta")
+    random.seed(7)
+    individuos = [algoritmo_genetico.criar_individuo() for _ in range(10)]
+    populacao = Populacao.de_individuos(individuos, algoritmo_genetico.max_id)
+    
+    for i, individuo in enumerate(individuos):
+        assert populacao[i] == (list(individuo[0]), list(individuo[1]), list(individuo[2]))
+    
+    tracemalloc.start()
+    individuos_listas = [populacao[i] for i in range(len(populacao))]
+    bytes_listas, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  Memória compacta: {populacao.nbytes} bytes (listas: {bytes_listas} bytes)")
+    assert len(individuos_listas) == len(individuos)
+    assert populacao.nbytes * 10 < bytes_listas
+    
+    assert algoritmo_genetico.avaliar_populacao(populacao) == algoritmo_genetico.avaliar_populacao(individuos)
+    
+    assert Populacao.codificar_velocidades([37, 10, 120, 51]).tolist() == [0, 0, 15, 4]
+    print("  ✓ Teste passou: população compacta preserva indivíduos e fitness")
+
+def test_busca_local_elite_nao_piora_fitness(algoritmo_genetico):
+    """Testa que o 2-opt periódico só substitui a rota da elite quando o fitness real não piora"""
+    print("\n[TEST] Testando aceitação incremental da busca local da elite")
+    calculador = algoritmo_genetico.calculador_custo
+    aceitas = 0
+    for semente in range(5):
+        random.seed(semente)
+        individuo = algoritmo_genetico.criar_individuo()
+        populacao = Populacao.de_individuos([individuo], algoritmo_genetico.max_id)
+        
+        algoritmo_genetico._busca_local_elite(populacao, calculador.calcular_fitness_ids(*individuo))
+        rota_ids, velocidades, tempos_pouso = populacao[0]
+        
+        assert (velocidades, tempos_pouso) == (list(individuo[1]), list(individuo[2]))
+        assert calculador.calcular_fitness_ids(rota_ids, velocidades, tempos_pouso) <= \
+            calculador.calcular_fitness_ids(*individuo)
+        if rota_ids != list(individuo[0]):
+            aceitas += 1
+            _, checkpoints = calculador.simular_com_checkpoints(rota_ids, velocidades, tempos_pouso)
+            assert algoritmo_genetico._checkpoints_individuo(rota_ids, velocidades, tempos_pouso, 1) == checkpoints
+    print(f"  Rotas substituídas: {aceitas}/5")
+    
+    assert aceitas > 0
+    print("  ✓ Teste passou: elite nunca piora com a busca local periódica")
+
+def test_instrumentacao_fases_e_callback(algoritmo_genetico):
+    """Testa temporizadores por fase e callback por geração com estatísticas de fitness"""
+    print("\n[TEST] Testando instrumentação do laço do algoritmo genético")
+    algoritmo_genetico.population_size = 20
+    algoritmo_genetico.generations = 4
+    algoritmo_genetico.instrumentacao.ativa = True
+    geracoes = []
+    algoritmo_genetico.callback_geracao = geracoes.append
+    
+    random.seed(5)
+    algoritmo_genetico.executar()
+    resumo = algoritmo_genetico.instrumentacao.resumo()
+    print(f"  Fases medidas: {list(resumo)}")
+    
+    assert [estatisticas['geracao'] for estatisticas in geracoes] == [0, 1, 2, 3]
+    for estatisticas in geracoes:
+        assert estatisticas['melhor'] <= estatisticas['media'] <= estatisticas['pior']
+        assert 0 < estatisticas['diversidade'] <= 1
+        assert estatisticas['tempos']['avaliacao'] > 0
+    assert resumo['avaliacao']['chamadas'] == 4
+    assert resumo['selecao']['chamadas'] > 0 and resumo['mutacao']['chamadas'] > 0
+    assert resumo['crossover.ox']['chamadas'] > 0
+    assert resumo['polimento']['chamadas'] == 1
+    
+    algoritmo_genetico.instrumentacao.ativa = False
+    algoritmo_genetico.executar()
+    assert algoritmo_genetico.instrumentacao.resumo() == {}
+    assert len(geracoes) == 8 and geracoes[-1]['tempos'] == {}
+    print("  ✓ Teste passou: fases medidas apenas com instrumentação ativa")
+
+def test_execucao_iterativa_cancelada_retorna_solucao_polida(algoritmo_genetico):
+    """Testa que a API iterativa emite melhorias e encerra com a solução polida ao cancelar"""
+    print("\n[TEST] Testando execução iterativa com cancelamento")
+    algoritmo_genetico.population_size = 20
+    algoritmo_genetico.generations = 50
+    
+    random.seed(11)
+    solucoes = []
+    for solucao in algoritmo_genetico.executar_iterativo():
+        solucoes.append(solucao)
+        if len(solucoes) == 2:
+            algoritmo_genetico.cancelar()
+    
+    rota, velocidades, tempos_pouso, fitness = solucoes[-1]
+    print(f"  Soluções emitidas: {[round(s[3]) for s in solucoes]}, motivo: {algoritmo_genetico.motivo_parada}")
+    assert algoritmo_genetico.motivo_parada == 'cancelado'
+    assert len(solucoes) == 3
+    assert solucoes[0][3] > solucoes[1][3]
+    assert algoritmo_genetico.melhor_solucao == solucoes[-1]
+    assert not algoritmo_genetico._tem_cruzamentos(rota)
+    custo, _ = algoritmo_genetico.calculador_custo.calcular_custo_rota_ids(rota, velocidades, tempos_pouso)
+    assert custo == fitness
+    print("  ✓ Teste passou: cancelamento encerra com melhor solução polida")
+
+def test_execucao_async_interrompida(algoritmo_genetico):
+    """Testa o iterador assíncrono e o polimento da melhor solução ao interromper o consumo"""
+    print("\n[TEST] Testando iterador assíncrono do algoritmo genético")
+    algoritmo_genetico.population_size = 20
+    algoritmo_genetico.generations = 1000
+    
+    async def consumir():
+        solucoes = algoritmo_genetico.executar_async()
+        primeira = await solucoes.__anext__()
+        await solucoes.aclose()
+        return primeira
+    
+    random.seed(11)
+    primeira = asyncio.run(consumir())
+    print(f"  Primeira: {primeira[3]:.0f}, final: {algoritmo_genetico.melhor_solucao[3]:.0f}")
+    assert algoritmo_genetico.motivo_parada == 'cancelado'
+    assert algoritmo_genetico.melhor_solucao[3] <= primeira[3]
+    assert len(algoritmo_genetico.melhor_solucao[0]) == len(primeira[0])
+    print("  ✓ Teste passou: consumo interrompido cancela e mantém solução polida")
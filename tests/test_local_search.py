@@ -0,0 +1,101 @@
+import random
+import pytest
+import numpy as np
+from src.algorithms.local_search import BuscaLocal
+from src.utils.data_manager import GerenciadorDados
+from src.utils.calculations import find_crossings
+
+@pytest.fixture
+def gerenciador():
+    """Fixture com os dados reais de CEPs"""
+    return GerenciadorDados("data/coordenadas.csv")
+
+def comprimento(gerenciador, rota_ids):
+    rota = np.asarray(rota_ids)
+    return gerenciador.matriz_distancias[rota[:-1], rota[1:]].sum()
+
+def test_busca_local_rota_fechada(gerenciador):
+    """Testa que a busca local melhora uma rota aleatória mantendo o depósito nas pontas"""
+    print("\n[TEST] Testando 2-opt/Or-opt com listas de vizinhos em rota fechada")
+    random.seed(1)
+    unibrasil_id = gerenciador.obter_id_unibrasil()
+    ids_ceps = gerenciador.obter_ids_excluindo_unibrasil()
+    random.shuffle(ids_ceps)
+    rota = [unibrasil_id] + ids_ceps + [unibrasil_id]
+    
+    busca = BuscaLocal(gerenciador.matriz_distancias, gerenciador.obter_vizinhos_proximos(8))
+    otimizada = busca.otimizar(rota)
+    print(f"  Comprimento inicial: {comprimento(gerenciador, rota):.1f} km")
+    print(f"  Comprimento otimizado: {comprimento(gerenciador, otimizada):.1f} km")
+    
+    assert otimizada[0] == otimizada[-1] == unibrasil_id
+    assert sorted(otimizada) == sorted(rota)
+    assert comprimento(gerenciador, otimizada) < comprimento(gerenciador, rota) * 0.2
+    print("  ✓ Teste passou: rota válida e muito mais curta")
+
+def test_busca_local_caminho_aberto(gerenciador):
+    """Testa que um caminho aberto mantém as extremidades fixas"""
+    print("\n[TEST] Testando busca local em caminho aberto")
+    random.seed(2)
+    ids_ceps = gerenciador.obter_ids_excluindo_unibrasil()[:60]
+    random.shuffle(ids_ceps)
+    
+    busca = BuscaLocal(gerenciador.matriz_distancias, gerenciador.obter_vizinhos_proximos(8))
+    otimizado = busca.otimizar(ids_ceps)
+    
+    assert otimizado[0] == ids_ceps[0]
+    assert otimizado[-1] == ids_ceps[-1]
+    assert sorted(otimizado) == sorted(ids_ceps)
+    assert comprimento(gerenciador, otimizado) < comprimento(gerenciador, ids_ceps)
+    print("  ✓ Teste passou: extremidades preservadas e caminho mais curto")
+
+def test_busca_local_limite_movimentos(gerenciador):
+    """Testa que o limite de movimentos é respeitado"""
+    print("\n[TEST] Testando limite de movimentos da busca local")
+    random.seed(3)
+    unibrasil_id = gerenciador.obter_id_unibrasil()
+    ids_ceps = gerenciador.obter_ids_excluindo_unibrasil()
+    random.shuffle(ids_ceps)
+    
+    busca = BuscaLocal(gerenciador.matriz_distancias, gerenciador.obter_vizinhos_proximos(8))
+    busca.otimizar([unibrasil_id] + ids_ceps + [unibrasil_id], max_movimentos=3)
+    print(f"  Movimentos aplicados: {busca.movimentos}")
+    
+    assert busca.movimentos == 3
+    print("  ✓ Teste passou: busca interrompida no limite")
+
+def test_busca_local_remove_cruzamentos(gerenciador):
+    """Testa que, com coordenadas, a busca local não deixa cruzamentos nas rotas"""
+    print("\n[TEST] Testando remoção de cruzamentos pela busca local")
+    unibrasil_id = gerenciador.obter_id_unibrasil()
+    busca = BuscaLocal(gerenciador.matriz_distancias, gerenciador.obter_vizinhos_proximos(8),
+                       gerenciador.coords_array)
+    
+    for semente in range(10):
+        random.seed(semente)
+        ids_ceps = gerenciador.obter_ids_excluindo_unibrasil()
+        random.shuffle(ids_ceps)
+        otimizada = busca.otimizar([unibrasil_id] + ids_ceps + [unibrasil_id])
+        
+        assert otimizada[0] == otimizada[-1] == unibrasil_id
+        assert len(find_crossings(gerenciador.coords_array[otimizada])) == 0
+    print("  ✓ Teste passou: 10 rotas aleatórias sem cruzamentos")
+
+def test_busca_local_linha_compacta_em_lugar(gerenciador):
+    """Testa que a otimização sobre a linha int16 da população equivale à versão com listas"""
+    print("\n[TEST] Testando busca local diretamente na linha compacta")
+    random.seed(4)
+    unibrasil_id = gerenciador.obter_id_unibrasil()
+    ids_ceps = gerenciador.obter_ids_excluindo_unibrasil()
+    random.shuffle(ids_ceps)
+    rota = [unibrasil_id] + ids_ceps + [unibrasil_id]
+    linhas = np.array([rota, rota], dtype=np.int16)
+    
+    busca = BuscaLocal(gerenciador.matriz_distancias, gerenciador.obter_vizinhos_proximos(8))
+    esperada = busca.otimizar(rota, max_movimentos=50)
+    busca.otimizar_linha(linhas[0], max_movimentos=50)
+    
+    assert busca.movimentos == 50
+    assert linhas[0].tolist() == esperada
+    assert linhas[1].tolist() == rota
+    print("  ✓ Teste passou: linha alterada em lugar com o mesmo resultado")
@@ -0,0 +1,51 @@
+import itertools
+import random
+import numpy as np
+from src.algorithms.lower_bound import LimiteInferior, arvore_1, calcular_gap, limite_held_karp
+from src.algorithms.stopping import CriterioParada, MOTIVO_GAP
+from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.utils.data_manager import GerenciadorDados
+from src.core.validator import ValidadorSolucao
+from src.core.cost_calculator import CalculadorCusto
+
+def test_held_karp_limita_tour_otimo():
+    """Testa que o limite Held-Karp nunca supera o tour ótimo obtido por força bruta"""
+    print("\n[TEST] Testando limite Held-Karp contra força bruta")
+    rng = np.random.default_rng(4)
+    for _ in range(5):
+        pontos = rng.random((8, 2))
+        distancias = np.hypot(*(pontos[:, None] - pontos[None]).transpose(2, 0, 1))
+        otimo = min(sum(distancias[a, b] for a, b in zip((0,) + perm, perm + (0,)))
+                    for perm in itertools.permutations(range(1, 8)))
+        custo_arvore, graus = arvore_1(distancias, np.zeros(8))
+        limite = limite_held_karp(distancias)
+        print(f"  Ótimo: {otimo:.4f}, 1-tree: {custo_arvore:.4f}, Held-Karp: {limite:.4f}")
+        assert graus.sum() == 16 and graus[0] == 2
+        assert custo_arvore <= limite <= otimo + 1e-9
+        assert limite >= 0.97 * otimo
+    print("  ✓ Teste passou: limite válido e próximo do ótimo")
+
+def test_gap_otimalidade_interrompe_algoritmo():
+    """Testa o limite inferior de fitness e a parada do algoritmo pelo gap de otimalidade"""
+    print("\n[TEST] Testando parada pelo gap de otimalidade")
+    criterio = CriterioParada({'optimality_gap': 0.1}, max_geracoes=100)
+    criterio.limite_inferior = 90.0
+    assert criterio.verificar(1, 120.0) is None
+    assert criterio.verificar(2, 100.0) == MOTIVO_GAP
+    assert calcular_gap(float('inf'), 90.0) == float('inf')
+    
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    algoritmo = AlgoritmoGenetico(gerenciador, ValidadorSolucao(gerenciador), CalculadorCusto(gerenciador))
+    algoritmo.config = {**algoritmo.config, 'optimality_gap': 0.5}
+    algoritmo.population_size = 10
+    algoritmo.elite_size = 2
+    
+    random.seed(3)
+    _, _, _, fitness = algoritmo.executar()
+    limite = algoritmo.limite_inferior.valor
+    print(f"  Limite inferior: {limite:.0f}, fitness: {fitness:.0f}, gap: {algoritmo.gap_otimalidade:.2%}")
+    assert algoritmo.motivo_parada == MOTIVO_GAP
+    assert 0 < limite <= fitness
+    assert algoritmo.gap_otimalidade == calcular_gap(fitness, limite) <= 0.5
+    assert LimiteInferior(gerenciador, {'max_points': 10}).calcular() is None
+    print("  ✓ Teste passou: algoritmo parou ao atingir o gap configurado")
@@ -0,0 +1,123 @@
+import random
+import pytest
+from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.utils.data_manager import GerenciadorDados
+from src.core.validator import ValidadorSolucao
+from src.core.cost_calculator import CalculadorCusto
+from src.core.speed_optimizer import OtimizadorVelocidades
+from src.algorithms.parallel_evaluator import AvaliadorParalelo
+from src.algorithms.population import Populacao
+
+@pytest.fixture
+def componentes():
+    """Fixture para criar gerenciador, calculador e algoritmo genético"""
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    validador = ValidadorSolucao(gerenciador)
+    calculador = CalculadorCusto(gerenciador)
+    algoritmo = AlgoritmoGenetico(gerenciador, validador, calculador)
+    return gerenciador, calculador, algoritmo
+
+def test_otimizador_reproduz_custo_do_simulador(componentes):
+    """Testa que o fitness da programação dinâmica coincide com o simulador"""
+    print("\n[TEST] Testando otimizador de velocidades e pousos")
+    gerenciador, calculador, algoritmo = componentes
+    random.seed(3)
+    rota_ids, velocidades, tempos_pouso = algoritmo.criar_individuo_vizinho_mais_proximo()
+    
+    otimizador = OtimizadorVelocidades(gerenciador, faixas_bateria=16)
+    velocidades_otimas, pousos_otimos, fitness_otimo = otimizador.otimizar(rota_ids)
+    
+    assert len(velocidades_otimas) == len(rota_ids) - 1
+    assert len(pousos_otimos) == len(rota_ids) - 1
+    assert all(36 <= v <= 96 and v % 4 == 0 for v in velocidades_otimas)
+    
+    custo_simulado, _ = calculador.calcular_custo_rota_ids(rota_ids, velocidades_otimas, pousos_otimos)
+    custo_sem_pousos, _ = calculador.calcular_custo_rota_ids(rota_ids, velocidades_otimas, 
+                                                           [False] * len(pousos_otimos))
+    custo_heuristico, _ = calculador.calcular_custo_rota_ids(rota_ids, velocidades, tempos_pouso)
+    
+    print(f"  Fitness heurístico: {custo_heuristico:.0f}")
+    print(f"  Fitness otimizado: {fitness_otimo:.0f}")
+    assert custo_simulado == fitness_otimo
+    assert custo_sem_pousos == fitness_otimo
+    assert fitness_otimo < custo_heuristico
+    print("  ✓ Teste passou: otimizador consistente com o simulador e melhor que a heurística")
+
+def test_otimizador_rota_curta(componentes):
+    """Testa otimização de rota com um único ponto visitado"""
+    print("\n[TEST] Testando otimizador em rota curta")
+    gerenciador, calculador, algoritmo = componentes
+    rota_ids = [algoritmo.unibrasil_id, algoritmo.ids_ceps[0], algoritmo.unibrasil_id]
+    
+    velocidades, pousos, fitness = OtimizadorVelocidades(gerenciador).otimizar(rota_ids)
+    
+    melhor_exaustivo = min(calculador.calcular_custo_rota_ids(rota_ids, [v1, v2], [False, False])[0]
+                           for v1 in range(36, 97, 4) for v2 in range(36, 97, 4))
+    print(f"  Velocidades: {velocidades}, fitness: {fitness:.0f}")
+    assert fitness == melhor_exaustivo
+    print("  ✓ Teste passou: resultado igual à busca exaustiva")
+
+def test_algoritmo_apenas_permutacoes(componentes):
+    """Testa avaliação da população com genes de velocidade otimizados"""
+    print("\n[TEST] Testando algoritmo evoluindo apenas permutações")
+    _, calculador, algoritmo = componentes
+    random.seed(5)
+    algoritmo.apenas_permutacoes = True
+    algoritmo.otimizador_velocidades.faixas_bateria = 8
+    populacao = [algoritmo.criar_individuo() for _ in range(3)]
+    
+    fitness = algoritmo.avaliar_populacao(populacao)
+    
+    for individuo, custo in zip(populacao, fitness):
+        custo_aleatorio, _ = calculador.calcular_custo_rota_ids(*individuo)
+        print(f"  Genes aleatórios: {custo_aleatorio:.0f} -> otimizados: {custo:.0f}")
+        assert custo <= custo_aleatorio
+    print("  ✓ Teste passou: fitness por permutação nunca pior que genes aleatórios")
+
+def test_permutacoes_otimizam_apenas_elites_no_pool(componentes):
+    """Testa que a programação dinâmica roda só nas elites e dá o mesmo resultado nos workers"""
+    print("\n[TEST] Testando otimização de velocidades das elites no pool de processos")
+    gerenciador, calculador, algoritmo = componentes
+    random.seed(8)
+    algoritmo.apenas_permutacoes = True
+    algoritmo.elite_size = 2
+    algoritmo.otimizador_velocidades.faixas_bateria = 8
+    individuos = [algoritmo.criar_individuo() for _ in range(6)]
+    fitness_genes = algoritmo._avaliar_genes(Populacao.de_individuos(individuos, algoritmo.max_id)).tolist()
+    
+    fitness = algoritmo.avaliar_populacao(Populacao.de_individuos(individuos, algoritmo.max_id))
+    alterados = [i for i in range(6) if fitness[i] < fitness_genes[i]]
+    print(f"  Indivíduos reotimizados: {alterados}")
+    assert sorted(alterados) == sorted(sorted(range(6), key=fitness_genes.__getitem__)[:2])
+    assert len(algoritmo.cache_velocidades) == 2
+    
+    algoritmo.cache_velocidades.limpar()
+    with AvaliadorParalelo("data/coordenadas.csv", workers=2, faixas_bateria=8) as avaliador:
+        algoritmo.avaliador_paralelo = avaliador
+        copia = Populacao.de_individuos(individuos, algoritmo.max_id)
+        assert algoritmo.avaliar_populacao(copia) == fitness
+        algoritmo.avaliador_paralelo = None
+    for i in alterados:
+        custo, _ = calculador.calcular_custo_rota_ids(*copia[i])
+        assert custo == fitness[i]
+    print("  ✓ Teste passou: elites reotimizadas com o mesmo resultado no pool")
+
+def test_busca_local_elite_apenas_permutacoes(componentes):
+    """Testa que o 2-opt periódico da elite só é aceito quando o fitness da programação dinâmica não piora"""
+    print("\n[TEST] Testando busca local da elite avaliada pela programação dinâmica")
+    _, calculador, algoritmo = componentes
+    random.seed(4)
+    algoritmo.apenas_permutacoes = True
+    algoritmo.otimizador_velocidades.faixas_bateria = 8
+    populacao = Populacao.de_individuos([algoritmo.criar_individuo()], algoritmo.max_id)
+    fitness_atual = algoritmo.avaliar_populacao(populacao)[0]
+    rota_original = populacao.rotas[0].tolist()
+    
+    algoritmo._busca_local_elite(populacao, fitness_atual)
+    custo, _ = calculador.calcular_custo_rota_ids(*populacao[0])
+    print(f"  Fitness: {fitness_atual:.0f} -> {custo:.0f}")
+    
+    assert populacao.rotas[0].tolist() != rota_original
+    assert custo <= fitness_atual
+    assert len(algoritmo.cache_velocidades) == 2
+    print("  ✓ Teste passou: rota e genes da elite substituídos pelo resultado da programação dinâmica")
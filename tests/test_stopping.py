@@ -0,0 +1,68 @@
+import random
+import pytest
+from src.algorithms.stopping import (
+    CriterioParada, MOTIVO_GERACOES, MOTIVO_ESTAGNACAO, MOTIVO_MELHORIA_MINIMA,
+    MOTIVO_FITNESS_ALVO, MOTIVO_TEMPO_LIMITE
+)
+from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.utils.data_manager import GerenciadorDados
+from src.core.validator import ValidadorSolucao
+from src.core.cost_calculator import CalculadorCusto
+
+def test_criterio_limite_de_geracoes():
+    """Testa parada ao atingir o número máximo de gerações"""
+    print("\n[TEST] Testando limite de gerações")
+    criterio = CriterioParada({}, max_geracoes=3)
+    motivos = [criterio.verificar(geracao, 100.0 - geracao) for geracao in range(1, 4)]
+    print(f"  Motivos: {motivos}")
+    assert motivos == [None, None, MOTIVO_GERACOES]
+    print("  ✓ Teste passou: parou exatamente na última geração")
+
+def test_criterio_estagnacao():
+    """Testa parada após N gerações sem melhoria"""
+    print("\n[TEST] Testando estagnação")
+    criterio = CriterioParada({'stagnation_generations': 3}, max_geracoes=100)
+    historico = [100.0, 90.0, 90.0, 90.0, 90.0]
+    motivos = [criterio.verificar(geracao, fitness) for geracao, fitness in enumerate(historico, start=1)]
+    print(f"  Motivos: {motivos}")
+    assert motivos == [None, None, None, None, MOTIVO_ESTAGNACAO]
+    print("  ✓ Teste passou: estagnação detectada após 3 gerações sem melhoria")
+
+def test_criterio_melhoria_minima():
+    """Testa parada quando a melhoria relativa na janela fica abaixo de epsilon"""
+    print("\n[TEST] Testando melhoria relativa mínima")
+    criterio = CriterioParada({'min_relative_improvement': 0.01, 'improvement_window': 2}, max_geracoes=100)
+    historico = [1000.0, 900.0, 800.0, 799.0, 798.0]
+    motivos = [criterio.verificar(geracao, fitness) for geracao, fitness in enumerate(historico, start=1)]
+    print(f"  Motivos: {motivos}")
+    assert motivos == [None, None, None, None, MOTIVO_MELHORIA_MINIMA]
+    print("  ✓ Teste passou: melhoria abaixo de 1% na janela interrompe a busca")
+
+def test_criterio_fitness_alvo_e_tempo():
+    """Testa parada por fitness alvo e por orçamento de tempo"""
+    print("\n[TEST] Testando fitness alvo e tempo limite")
+    criterio = CriterioParada({'target_fitness': 50.0}, max_geracoes=100)
+    assert criterio.verificar(1, 60.0) is None
+    assert criterio.verificar(2, 50.0) == MOTIVO_FITNESS_ALVO
+    
+    criterio = CriterioParada({'time_budget': 0.0}, max_geracoes=100)
+    assert criterio.verificar(1, 60.0) == MOTIVO_TEMPO_LIMITE
+    print("  ✓ Teste passou: fitness alvo e tempo limite respeitados")
+
+def test_algoritmo_para_cedo_com_fitness_alvo():
+    """Testa que o algoritmo genético retorna o melhor indivíduo ao parar cedo"""
+    print("\n[TEST] Testando parada antecipada do algoritmo genético")
+    random.seed(11)
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    algoritmo = AlgoritmoGenetico(gerenciador, ValidadorSolucao(gerenciador), CalculadorCusto(gerenciador))
+    algoritmo.config = {**algoritmo.config, 'target_fitness': float('inf')}
+    algoritmo.population_size = 10
+    algoritmo.elite_size = 2
+    
+    rota_ids, velocidades, tempos_pouso, fitness = algoritmo.executar()
+    
+    print(f"  Motivo: {algoritmo.motivo_parada}, fitness: {fitness:.0f}")
+    assert algoritmo.motivo_parada == MOTIVO_FITNESS_ALVO
+    assert sorted(rota_ids[1:-1]) == sorted(algoritmo.ids_ceps)
+    assert fitness < float('inf')
+    print("  ✓ Teste passou: algoritmo parou na primeira geração com solução válida")
@@ -0,0 +1,105 @@
+import json
+import random
+import threading
+import pytest
+from src.algorithms import telemetry
+from src.algorithms.genetic_algorithm import AlgoritmoGenetico
+from src.algorithms.telemetry import (EscritorAssincrono, ExportadorPrometheus, EscritorJSONL, criar_escritores,
+                                      formatar_prometheus, pico_rss_bytes)
+from src.utils.data_manager import GerenciadorDados
+from src.core.validator import ValidadorSolucao
+from src.core.cost_calculator import CalculadorCusto
+
+def test_escritores_acumulam_e_descarregam_ao_fechar(tmp_path):
+    """Testa que os escritores só gravam na thread de flush e descarregam tudo ao fechar"""
+    print("\n[TEST] Testando escritores assíncronos de telemetria")
+    caminho_jsonl = tmp_path / "telemetria" / "execucao.jsonl"
+    caminho_metricas = tmp_path / "metricas.prom"
+    with EscritorJSONL(str(caminho_jsonl), intervalo_flush=60) as jsonl, \
+            ExportadorPrometheus(str(caminho_metricas), intervalo_flush=60) as metricas:
+        for geracao in range(3):
+            registro = {'generation': geracao, 'best_fitness': float('inf') if geracao == 0 else 100.0 - geracao}
+            jsonl.registrar(registro)
+            metricas.registrar(registro)
+        assert caminho_jsonl.read_text() == ""
+        assert not caminho_metricas.exists()
+    
+    linhas = [json.loads(linha) for linha in caminho_jsonl.read_text().splitlines()]
+    print(f"  Linhas JSONL: {linhas}")
+    assert [linha['generation'] for linha in linhas] == [0, 1, 2]
+    assert linhas[0]['best_fitness'] is None
+    texto = caminho_metricas.read_text()
+    assert "drone_route_generation 2\n" in texto
+    assert "drone_route_best_fitness 98.0\n" in texto
+    assert "# TYPE drone_route_best_fitness gauge" in texto
+    assert "drone_route_best_fitness +Inf" in formatar_prometheus({'best_fitness': float('inf')})
+    print("  ✓ Teste passou: registros gravados apenas no flush")
+
+def test_telemetria_por_geracao_no_algoritmo(tmp_path):
+    """Testa o fluxo de telemetria e o arquivo de métricas gerados pelo algoritmo genético"""
+    print("\n[TEST] Testando telemetria por geração no algoritmo genético")
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    algoritmo = AlgoritmoGenetico(gerenciador, ValidadorSolucao(gerenciador), CalculadorCusto(gerenciador))
+    algoritmo.population_size = 20
+    algoritmo.generations = 4
+    algoritmo.telemetry_jsonl = str(tmp_path / "telemetria.jsonl")
+    algoritmo.metrics_textfile = str(tmp_path / "metricas.prom")
+    
+    random.seed(9)
+    algoritmo.executar()
+    registros = [json.loads(linha) for linha in open(algoritmo.telemetry_jsonl, encoding="utf-8")]
+    print(f"  Último registro: {registros[-1]}")
+    
+    assert [registro['generation'] for registro in registros] == [0, 1, 2, 3]
+    melhores = [registro['best_fitness'] for registro in registros]
+    assert melhores == sorted(melhores, reverse=True)
+    for registro in registros:
+        assert registro['mean_fitness'] >= registro['best_fitness']
+        assert 0 <= registro['cache_hit_rate'] <= 1
+        assert registro['evaluations_per_second'] > 0
+        assert registro['elapsed_seconds'] > 0
+    assert registros[-1]['two_opt_moves'] > 0
+    if pico_rss_bytes() is not None:
+        assert registros[-1]['peak_rss_bytes'] > 0
+    texto = open(algoritmo.metrics_textfile, encoding="utf-8").read()
+    assert "drone_route_generation 3\n" in texto
+    assert algoritmo.escritores_telemetria == []
+    print("  ✓ Teste passou: telemetria gravada para cada geração")
+
+def test_falha_ao_criar_escritor_fecha_os_anteriores(tmp_path):
+    """Testa que nenhuma thread de flush fica ativa quando a criação de um escritor falha"""
+    print("\n[TEST] Testando falha na criação dos escritores de telemetria")
+    threads_iniciais = threading.active_count()
+    arquivo = tmp_path / "arquivo"
+    arquivo.write_text("")
+    with pytest.raises(OSError):
+        criar_escritores(str(tmp_path / "telemetria.jsonl"), str(arquivo / "metricas.prom"))
+    with pytest.raises(OSError):
+        EscritorJSONL(str(tmp_path))
+    with pytest.raises(TypeError):
+        EscritorAssincrono(str(tmp_path / "base"))
+    print(f"  Threads ativas: {threading.active_count()}")
+    assert threading.active_count() == threads_iniciais
+    print("  ✓ Teste passou: escritores já iniciados foram encerrados")
+
+def test_falha_ao_iniciar_thread_fecha_arquivo_jsonl(tmp_path, monkeypatch):
+    """Testa que o arquivo JSONL é fechado quando a thread de flush não pode ser iniciada"""
+    print("\n[TEST] Testando falha ao iniciar a thread do escritor JSONL")
+    abertos = []
+    abrir = open
+    
+    def abrir_registrando(*args, **kwargs):
+        arquivo = abrir(*args, **kwargs)
+        abertos.append(arquivo)
+        return arquivo
+    
+    def falhar(self):
+        raise RuntimeError("can't start new thread")
+    
+    monkeypatch.setattr(telemetry, "open", abrir_registrando, raising=False)
+    monkeypatch.setattr(threading.Thread, "start", falhar)
+    with pytest.raises(RuntimeError):
+        EscritorJSONL(str(tmp_path / "telemetria.jsonl"))
+    
+    assert len(abertos) == 1 and abertos[0].closed
+    print("  ✓ Teste passou: arquivo fechado após a falha")
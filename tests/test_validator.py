@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from src.core.validator import ValidadorSolucao
 from src.utils.data_manager import GerenciadorDados
 
@@ -71,3 +72,28 @@ def test_validador_rota_invalida_sem_unibrasil():
     assert not eh_valida
     print("  ✓ Teste passou: rota inválida detectada corretamente")
 
+
+def test_validador_populacao_ids():
+    """Testa validação vetorizada de uma população"""
+    print("\n[TEST] Testando validação em lote da população")
+    gerenciador = GerenciadorDados("data/coordenadas.csv")
+    validador = ValidadorSolucao(gerenciador)
+    
+    unibrasil_id = gerenciador.obter_id_unibrasil()
+    ids_ceps = gerenciador.obter_ids_excluindo_unibrasil()[:5]
+    
+    rotas_ids = np.array([
+        [unibrasil_id] + ids_ceps + [unibrasil_id],
+        [unibrasil_id] + ids_ceps[:4] + [ids_ceps[0]] + [unibrasil_id],
+        ids_ceps[:1] + ids_ceps + [unibrasil_id],
+    ])
+    velocidades = np.full((3, rotas_ids.shape[1] - 1), 60)
+    tempos_pouso = np.zeros((3, rotas_ids.shape[1] - 1), dtype=bool)
+    
+    validos = validador.validar_populacao_ids(rotas_ids, velocidades, tempos_pouso)
+    print(f"  Resultado: {validos}")
+    
+    esperado = [validador.validar_solucao_ids(list(r), list(v), list(p))[0]
+                for r, v, p in zip(rotas_ids, velocidades, tempos_pouso)]
+    assert validos.tolist() == esperado == [True, False, False]
+    print("  ✓ Teste passou: validação em lote igual à individual")